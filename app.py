@@ -1,5 +1,6 @@
 import os
 import logging
+import click
 from flask import Flask, redirect, request
 from werkzeug.middleware.proxy_fix import ProxyFix
 from datetime import datetime
@@ -11,6 +12,10 @@ load_dotenv()
 # Create the app
 app = Flask(__name__)
 
+# JSON 응답 직렬화 (orjson이 있으면 사용)
+from utils.json_provider import FastJSONProvider
+app.json = FastJSONProvider(app)
+
 # 환경 설정
 app.secret_key = os.environ.get("SECRET_KEY", "dev-secret-key-for-rd-center")
 app.wsgi_app = ProxyFix(app.wsgi_app, x_proto=1, x_host=1)
@@ -33,8 +38,12 @@ def add_security_headers(response):
     response.headers['Referrer-Policy'] = 'strict-origin-when-cross-origin'
     
     # Cache control for static assets
-    if request.path.startswith('/static/'):
-        response.headers['Cache-Control'] = 'public, max-age=31536000'  # 1 year for static assets
+    if request.path.startswith('/static/dist/'):
+        # 내용 해시가 들어간 빌드 결과물은 내용이 바뀌면 URL이 바뀌므로 영구 캐시
+        response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    elif request.path.startswith('/static/'):
+        # 해시 없는 원본 경로는 매번 재검증 (ETag/Last-Modified로 304)
+        response.headers['Cache-Control'] = 'no-cache'
     else:
         response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
         response.headers['Pragma'] = 'no-cache'
@@ -71,19 +80,157 @@ else:
 
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
 
+# 주간 일정용 주차(Week) 캘린더 사전 생성 범위
+app.config["WEEK_CALENDAR_START_YEAR"] = int(os.environ.get("WEEK_CALENDAR_START_YEAR", datetime.now().year - 5))
+app.config["WEEK_CALENDAR_END_YEAR"] = int(os.environ.get("WEEK_CALENDAR_END_YEAR", datetime.now().year + 5))
+
+# 게시글 조회수를 모아서 DB에 반영하는 주기 (초)
+app.config["VIEW_COUNTER_FLUSH_INTERVAL"] = float(os.environ.get("VIEW_COUNTER_FLUSH_INTERVAL", 5))
+
+# 업로드 파일 저장소 (FILE_STORE_ACCEL_PREFIX: nginx internal location, USE_X_SENDFILE: Apache/lighttpd)
+app.config["FILE_STORE_ROOT"] = os.environ.get("FILE_STORE_ROOT", os.path.join(app.root_path, "uploads"))
+app.config["FILE_STORE_ACCEL_PREFIX"] = os.environ.get("FILE_STORE_ACCEL_PREFIX", "")
+app.config["USE_X_SENDFILE"] = os.environ.get("USE_X_SENDFILE", "false").lower() == "true"
+app.config["ACCIDENT_DOCUMENT_MAX_SIZE"] = int(os.environ.get("ACCIDENT_DOCUMENT_MAX_SIZE", 500 * 1024 * 1024))
+
+# 로컬 MSDS 파일 공개 경로. 운영에서는 nginx가 이 경로를 직접 제공하고(MSDS_FILES_SERVE=false),
+# 그렇지 않으면 Flask 앞단의 WSGI 정적 파일 처리기가 제공한다 (내용 해시 경로이므로 1년 캐시)
+app.config["MSDS_FILES_URL_PREFIX"] = os.environ.get("MSDS_FILES_URL_PREFIX", "/msds-files")
+app.config["MSDS_FILES_SERVE"] = os.environ.get("MSDS_FILES_SERVE", "true").lower() == "true"
+if app.config["MSDS_FILES_SERVE"]:
+    from werkzeug.middleware.shared_data import SharedDataMiddleware
+    app.wsgi_app = SharedDataMiddleware(
+        app.wsgi_app,
+        {app.config["MSDS_FILES_URL_PREFIX"]: os.path.join(app.config["FILE_STORE_ROOT"], "msds", "objects")},
+        cache_timeout=31536000
+    )
+
+# /static/ 요청은 Flask 앞단의 WSGI 처리기가 바로 응답 (라우팅, 요청 로그, after_request 생략).
+# 작은 파일은 메모리, 큰 파일은 sendfile로 보내고 빌드된 .br/.gz 압축본과 ETag를 사용
+app.config["STATIC_FILES_MIDDLEWARE"] = os.environ.get("STATIC_FILES_MIDDLEWARE", "true").lower() == "true"
+app.config["STATIC_FILES_MAX_MEMORY_SIZE"] = int(os.environ.get("STATIC_FILES_MAX_MEMORY_SIZE", 512 * 1024))
+if app.config["STATIC_FILES_MIDDLEWARE"]:
+    from utils.static_files import StaticFilesMiddleware
+    app.wsgi_app = StaticFilesMiddleware(
+        app.wsgi_app, app.static_url_path, app.static_folder,
+        max_memory_size=app.config["STATIC_FILES_MAX_MEMORY_SIZE"]
+    )
+
+# 화학물질 유효기간 임박 기준(일, chemicals.expiry_scan 작업이 미리 계산하는 기본 조회 기간)
+app.config["CHEMICAL_EXPIRY_WARNING_DAYS"] = int(os.environ.get("CHEMICAL_EXPIRY_WARNING_DAYS", 30))
+
+# 주기 작업 실행기: 임대 유지 시간(초), DB 폴링 주기(초), gunicorn 워커 안에서 실행할지 여부
+# (false면 tools/job_worker.py를 별도 프로세스로 실행)
+app.config["JOBS_LEASE_SECONDS"] = int(os.environ.get("JOBS_LEASE_SECONDS", 600))
+app.config["JOBS_POLL_INTERVAL"] = float(os.environ.get("JOBS_POLL_INTERVAL", 30))
+app.config["JOBS_RUN_IN_APP"] = os.environ.get("JOBS_RUN_IN_APP", "false").lower() == "true"
+
+# 템플릿 캐시: 컴파일된 템플릿을 저장해 워커끼리 공유할 디렉터리(빈 값이면 사용 안 함), 목록 조각 캐시 사용 여부
+app.config["JINJA_BYTECODE_CACHE_DIR"] = os.environ.get(
+    "JINJA_BYTECODE_CACHE_DIR", os.path.join(app.instance_path, "jinja_cache")
+)
+app.config["TEMPLATE_FRAGMENT_CACHE"] = os.environ.get("TEMPLATE_FRAGMENT_CACHE", "true").lower() == "true"
+
+# 배치 API(/api/batch) 한 요청의 최대 연산 수
+app.config["BATCH_MAX_OPERATIONS"] = int(os.environ.get("BATCH_MAX_OPERATIONS", 100))
+
+# 반복 예약: 미리 생성해 두는 기간(일, 이후는 주기 작업이 매일 연장)과 한 번에 전개하는 최대 발생 수
+app.config["RESERVATION_SERIES_HORIZON_DAYS"] = int(os.environ.get("RESERVATION_SERIES_HORIZON_DAYS", 120))
+app.config["RESERVATION_SERIES_MAX_OCCURRENCES"] = int(os.environ.get("RESERVATION_SERIES_MAX_OCCURRENCES", 366))
+
+# 변경 이벤트(SSE, /events/stream): 사용 여부, 워커 간 전달용 UNIX 소켓 디렉터리, 재전송용 보관 개수,
+# 연결별 대기 이벤트 수, keepalive 간격(초), 연결 최대 유지 시간(초), sync 워커에서 스트림 거부 여부
+app.config["EVENTS_ENABLED"] = os.environ.get("EVENTS_ENABLED", "true").lower() == "true"
+app.config["EVENTS_SOCKET_DIR"] = os.environ.get("EVENTS_SOCKET_DIR", os.path.join(app.instance_path, "events"))
+app.config["EVENTS_BUFFER_SIZE"] = int(os.environ.get("EVENTS_BUFFER_SIZE", 500))
+app.config["EVENTS_SUBSCRIBER_QUEUE_SIZE"] = int(os.environ.get("EVENTS_SUBSCRIBER_QUEUE_SIZE", 200))
+app.config["EVENTS_HEARTBEAT_SECONDS"] = float(os.environ.get("EVENTS_HEARTBEAT_SECONDS", 15))
+app.config["EVENTS_STREAM_MAX_SECONDS"] = float(os.environ.get("EVENTS_STREAM_MAX_SECONDS", 3600))
+app.config["EVENTS_REQUIRE_ASYNC_WORKER"] = os.environ.get("EVENTS_REQUIRE_ASYNC_WORKER", "true").lower() == "true"
+
 # Import database and models
-from database import db, Project, Researcher, Equipment, Reservation, UsageLog, Week, WeeklyScheduleNew, Patent, SafetyMaterial, Accident, AccidentDocument, SafetyProcedure, Contact, Communication, Chemical
+from database import db, ensure_columns, ensure_indexes, Project, Researcher, Equipment, Reservation, UsageLog, Week, WeeklyScheduleNew, Patent, SafetyMaterial, Accident, AccidentDocument, SafetyProcedure, Contact, Communication, Chemical
 
 db.init_app(app)
 
+from services.view_counter import view_counter
+view_counter.init_app(app)
+
+from services.job_service import job_runner
+job_runner.init_app(app)
+import services.maintenance_jobs  # noqa: E402,F401  주기 작업 등록
+
+from services.template_cache import template_cache
+template_cache.init_app(app)
+
+from services.change_events import change_events
+change_events.init_app(app)
+
+# 정적 자산 해시 URL (tools/build_assets.py가 만든 매니페스트)
+from utils.assets import assets
+assets.init_app(app)
+
 # Create tables
 with app.app_context():
     try:
         db.create_all()
+        ensure_columns()
+        ensure_indexes()
         app.logger.info("데이터베이스 테이블이 성공적으로 생성되었습니다.")
     except Exception as e:
         app.logger.error(f"데이터베이스 테이블 생성 중 오류: {str(e)}")
 
+    # 주차 캘린더 생성 및 워커 메모리 매핑 로드 (preload_app 시 fork 전에 1회 수행)
+    from services.week_service import WeekService
+    try:
+        created = WeekService.sync_calendar(
+            app.config["WEEK_CALENDAR_START_YEAR"],
+            app.config["WEEK_CALENDAR_END_YEAR"]
+        )
+        app.logger.info(f"주차 캘린더가 준비되었습니다. 신규 생성: {created}건")
+    except Exception as e:
+        db.session.rollback()
+        app.logger.error(f"주차 캘린더 생성 중 오류: {str(e)}")
+
+    # 기존 화학물질 행의 수량/단위와 CAS 키 보정
+    from services.chemical_service import ChemicalService
+    try:
+        filled = ChemicalService.backfill_quantities()
+        keyed = ChemicalService.backfill_cas_keys()
+        if filled or keyed:
+            app.logger.info(f"화학물질 보정: 수량 파싱 {filled}건, CAS 키 {keyed}건")
+    except Exception as e:
+        db.session.rollback()
+        app.logger.error(f"화학물질 수량/CAS 보정 중 오류: {str(e)}")
+
+    # 사고 월별 집계 테이블 최초 생성
+    from services.accident_stats_service import AccidentStatsService
+    try:
+        if AccidentStatsService.ensure_rollup():
+            app.logger.info("사고 월별 집계를 생성했습니다.")
+    except Exception as e:
+        db.session.rollback()
+        app.logger.error(f"사고 월별 집계 생성 중 오류: {str(e)}")
+
+    # 검토일이 지난 작업절차서 상태 갱신 (매일 tools/mark_overdue_procedures.py로도 실행)
+    from services.procedure_service import ProcedureService
+    try:
+        overdue = ProcedureService.mark_overdue()
+        if overdue:
+            app.logger.info(f"검토필요로 변경된 절차서: {overdue}건")
+    except Exception as e:
+        db.session.rollback()
+        app.logger.error(f"절차서 검토 상태 갱신 중 오류: {str(e)}")
+
+    # 등록된 주기 작업의 스케줄 행 생성
+    try:
+        created = job_runner.sync_jobs()
+        if created:
+            app.logger.info(f"주기 작업 스케줄을 등록했습니다: {created}건")
+    except Exception as e:
+        db.session.rollback()
+        app.logger.error(f"주기 작업 스케줄 등록 중 오류: {str(e)}")
+
 # Import and register blueprints
 from routes.dashboard import dashboard_bp
 from routes.research import research_bp
@@ -96,6 +243,8 @@ from routes.safety import safety_bp
 from routes.communication import communication_bp
 from routes.external import external_bp
 from routes.chemical import chemical_bp
+from routes.batch import batch_bp
+from routes.events import events_bp
 
 app.register_blueprint(dashboard_bp, url_prefix='/')
 app.register_blueprint(research_bp, url_prefix='/research')
@@ -108,6 +257,24 @@ app.register_blueprint(safety_bp, url_prefix='/safety')
 app.register_blueprint(communication_bp, url_prefix='/communication')
 app.register_blueprint(external_bp, url_prefix='/external')
 app.register_blueprint(chemical_bp, url_prefix='/chemical')
+app.register_blueprint(batch_bp, url_prefix='/api')
+app.register_blueprint(events_bp, url_prefix='/events')
+
+@app.cli.command('seed')
+@click.option('--scale', default=1.0, show_default=True, help='기본 행 수 대비 배율')
+@click.option('--count', 'counts', multiple=True, metavar='ITEM=N', help='항목별 행 수 지정')
+@click.option('--seed', default=42, show_default=True, help='난수 시드')
+@click.option('--base-date', type=click.DateTime(formats=['%Y-%m-%d']), help='기준일 (기본: 오늘)')
+@click.option('--years', default=3, show_default=True, help='과거 데이터 기간(년)')
+@click.option('--reset', is_flag=True, help='기존 데이터를 지우고 생성')
+def seed_command(scale, counts, seed, base_date, years, reset):
+    """합성 데이터 생성 (tools/seed.py와 동일)"""
+    overrides = {name: int(value) for name, _, value in (item.partition('=') for item in counts)}
+    from services.seed_service import seed_database
+    try:
+        seed_database(scale, overrides, seed, base_date.date() if base_date else None, years, reset, click.echo)
+    except (RuntimeError, ValueError) as e:
+        raise click.ClickException(str(e))
 
 if __name__ == '__main__':
     host = os.environ.get('HOST', '127.0.0.1')
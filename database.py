@@ -5,6 +5,30 @@ from datetime import datetime
 # Create database instance
 db = SQLAlchemy()
 
+
+def ensure_columns():
+    """기존 테이블에 모델에 새로 추가된 nullable 컬럼이 없으면 ALTER TABLE로 추가 (create_all은 기존 테이블을 변경하지 않음)"""
+    inspector = db.inspect(db.engine)
+    existing_tables = set(inspector.get_table_names())
+    with db.engine.begin() as conn:
+        for table in db.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing or not column.nullable or column.primary_key:
+                    continue
+                column_type = column.type.compile(dialect=db.engine.dialect)
+                conn.execute(db.text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+
+
+def ensure_indexes():
+    """기존 테이블에 모델에 선언된 인덱스가 없으면 생성 (create_all은 기존 테이블에 인덱스를 추가하지 않음)"""
+    for table in db.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=db.engine, checkfirst=True)
+
+
 # Define all models
 class Project(db.Model):
     __tablename__ = 'projects'
@@ -49,7 +73,8 @@ class Equipment(db.Model):
     
     id = db.Column(db.Integer, primary_key=True)
     equipment_id = db.Column(db.String(50), unique=True, nullable=False)
-    name = db.Column(db.String(200), nullable=False)
+    # 예약은 장비 이름으로 연결되므로 이름 조회/정렬이 잦다 (가용 장비 검색은 이름순으로 읽다가 limit에서 멈춤)
+    name = db.Column(db.String(200), nullable=False, index=True)
     category = db.Column(db.String(100))
     manufacturer = db.Column(db.String(200))
     model = db.Column(db.String(200))
@@ -90,8 +115,31 @@ class EquipmentInspection(db.Model):
     # 관계 설정
     equipment = db.relationship('Equipment', backref='inspections')
 
+class ReservationSeries(db.Model):
+    """반복 예약 규칙. 발생 건은 materialized_until까지 reservations에 미리 생성해 둔다"""
+    __tablename__ = 'reservation_series'
+
+    id = db.Column(db.Integer, primary_key=True)
+    equipment_name = db.Column(db.String(200), nullable=False)
+    reserver = db.Column(db.String(100), nullable=False)
+    purpose = db.Column(db.String(500))
+    notes = db.Column(db.Text)
+    rrule = db.Column(db.String(200), nullable=False)
+    dtstart = db.Column(db.Date, nullable=False)
+    duration_days = db.Column(db.Integer, default=0)  # 발생 건 하나의 종료일 - 시작일
+    start_time = db.Column(db.Time)
+    end_time = db.Column(db.Time)
+    materialized_until = db.Column(db.Date)  # 이 날짜까지의 발생 건은 생성 완료
+    active = db.Column(db.Boolean, default=True, index=True)
+    created_date = db.Column(db.DateTime, default=datetime.utcnow)
+
 class Reservation(db.Model):
     __tablename__ = 'reservations'
+    __table_args__ = (
+        # 장비별 기간 겹침 조회 (end_date >= 구간 시작 AND start_date <= 구간 끝).
+        # 과거 예약이 대부분이므로 end_date를 앞에 두어야 범위 스캔이 짧다
+        db.Index('ix_reservations_equipment_dates', 'equipment_name', 'end_date', 'start_date'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     equipment_name = db.Column(db.String(200), nullable=False)
@@ -104,6 +152,7 @@ class Reservation(db.Model):
     status = db.Column(db.String(50), default='예약')
     notes = db.Column(db.Text)
     created_date = db.Column(db.DateTime, default=datetime.utcnow)
+    series_id = db.Column(db.Integer, db.ForeignKey('reservation_series.id'), index=True)
 
 class UsageLog(db.Model):
     __tablename__ = 'usage_logs'
@@ -131,7 +180,10 @@ class ProjectType(db.Model):
 # Additional models from routes
 class Week(db.Model):
     __tablename__ = 'weeks'
-    
+    __table_args__ = (
+        db.UniqueConstraint('year', 'month', 'week_number', name='uq_weeks_year_month_week'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     month = db.Column(db.Integer, nullable=False)
     year = db.Column(db.Integer, nullable=False)
@@ -146,11 +198,11 @@ class WeeklyScheduleNew(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     project_name = db.Column(db.String(200), nullable=False)
     researcher_name = db.Column(db.String(100))
-    week_id = db.Column(db.Integer, db.ForeignKey('weeks.id'), nullable=False)
+    week_id = db.Column(db.Integer, db.ForeignKey('weeks.id'), nullable=False, index=True)
     title = db.Column(db.String(500), nullable=False)
     description = db.Column(db.Text)
-    start_week_id = db.Column(db.Integer, db.ForeignKey('weeks.id'), nullable=False)
-    end_week_id = db.Column(db.Integer, db.ForeignKey('weeks.id'), nullable=False)
+    start_week_id = db.Column(db.Integer, db.ForeignKey('weeks.id'), nullable=False, index=True)
+    end_week_id = db.Column(db.Integer, db.ForeignKey('weeks.id'), nullable=False, index=True)
     status = db.Column(db.String(50), default='계획')
     priority = db.Column(db.String(50), default='보통')
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -169,10 +221,10 @@ class Patent(db.Model):
     inventors = db.Column(db.String(200))
     application_number = db.Column(db.String(100))
     registration_number = db.Column(db.String(100))
-    application_date = db.Column(db.Date)
+    application_date = db.Column(db.Date, index=True)
     publication_date = db.Column(db.Date)
-    status = db.Column(db.String(50), default='출원')
-    patent_office = db.Column(db.String(100))
+    status = db.Column(db.String(50), default='출원', index=True)
+    patent_office = db.Column(db.String(100), index=True)
     main_inventor = db.Column(db.String(100))
     main_inventor_share = db.Column(db.Integer)
     co_inventors = db.Column(db.Text)
@@ -192,6 +244,24 @@ class Patent(db.Model):
     created_date = db.Column(db.DateTime, default=datetime.utcnow)
     updated_date = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # 정규화된 발명자 목록 (inventors/co_inventors 문자열은 화면 표시용으로 유지)
+    inventor_links = db.relationship('PatentInventor', backref='patent', cascade='all, delete-orphan',
+                                     order_by='PatentInventor.position')
+
+class PatentInventor(db.Model):
+    __tablename__ = 'patent_inventors'
+    __table_args__ = (
+        db.UniqueConstraint('patent_id', 'inventor_name', name='uq_patent_inventors_patent_name'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    patent_id = db.Column(db.Integer, db.ForeignKey('patents.id', ondelete='CASCADE'), nullable=False, index=True)
+    researcher_id = db.Column(db.Integer, db.ForeignKey('researchers.id', ondelete='SET NULL'), index=True)
+    inventor_name = db.Column(db.String(100), nullable=False, index=True)
+    role = db.Column(db.String(20), default='공동발명자')  # 대표발명자, 공동발명자
+    share = db.Column(db.Integer)  # 지분율 (%)
+    position = db.Column(db.Integer, default=0)
+
 
 
 class SafetyMaterial(db.Model):
@@ -209,7 +279,7 @@ class Accident(db.Model):
     
     id = db.Column(db.Integer, primary_key=True)
     accident_id = db.Column(db.String(50), unique=True, nullable=False)
-    date = db.Column(db.Date, nullable=False)
+    date = db.Column(db.Date, nullable=False, index=True)
     time = db.Column(db.Time)
     location = db.Column(db.String(200))
     description = db.Column(db.Text, nullable=False)
@@ -221,18 +291,45 @@ class Accident(db.Model):
     created_date = db.Column(db.DateTime, default=datetime.utcnow)
     updated_date = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    documents = db.relationship('AccidentDocument', backref='accident', cascade='all, delete-orphan',
+                                order_by='AccidentDocument.id')
+
 class AccidentDocument(db.Model):
     __tablename__ = 'accident_documents'
     
     id = db.Column(db.Integer, primary_key=True)
-    accident_id = db.Column(db.Integer, db.ForeignKey('accidents.id'), nullable=False)
+    accident_id = db.Column(db.Integer, db.ForeignKey('accidents.id'), nullable=False, index=True)
+    title = db.Column(db.String(200))
+    url = db.Column(db.String(500))
     document_type = db.Column(db.String(100))
     file_name = db.Column(db.String(200))
     file_path = db.Column(db.String(500))
+    # 업로드 파일 (파일 저장소의 SHA-256 키, 같은 내용은 하나의 파일을 공유)
+    content_hash = db.Column(db.String(64), index=True)
+    content_type = db.Column(db.String(100))
+    file_size = db.Column(db.BigInteger)
     uploaded_date = db.Column(db.DateTime, default=datetime.utcnow)
 
+class AccidentMonthlyStat(db.Model):
+    """월별/장소별/심각도별 사고 건수 집계 (사고 등록·수정·삭제 시 같은 트랜잭션에서 해당 월을 재계산)"""
+    __tablename__ = 'accident_monthly_stats'
+    __table_args__ = (
+        db.UniqueConstraint('year', 'month', 'location', 'severity', name='uq_accident_monthly_stats'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    year = db.Column(db.Integer, nullable=False)
+    month = db.Column(db.Integer, nullable=False)
+    location = db.Column(db.String(200), nullable=False, default='')
+    severity = db.Column(db.String(50), nullable=False, default='')
+    count = db.Column(db.Integer, nullable=False, default=0)
+
 class SafetyProcedure(db.Model):
     __tablename__ = 'safety_procedures'
+    __table_args__ = (
+        # 검토 예정/지연 조회 (status 조건 + review_date 범위)
+        db.Index('ix_safety_procedures_status_review', 'status', 'review_date'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
@@ -267,7 +364,10 @@ class Contact(db.Model):
 
 class Communication(db.Model):
     __tablename__ = 'communications'
-    
+    __table_args__ = (
+        db.Index('ix_communications_category_created', 'category', 'created_date'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     comm_id = db.Column(db.String(50), unique=True, nullable=False)
     category = db.Column(db.String(100), nullable=False)
@@ -289,6 +389,8 @@ class Chemical(db.Model):
     chem_id = db.Column(db.String(50), unique=True, nullable=False)
     chemical_name = db.Column(db.String(200), nullable=False)
     cas_number = db.Column(db.String(50))
+    # 검증된 CAS 번호의 정규화 표기 (예: 67-64-1), 체크 디지트가 맞지 않으면 NULL
+    cas_key = db.Column(db.String(12), index=True)
     manufacturer = db.Column(db.String(200))
     hazard_class = db.Column(db.String(100))
     storage_condition = db.Column(db.String(200))
@@ -297,8 +399,51 @@ class Chemical(db.Model):
     first_aid = db.Column(db.Text)
     disposal_method = db.Column(db.Text)
     msds_file_link = db.Column(db.String(500))
-    location = db.Column(db.String(200))
+    # 로컬 MSDS 파일 (파일 저장소의 SHA-256 키, 같은 PDF는 여러 화학물질이 공유)
+    msds_hash = db.Column(db.String(64), index=True)
+    msds_file_size = db.Column(db.BigInteger)
+    location = db.Column(db.String(200), index=True)
     quantity = db.Column(db.String(100))
-    expiry_date = db.Column(db.Date)
+    # quantity 문자열을 파싱한 수량 (부피는 L, 질량은 kg, 개수는 ea 기준으로 환산)
+    quantity_amount = db.Column(db.Float)
+    quantity_unit = db.Column(db.String(20))
+    expiry_date = db.Column(db.Date, index=True)
+    created_date = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_date = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow) 
+
+class TableVersion(db.Model):
+    """테이블별 데이터 버전 (집계 캐시 무효화용, 추적 대상 테이블에 쓰기가 커밋될 때마다 증가)"""
+    __tablename__ = 'table_versions'
+
+    table_name = db.Column(db.String(100), primary_key=True)
+    version = db.Column(db.BigInteger, nullable=False, default=0)
+
+class Job(db.Model):
+    """주기 작업 스케줄과 실행 임대(lease). 여러 워커/호스트 중 임대를 얻은 하나만 실행한다"""
+    __tablename__ = 'jobs'
+
+    name = db.Column(db.String(100), primary_key=True)
+    interval_seconds = db.Column(db.Integer, nullable=False)
+    enabled = db.Column(db.Boolean, nullable=False, default=True)
+    next_run_at = db.Column(db.DateTime, nullable=False, index=True)
+    lease_owner = db.Column(db.String(200))
+    lease_expires_at = db.Column(db.DateTime)
+    # 연속 실패 횟수 (성공하면 0으로 초기화, 재시도 간격 계산에 사용)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    run_count = db.Column(db.Integer, nullable=False, default=0)
+    last_started_at = db.Column(db.DateTime)
+    last_finished_at = db.Column(db.DateTime)
+    last_duration_ms = db.Column(db.Float)
+    last_status = db.Column(db.String(20))
+    last_error = db.Column(db.Text)
+
+class ChemicalInventorySnapshot(db.Model):
+    """주기 작업(chemicals.expiry_scan)이 계산한 화학물질 재고 집계. 모든 워커/호스트가 공유한다"""
+    __tablename__ = 'chemical_inventory_snapshots'
+
+    within_days = db.Column(db.Integer, primary_key=True)
+    scan_date = db.Column(db.Date, nullable=False)
+    # 계산 시작 시점의 chemicals 테이블 버전 (다르면 그 뒤에 변경된 것이므로 사용하지 않음)
+    chemicals_version = db.Column(db.BigInteger, nullable=False)
+    data = db.Column(db.Text, nullable=False)
     created_date = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_date = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow) 
\ No newline at end of file
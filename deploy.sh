@@ -50,7 +50,11 @@ except Exception as e:
 echo "데이터베이스 마이그레이션을 실행합니다..."
 python migrate_to_postgresql.py
 
-# 7. 애플리케이션 테스트
+# 7. 정적 자산 빌드 (내용 해시 파일명 + 매니페스트, 앱 시작 시 매니페스트를 읽음)
+echo "정적 자산을 빌드합니다..."
+python tools/build_assets.py
+
+# 8. 애플리케이션 테스트
 echo "애플리케이션을 테스트합니다..."
 python -c "
 from app import app
@@ -58,7 +62,7 @@ with app.app_context():
     print('애플리케이션 테스트 성공')
 "
 
-# 8. Gunicorn 서비스 파일 생성
+# 9. Gunicorn 서비스 파일 생성
 echo "Gunicorn 서비스 파일을 생성합니다..."
 sudo tee /etc/systemd/system/research-management.service > /dev/null <<EOF
 [Unit]
@@ -81,15 +85,37 @@ PrivateTmp=true
 WantedBy=multi-user.target
 EOF
 
-# 9. 서비스 등록 및 시작
+# 10. 변경 이벤트 스트림(SSE) 서비스 파일 생성 (gevent 워커, nginx가 /events/를 전달)
+echo "변경 이벤트 서비스 파일을 생성합니다..."
+sudo tee /etc/systemd/system/research-management-events.service > /dev/null <<EOF
+[Unit]
+Description=Research Management System - change event stream
+After=network.target research-management.service
+
+[Service]
+User=$USER
+Group=$USER
+WorkingDirectory=$(pwd)
+Environment=PATH=$(pwd)/venv/bin
+ExecStart=$(pwd)/venv/bin/gunicorn -c gunicorn_events.conf.py app:app
+ExecReload=/bin/kill -s HUP \$MAINPID
+KillMode=mixed
+TimeoutStopSec=10
+PrivateTmp=true
+
+[Install]
+WantedBy=multi-user.target
+EOF
+
+# 11. 서비스 등록 및 시작
 echo "서비스를 등록하고 시작합니다..."
 sudo systemctl daemon-reload
-sudo systemctl enable research-management
-sudo systemctl start research-management
+sudo systemctl enable research-management research-management-events
+sudo systemctl start research-management research-management-events
 
-# 10. 서비스 상태 확인
+# 12. 서비스 상태 확인
 echo "서비스 상태를 확인합니다..."
-sudo systemctl status research-management
+sudo systemctl status research-management research-management-events
 
 echo "=== 배포 완료 ==="
 echo "서비스 URL: http://$(hostname -I | awk '{print $1}'):8002"
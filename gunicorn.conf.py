@@ -45,4 +45,23 @@ daemon = False
 pidfile = '/tmp/gunicorn.pid'
 user = None
 group = None
-tmp_upload_dir = None 
\ No newline at end of file
+tmp_upload_dir = None 
+
+# preload_app: 마스터에서 템플릿을 미리 컴파일해 두면 재시작된 워커도 컴파일 없이 물려받음
+def when_ready(server):
+    from services.template_cache import template_cache
+    if template_cache.app is not None:
+        with template_cache.app.app_context():
+            loaded = template_cache.warm()
+        server.log.info(f"템플릿 {loaded}개를 미리 로드했습니다.")
+
+# 워커 종료(max_requests 재시작 포함) 시 메모리에 모아 둔 조회수를 DB에 반영
+def worker_exit(server, worker):
+    from services.view_counter import view_counter
+    view_counter.flush()
+
+# JOBS_RUN_IN_APP=true이면 각 워커에서 주기 작업 폴링 스레드 시작 (임대로 한 워커만 실행)
+def post_worker_init(worker):
+    from services.job_service import job_runner
+    if job_runner.app is not None and job_runner.app.config.get('JOBS_RUN_IN_APP'):
+        job_runner.start()
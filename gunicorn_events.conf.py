@@ -0,0 +1,58 @@
+"""
+Gunicorn 설정 파일 - 변경 이벤트 스트림(/events/) 전용
+
+SSE 연결은 응답을 계속 열어 두므로 sync 워커에서는 연결 하나가 워커 하나를 점유한다.
+이 서비스는 gevent 워커로 워커당 수천 개의 유휴 연결을 유지하고, nginx가 /events/만
+이쪽으로 보낸다. 이벤트는 EVENTS_SOCKET_DIR의 UNIX 소켓으로 전달되므로 gunicorn.conf.py의
+서비스와 같은 호스트, 같은 디렉터리를 사용해야 한다.
+"""
+import os
+
+# 서버 소켓 설정 (nginx 뒤에서만 사용)
+bind = f"{os.environ.get('EVENTS_HOST', '127.0.0.1')}:{os.environ.get('EVENTS_PORT', '8003')}"
+backlog = 2048
+
+# 워커 프로세스 설정: 워커당 동시 연결 수 = worker_connections
+workers = int(os.environ.get('EVENTS_WORKERS', 2))
+worker_class = os.environ.get('EVENTS_WORKER_CLASS', 'gevent')
+worker_connections = int(os.environ.get('EVENTS_WORKER_CONNECTIONS', 2000))
+timeout = 30
+# 스트림 종료 후 재접속은 브라우저가 새 연결로 하므로 keep-alive는 짧게
+keepalive = 2
+# 종료/재시작 시 열린 스트림을 기다리지 않는다 (브라우저가 다른 워커로 재접속)
+graceful_timeout = 5
+
+# 로깅 설정
+accesslog = os.environ.get('LOG_FILE', 'app.log').replace('.log', '_events_access.log')
+errorlog = os.environ.get('LOG_FILE', 'app.log').replace('.log', '_events_error.log')
+loglevel = os.environ.get('LOG_LEVEL', 'info').lower()
+access_log_format = '%(h)s %(l)s %(u)s %(t)s "%(r)s" %(s)s %(b)s "%(f)s" "%(a)s" %(D)s'
+
+# 프로세스 설정: gevent는 워커에서 몽키 패치한 뒤 앱을 불러와야 하므로 preload하지 않는다.
+# 연결 수가 많아 max_requests 재시작은 사용하지 않고, 연결은 EVENTS_STREAM_MAX_SECONDS마다 끊긴다.
+preload_app = False
+
+# 보안 설정
+limit_request_line = 4094
+limit_request_fields = 100
+limit_request_field_size = 8190
+
+# 환경 변수
+raw_env = [
+    f"FLASK_ENV={os.environ.get('FLASK_ENV', 'production')}",
+    f"DATABASE_URL={os.environ.get('DATABASE_URL', 'sqlite:///app.db')}",
+    f"SECRET_KEY={os.environ.get('SECRET_KEY', 'dev-secret-key')}",
+    f"LOG_LEVEL={os.environ.get('LOG_LEVEL', 'INFO')}",
+    f"LOG_FILE={os.environ.get('LOG_FILE', 'app.log')}",
+]
+
+# 기타 설정
+daemon = False
+pidfile = '/tmp/gunicorn_events.pid'
+user = None
+group = None
+
+# 워커 종료 시 수신 소켓 파일 정리 (남아 있어도 다음 발행 때 지워짐)
+def worker_exit(server, worker):
+    from services.change_events import change_events
+    change_events.close()
@@ -0,0 +1,40 @@
+"""
+배치 API 라우트
+
+여러 화면의 생성/수정/삭제 연산을 한 번의 요청과 하나의 트랜잭션으로 처리한다.
+연산 형식과 의미는 services/batch_service.py 참고.
+"""
+from flask import Blueprint, current_app, jsonify, request
+
+from services.batch_service import BatchService
+from utils.response_utils import json_success_response, json_error_response
+
+batch_bp = Blueprint('batch', __name__)
+
+@batch_bp.route('/batch', methods=['POST'])
+def api_batch():
+    """배치 연산 API
+
+    요청: {"operations": [{"entity": "schedule", "op": "update", "id": 3, "data": {"week": 2}}, ...],
+           "atomic": true}
+    응답: data.results에 연산 순서대로 {"success": true, "id": ...} 또는 {"success": false, "error": ...}
+    atomic이면 하나라도 실패할 때 전체를 롤백하고 data.failed_index로 실패한 연산을 알려준다.
+    """
+    payload = request.get_json(silent=True) or {}
+    if not isinstance(payload, dict):
+        return json_error_response('요청 형식이 올바르지 않습니다.')
+    operations = payload.get('operations')
+    error = BatchService.validate(operations, current_app.config.get('BATCH_MAX_OPERATIONS', 100))
+    if error:
+        return json_error_response(error)
+
+    result = BatchService.run(operations, atomic=payload.get('atomic', True) is not False)
+    if not result['success']:
+        return jsonify({
+            'success': False,
+            'error': result['error'],
+            'data': {'failed_index': result['failed_index'], 'results': result['results']}
+        }), result['status']
+    failed = sum(1 for item in result['results'] if not item['success'])
+    message = f"{len(operations)}개 연산을 처리했습니다." + (f" (실패 {failed}개)" if failed else '')
+    return json_success_response({'results': result['results']}, message)
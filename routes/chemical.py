@@ -1,11 +1,16 @@
-from flask import Blueprint, render_template, request, redirect, url_for, flash, abort
+from flask import Blueprint, render_template, request, redirect, url_for, flash, abort, jsonify, current_app
 from database import db, Chemical
+from services.chemical_service import ChemicalService
+from services.serializers import serialize_all
+from services.template_cache import lazy_rows
 from datetime import datetime
 import uuid
 import math
 
 chemical_bp = Blueprint('chemical', __name__)
 
+LOOKUP_MAX_ITEMS = 1000
+
 def safe_value(val):
     if val is None:
         return ''
@@ -23,26 +28,8 @@ def parse_date(date_str):
 
 @chemical_bp.route('/msds')
 def msds_list():
-    msds = Chemical.query.order_by(Chemical.created_date.desc()).all()
-    msds_list = []
-    for m in msds:
-        msds_list.append({
-            'id': m.chem_id,
-            'chemical_name': m.chemical_name,
-            'cas_number': m.cas_number,
-            'manufacturer': m.manufacturer,
-            'hazard_class': m.hazard_class,
-            'storage_condition': m.storage_condition,
-            'flash_point': m.flash_point,
-            'exposure_limit': m.exposure_limit,
-            'first_aid': m.first_aid,
-            'disposal_method': m.disposal_method,
-            'msds_file_link': m.msds_file_link,
-            'location': m.location,
-            'quantity': m.quantity,
-            'expiry_date': m.expiry_date.strftime('%Y-%m-%d') if m.expiry_date else '',
-            'created_date': m.created_date.strftime('%Y-%m-%d') if m.created_date else ''
-        })
+    # 목록 조각이 캐시되어 있으면 조회하지 않음
+    msds_list = lazy_rows(lambda: serialize_all(Chemical, Chemical.query.order_by(Chemical.created_date.desc())))
     return render_template('chemical/msds.html', msds_list=msds_list)
 
 @chemical_bp.route('/msds/add', methods=['POST'])
@@ -51,7 +38,6 @@ def add_msds():
         chem = Chemical(
             chem_id=str(uuid.uuid4()),
             chemical_name=request.form.get('chemical_name'),
-            cas_number=request.form.get('cas_number', ''),
             manufacturer=request.form.get('manufacturer'),
             hazard_class=request.form.get('hazard_class'),
             storage_condition=request.form.get('storage_condition'),
@@ -61,10 +47,11 @@ def add_msds():
             disposal_method=request.form.get('disposal_method', ''),
             msds_file_link=request.form.get('msds_file_link', ''),
             location=request.form.get('location', ''),
-            quantity=request.form.get('quantity', ''),
             expiry_date=parse_date(request.form.get('expiry_date')),
             created_date=datetime.now()
         )
+        ChemicalService.apply_quantity(chem, request.form.get('quantity', ''))
+        ChemicalService.apply_cas(chem, request.form.get('cas_number', ''))
         db.session.add(chem)
         db.session.commit()
         flash('화학물질 정보가 성공적으로 추가되었습니다.', 'success')
@@ -81,7 +68,7 @@ def update_msds(id):
             flash('수정할 데이터를 찾을 수 없습니다.', 'error')
             return redirect(url_for('chemical.msds_list'))
         chem.chemical_name = request.form.get('chemical_name')
-        chem.cas_number = request.form.get('cas_number')
+        ChemicalService.apply_cas(chem, request.form.get('cas_number'))
         chem.manufacturer = request.form.get('manufacturer')
         chem.hazard_class = request.form.get('hazard_class')
         chem.storage_condition = request.form.get('storage_condition')
@@ -91,7 +78,7 @@ def update_msds(id):
         chem.disposal_method = request.form.get('disposal_method')
         chem.msds_file_link = request.form.get('msds_file_link')
         chem.location = request.form.get('location')
-        chem.quantity = request.form.get('quantity')
+        ChemicalService.apply_quantity(chem, request.form.get('quantity'))
         chem.expiry_date = parse_date(request.form.get('expiry_date'))
         db.session.commit()
         flash('화학물질 정보가 성공적으로 수정되었습니다.', 'success')
@@ -106,9 +93,41 @@ def delete_msds(id):
         chem = Chemical.query.filter_by(chem_id=id).first()
         if not chem:
             return {'success': False, 'message': '삭제할 데이터를 찾을 수 없습니다.'}
+        msds_hash = chem.msds_hash
         db.session.delete(chem)
         db.session.commit()
+        ChemicalService.release_msds([msds_hash])
         return {'success': True}
     except Exception as e:
         db.session.rollback()
         return {'success': False, 'message': f'삭제 중 오류가 발생했습니다: {str(e)}'}
+
+@chemical_bp.route('/api/inventory')
+def api_inventory():
+    """유효기간 임박 목록과 보관 위치별 재고 합계 API (?within=일수)"""
+    within = request.args.get('within', current_app.config.get('CHEMICAL_EXPIRY_WARNING_DAYS', 30), type=int)
+    if within is None or not 0 <= within <= 3650:
+        return jsonify({'success': False, 'message': 'within은 0~3650 사이의 일수여야 합니다.'}), 400
+    try:
+        inventory, cached = ChemicalService.get_inventory(within)
+        return jsonify({'success': True, 'inventory': inventory, 'cached': cached})
+    except Exception as e:
+        return jsonify({'success': False, 'message': f'화학물질 재고를 불러오는 중 오류가 발생했습니다: {str(e)}'}), 500
+
+@chemical_bp.route('/api/lookup', methods=['GET', 'POST'])
+def api_lookup():
+    """CAS 번호 일괄 조회 API (POST {"cas_numbers": [...]} 또는 GET ?cas=67-64-1,64-17-5)"""
+    if request.method == 'POST':
+        data = request.get_json(silent=True) or {}
+        cas_numbers = data.get('cas_numbers')
+    else:
+        cas_numbers = [cas for cas in request.args.get('cas', '').split(',') if cas.strip()]
+    if not isinstance(cas_numbers, list) or not cas_numbers:
+        return jsonify({'success': False, 'message': '조회할 CAS 번호 목록이 필요합니다.'}), 400
+    if len(cas_numbers) > LOOKUP_MAX_ITEMS:
+        return jsonify({'success': False, 'message': f'한 번에 최대 {LOOKUP_MAX_ITEMS}개까지 조회할 수 있습니다.'}), 400
+    try:
+        result = ChemicalService.lookup_cas(str(cas).strip() for cas in cas_numbers)
+        return jsonify({'success': True, **result})
+    except Exception as e:
+        return jsonify({'success': False, 'message': f'CAS 번호 조회 중 오류가 발생했습니다: {str(e)}'}), 500
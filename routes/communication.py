@@ -1,5 +1,7 @@
 from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify
+from sqlalchemy import func
 from database import db, Communication
+from services.view_counter import view_counter
 from datetime import datetime
 
 communication_bp = Blueprint('communication', __name__)
@@ -30,27 +32,96 @@ def add_free_post():
         flash('게시글 등록 중 오류가 발생했습니다.', 'error')
     return redirect(url_for('communication.free_communication'))
 
-@communication_bp.route('/safety_qa')
-def safety_qa():
-    posts = Communication.query.filter_by(category='안전 Q&A').order_by(Communication.created_date.desc()).all()
-    posts_json = [
+SAFETY_QA_CATEGORY = '안전 Q&A'
+SAFETY_QA_PER_PAGE = 20
+SAFETY_QA_MAX_PER_PAGE = 100
+EXCERPT_LENGTH = 100
+
+def _safety_qa_summaries(page, per_page, question_type=None, status=None):
+    """안전 Q&A 목록 한 페이지 (본문/답변 전체는 읽지 않고 요약만 조회)"""
+    query = db.session.query(
+        Communication.id,
+        Communication.title,
+        Communication.author,
+        Communication.question_type,
+        Communication.urgency,
+        Communication.status,
+        Communication.views,
+        Communication.created_date,
+        func.substr(Communication.content, 1, EXCERPT_LENGTH + 1).label('excerpt'),
+        Communication.answer.isnot(None).label('has_answer')
+    ).filter(Communication.category == SAFETY_QA_CATEGORY)
+    if question_type:
+        query = query.filter(Communication.question_type == question_type)
+    if status:
+        query = query.filter(Communication.status == status)
+
+    total = query.order_by(None).count()
+    rows = query.order_by(Communication.created_date.desc(), Communication.id.desc()) \
+        .limit(per_page).offset((page - 1) * per_page).all()
+    posts = [
         {
-            'id': p.id,
-            'comm_id': p.comm_id,
-            'category': p.category,
-            'title': p.title,
-            'content': p.content,
-            'author': p.author,
-            'question_type': p.question_type,
-            'urgency': p.urgency,
-            'created_date': p.created_date.strftime('%Y-%m-%d %H:%M') if p.created_date else '',
-            'views': p.views,
-            'status': p.status,
-            'answer': p.answer  # answer 필드 추가
+            'id': r.id,
+            'title': r.title,
+            'author': r.author,
+            'question_type': r.question_type,
+            'urgency': r.urgency,
+            'status': r.status,
+            'views': (r.views or 0) + view_counter.pending(r.id),
+            'created_date': r.created_date.strftime('%Y-%m-%d %H:%M') if r.created_date else '',
+            'excerpt': r.excerpt[:EXCERPT_LENGTH] + '...' if r.excerpt and len(r.excerpt) > EXCERPT_LENGTH else (r.excerpt or ''),
+            'has_answer': bool(r.has_answer)
         }
-        for p in posts
+        for r in rows
     ]
-    return render_template('communication/safety_qa.html', posts=posts, posts_json=posts_json)
+    return {
+        'posts': posts,
+        'page': page,
+        'per_page': per_page,
+        'total': total,
+        'has_next': page * per_page < total
+    }
+
+@communication_bp.route('/safety_qa')
+def safety_qa():
+    first_page = _safety_qa_summaries(1, SAFETY_QA_PER_PAGE)
+    return render_template('communication/safety_qa.html', first_page=first_page)
+
+@communication_bp.route('/api/safety_qa')
+def api_safety_qa():
+    """안전 Q&A 목록 API (페이지 단위 요약)"""
+    page = max(request.args.get('page', 1, type=int), 1)
+    per_page = min(max(request.args.get('per_page', SAFETY_QA_PER_PAGE, type=int), 1), SAFETY_QA_MAX_PER_PAGE)
+    result = _safety_qa_summaries(
+        page, per_page,
+        question_type=request.args.get('question_type') or None,
+        status=request.args.get('status') or None
+    )
+    return jsonify({'success': True, **result})
+
+@communication_bp.route('/api/safety_qa/<int:post_id>')
+def api_safety_qa_detail(post_id):
+    """안전 Q&A 상세 API (본문/답변 전체, 조회수 1 증가)"""
+    post = Communication.query.filter_by(id=post_id, category=SAFETY_QA_CATEGORY).first()
+    if not post:
+        return jsonify({'success': False, 'message': '게시글을 찾을 수 없습니다.'}), 404
+    view_counter.increment(post.id)
+    return jsonify({
+        'success': True,
+        'post': {
+            'id': post.id,
+            'comm_id': post.comm_id,
+            'title': post.title,
+            'content': post.content,
+            'author': post.author,
+            'question_type': post.question_type,
+            'urgency': post.urgency,
+            'status': post.status,
+            'views': view_counter.current(post),
+            'created_date': post.created_date.strftime('%Y-%m-%d %H:%M') if post.created_date else '',
+            'answer': post.answer
+        }
+    })
 
 @communication_bp.route('/safety_qa/add', methods=['POST'])
 def add_safety_qa():
@@ -105,3 +176,12 @@ def edit_answer_safety_qa(post_id):
     except Exception as e:
         db.session.rollback()
         return jsonify({'success': False, 'message': str(e)}), 500
+
+@communication_bp.route('/api/posts/<int:post_id>/view', methods=['POST'])
+def api_record_view(post_id):
+    """게시글 조회수 증가 API (메모리에 모았다가 주기적으로 일괄 반영)"""
+    row = db.session.query(Communication.views).filter_by(id=post_id).first()
+    if row is None:
+        return jsonify({'success': False, 'message': '게시글을 찾을 수 없습니다.'}), 404
+    pending = view_counter.increment(post_id)
+    return jsonify({'success': True, 'views': (row.views or 0) + pending})
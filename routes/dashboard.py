@@ -1,6 +1,8 @@
 from flask import Blueprint, render_template, jsonify
 from database import db
-from database import Project, Equipment, Reservation, Patent
+from database import Project, Equipment, Reservation, Patent, Job
+from services.job_service import job_runner, job_to_dict
+from services.template_cache import template_cache
 from datetime import datetime, timedelta
 from sqlalchemy import func
 
@@ -80,3 +82,28 @@ def api_stats():
         'project_status': project_status,
         'equipment_status': equipment_status
     })
+
+@dashboard_bp.route('/api/jobs')
+def api_jobs():
+    """주기 작업 스케줄과 최근 실행 결과"""
+    try:
+        jobs = Job.query.order_by(Job.name).all()
+        return jsonify({'success': True, 'jobs': [job_to_dict(job) for job in jobs]})
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)}), 500
+
+@dashboard_bp.route('/api/jobs/<name>/run', methods=['POST'])
+def api_run_job(name):
+    """작업을 다음 폴링 때 실행하도록 예약 (요청 안에서 직접 실행하지 않음)"""
+    try:
+        if not job_runner.request_run(name):
+            return jsonify({'success': False, 'message': '등록되지 않은 작업입니다.'}), 404
+        return jsonify({'success': True, 'message': '작업 실행을 예약했습니다.'})
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': str(e)}), 500
+
+@dashboard_bp.route('/api/render-stats')
+def api_render_stats():
+    """이 워커의 페이지 템플릿별 렌더링 시간/CPU와 조각 캐시 적중 수"""
+    return jsonify({'success': True, 'templates': template_cache.stats()})
@@ -5,8 +5,12 @@
 from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify
 from datetime import datetime, date
 from database import db, Equipment, Reservation, UsageLog
-from utils.date_utils import parse_date, format_date
-from utils.response_utils import json_success_response, json_error_response
+from services.reservation_series_service import ReservationSeriesService, ReservationConflictError
+from services.serializers import get_serializer
+from utils.date_utils import parse_date
+from utils.response_utils import (
+    json_success_response, json_error_response, json_stream_response, STREAM_BATCH_SIZE
+)
 import csv
 
 equipment_bp = Blueprint('equipment', __name__)
@@ -16,27 +20,19 @@ equipment_bp = Blueprint('equipment', __name__)
 def api_reservations():
     """예약 목록 API"""
     try:
-        reservations = Reservation.query.order_by(Reservation.start_date.desc()).all()
-        result = []
-        for r in reservations:
-            # 장비 id를 name으로 역참조
-            equipment = Equipment.query.filter_by(name=r.equipment_name).first()
-            equipment_id = equipment.id if equipment else None
-            result.append({
-                'id': r.id,
-                'equipment_id': equipment_id,
-                'equipment_name': r.equipment_name,
-                'reserver': r.reserver,
-                'purpose': r.purpose,
-                'start_date': format_date(r.start_date),
-                'end_date': format_date(r.end_date),
-                'start_time': r.start_time.strftime('%H:%M') if r.start_time else '',
-                'end_time': r.end_time.strftime('%H:%M') if r.end_time else '',
-                'status': r.status,
-                'notes': r.notes,
-                'created_date': format_date(r.created_date)
-            })
-        return json_success_response({'reservations': result})
+        reservations = Reservation.query.order_by(Reservation.start_date.desc()).yield_per(STREAM_BATCH_SIZE)
+        # 장비 id를 name으로 역참조 (이름별 첫 장비, 한 번의 조회)
+        equipment_ids = {}
+        for equipment_id, name in db.session.query(Equipment.id, Equipment.name).order_by(Equipment.id.desc()):
+            equipment_ids[name] = equipment_id
+        serialize = get_serializer(Reservation)
+
+        def rows():
+            for r in reservations:
+                item = serialize(r)
+                item['equipment_id'] = equipment_ids.get(r.equipment_name)
+                yield item
+        return json_stream_response(rows(), 'reservations')
     except Exception as e:
         return json_error_response(str(e))
 
@@ -226,9 +222,11 @@ def add_usage_log():
 # API 라우트들
 @equipment_bp.route('/api/reservations/add', methods=['POST'])
 def api_add_reservation():
-    """예약 추가 API"""
+    """예약 추가 API (rrule이 있으면 반복 예약으로 생성)"""
     try:
         data = request.get_json()
+        if data.get('rrule'):
+            return _add_reservation_series(data)
         
         # equipment_id가 있으면 equipment_name으로 변환
         equipment_name = data.get('equipment_name')
@@ -267,6 +265,31 @@ def api_add_reservation():
         db.session.rollback()
         return json_error_response(f"예약 추가 중 오류가 발생했습니다: {str(e)}")
 
+def _add_reservation_series(data):
+    """반복 예약 생성. 기존 예약과 겹치면 409와 충돌 목록 (skip_conflicts면 겹치는 날짜만 건너뜀)"""
+    try:
+        result = ReservationSeriesService.create_series(data, skip_conflicts=bool(data.get('skip_conflicts')))
+    except ReservationConflictError as e:
+        return jsonify({'success': False, 'error': str(e), 'data': {'conflicts': e.conflicts}}), 409
+    except ValueError as e:
+        return json_error_response(str(e))
+    message = f"반복 예약 {result['created']}건이 추가되었습니다."
+    if result['skipped']:
+        message += f" (겹치는 날짜 {len(result['skipped'])}건 제외)"
+    return json_success_response(result, message)
+
+@equipment_bp.route('/api/reservations/series/<int:series_id>/delete', methods=['POST'])
+def api_delete_reservation_series(series_id):
+    """반복 예약 취소 API - 오늘(또는 from_date) 이후 발생 건 삭제"""
+    try:
+        data = request.get_json(silent=True) or {}
+        deleted = ReservationSeriesService.cancel_series(series_id, parse_date(data.get('from_date')))
+        return json_success_response({'deleted': deleted}, "반복 예약이 취소되었습니다.")
+    except LookupError as e:
+        return json_error_response(str(e), 404)
+    except Exception as e:
+        return json_error_response(f"반복 예약 취소 중 오류가 발생했습니다: {str(e)}")
+
 @equipment_bp.route('/api/reservations/<int:reservation_id>/update', methods=['POST'])
 def api_update_reservation_new(reservation_id):
     """예약 수정 API"""
@@ -354,24 +377,9 @@ def api_add_usage_log():
 def api_usage_logs():
     """사용일지 목록 API"""
     try:
-        logs = UsageLog.query.order_by(UsageLog.usage_date.desc()).all()
-        result = []
-        for log in logs:
-            result.append({
-                'id': log.id,
-                'equipment_name': log.equipment_name,
-                'user': log.user,
-                'usage_date': format_date(log.usage_date),
-                'start_time': log.start_time.strftime('%H:%M') if log.start_time else '',
-                'end_time': log.end_time.strftime('%H:%M') if log.end_time else '',
-                'purpose': log.purpose,
-                'notes': log.notes,
-                'condition_before': log.condition_before,
-                'condition_after': log.condition_after,
-                'issues': log.issues,
-                'created_date': format_date(log.created_date)
-            })
-        return json_success_response({'logs': result})
+        logs = UsageLog.query.order_by(UsageLog.usage_date.desc()).yield_per(STREAM_BATCH_SIZE)
+        serialize = get_serializer(UsageLog)
+        return json_stream_response((serialize(log) for log in logs), 'logs')
     except Exception as e:
         return json_error_response(str(e))
 
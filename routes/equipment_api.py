@@ -1,9 +1,13 @@
 """
 장비 관련 API 라우트
 """
+from datetime import datetime
 from flask import Blueprint, request, jsonify
-from services.equipment_service import EquipmentService
-from utils.response_utils import json_success_response, json_error_response, validate_required_fields
+from services.equipment_service import EquipmentService, AVAILABILITY_LIMIT
+from utils.date_utils import parse_date
+from utils.response_utils import (
+    json_success_response, json_error_response, json_stream_response, validate_required_fields
+)
 
 equipment_api_bp = Blueprint('equipment_api', __name__)
 
@@ -12,8 +16,38 @@ equipment_api_bp = Blueprint('equipment_api', __name__)
 def api_equipment():
     """장비 목록 API"""
     try:
-        equipment_data = EquipmentService.get_all_equipment()
-        return json_success_response({'equipment': equipment_data})
+        return json_stream_response(EquipmentService.iter_equipment(), 'equipment')
+    except Exception as e:
+        return json_error_response(str(e))
+
+
+@equipment_api_bp.route('/api/equipment/available')
+def api_available_equipment():
+    """가용 장비 검색 API
+
+    ?start_date=2025-06-03&end_date=2025-06-03&start_time=09:00&end_time=12:00&category=&location=
+    end_date를 생략하면 start_date 하루, 시간을 생략하면 하루 전체로 본다.
+    """
+    try:
+        args = request.args
+        start_date = parse_date(args.get('start_date'))
+        if start_date is None:
+            return json_error_response("start_date(YYYY-MM-DD)는 필수 입력 항목입니다.")
+        end_date = parse_date(args.get('end_date')) or start_date
+        try:
+            start_time = datetime.strptime(args['start_time'], '%H:%M').time() if args.get('start_time') else None
+            end_time = datetime.strptime(args['end_time'], '%H:%M').time() if args.get('end_time') else None
+        except ValueError:
+            return json_error_response("시간은 HH:MM 형식이어야 합니다.")
+        if end_date < start_date or (end_date == start_date and start_time and end_time and end_time <= start_time):
+            return json_error_response("종료 시점은 시작 시점보다 늦어야 합니다.")
+        limit = max(1, min(args.get('limit', AVAILABILITY_LIMIT, type=int), AVAILABILITY_LIMIT))
+
+        equipment = EquipmentService.find_available(
+            start_date, end_date, start_time, end_time,
+            category=args.get('category'), location=args.get('location'), limit=limit
+        )
+        return json_success_response({'equipment': equipment, 'count': len(equipment)})
     except Exception as e:
         return json_error_response(str(e))
 
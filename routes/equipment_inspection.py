@@ -3,9 +3,13 @@
 """
 from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify
 from datetime import datetime, date, timedelta
+from sqlalchemy.orm import contains_eager
 from database import db, Equipment, EquipmentInspection
+from services.serializers import get_serializer
 from utils.date_utils import parse_date, format_date
-from utils.response_utils import json_success_response, json_error_response
+from utils.response_utils import (
+    json_success_response, json_error_response, json_stream_response, STREAM_BATCH_SIZE
+)
 
 equipment_inspection_bp = Blueprint('equipment_inspection', __name__)
 
@@ -173,26 +177,12 @@ def delete_inspection(inspection_id):
 def api_inspections():
     """점검 기록 목록 API"""
     try:
-        inspections = EquipmentInspection.query.join(Equipment).order_by(EquipmentInspection.inspection_date.desc()).all()
-        result = []
-        for inspection in inspections:
-            result.append({
-                'id': inspection.id,
-                'equipment_id': inspection.equipment_id,
-                'equipment_name': inspection.equipment.name,
-                'inspection_date': format_date(inspection.inspection_date),
-                'inspector': inspection.inspector,
-                'inspection_type': inspection.inspection_type,
-                'result': inspection.result,
-                'condition_before': inspection.condition_before,
-                'condition_after': inspection.condition_after,
-                'findings': inspection.findings,
-                'actions_taken': inspection.actions_taken,
-                'next_inspection_date': format_date(inspection.next_inspection_date) if inspection.next_inspection_date else None,
-                'notes': inspection.notes,
-                'created_date': format_date(inspection.created_date)
-            })
-        return json_success_response(result)
+        inspections = (EquipmentInspection.query.join(Equipment)
+                       .options(contains_eager(EquipmentInspection.equipment))
+                       .order_by(EquipmentInspection.inspection_date.desc())
+                       .yield_per(STREAM_BATCH_SIZE))
+        serialize = get_serializer(EquipmentInspection)
+        return json_stream_response(serialize(inspection) for inspection in inspections)
     except Exception as e:
         return json_error_response(str(e))
 
@@ -1,61 +1,63 @@
 """
 장비 관련 페이지 라우트
 """
+from datetime import date, timedelta
 from flask import Blueprint, render_template, request, redirect, url_for, flash
 from services.equipment_service import EquipmentService
 from database import Equipment
+from services.template_cache import lazy_rows
 
 equipment_pages_bp = Blueprint('equipment_pages', __name__)
 
 
+def _equipment_rows(today):
+    """장비 목록 페이지의 행 (점검 상태는 today 기준으로 계산)"""
+    equipment_data = []
+    for equipment in Equipment.query.all():
+        # 점검 상태 계산
+        inspection_status = '정상'
+        next_inspection_date = None
+
+        if equipment.last_inspection_date and equipment.inspection_cycle_days:
+            next_inspection_date = equipment.last_inspection_date + timedelta(days=equipment.inspection_cycle_days)
+            if next_inspection_date < today:
+                inspection_status = '점검지연'
+            elif next_inspection_date - today <= timedelta(days=30):
+                inspection_status = '점검필요'
+            else:
+                inspection_status = '정상'
+
+        equipment_data.append({
+            'id': equipment.id,
+            'equipment_id': equipment.equipment_id,
+            'name': equipment.name,
+            'model': equipment.model,
+            'manufacturer': equipment.manufacturer,
+            'location': equipment.location,
+            'status': equipment.status,
+            'purchase_date': equipment.purchase_date.strftime('%Y-%m-%d') if equipment.purchase_date else '',
+            'maintenance_date': equipment.maintenance_date.strftime('%Y-%m-%d') if equipment.maintenance_date else '',
+            'inspection_cycle_days': equipment.inspection_cycle_days,
+            'last_inspection_date': equipment.last_inspection_date.strftime('%Y-%m-%d') if equipment.last_inspection_date else '',
+            'next_inspection_date': next_inspection_date.strftime('%Y-%m-%d') if next_inspection_date else '',
+            'inspection_status': inspection_status,
+            'notes': equipment.notes,
+            'created_date': equipment.created_date.strftime('%Y-%m-%d') if equipment.created_date else ''
+        })
+    return equipment_data
+
+
 @equipment_pages_bp.route('/list')
 def equipment_list_page():
     """장비 목록 페이지"""
     try:
-        equipment_list = Equipment.query.all()
-        
-        # Equipment 객체를 딕셔너리로 변환
-        equipment_data = []
-        for equipment in equipment_list:
-            # 점검 상태 계산
-            inspection_status = '정상'
-            next_inspection_date = None
-            
-            if equipment.last_inspection_date and equipment.inspection_cycle_days:
-                from datetime import timedelta
-                next_inspection_date = equipment.last_inspection_date + timedelta(days=equipment.inspection_cycle_days)
-                
-                from datetime import date
-                today = date.today()
-                if next_inspection_date < today:
-                    inspection_status = '점검지연'
-                elif next_inspection_date - today <= timedelta(days=30):
-                    inspection_status = '점검필요'
-                else:
-                    inspection_status = '정상'
-            
-            equipment_data.append({
-                'id': equipment.id,
-                'equipment_id': equipment.equipment_id,
-                'name': equipment.name,
-                'model': equipment.model,
-                'manufacturer': equipment.manufacturer,
-                'location': equipment.location,
-                'status': equipment.status,
-                'purchase_date': equipment.purchase_date.strftime('%Y-%m-%d') if equipment.purchase_date else '',
-                'maintenance_date': equipment.maintenance_date.strftime('%Y-%m-%d') if equipment.maintenance_date else '',
-                'inspection_cycle_days': equipment.inspection_cycle_days,
-                'last_inspection_date': equipment.last_inspection_date.strftime('%Y-%m-%d') if equipment.last_inspection_date else '',
-                'next_inspection_date': next_inspection_date.strftime('%Y-%m-%d') if next_inspection_date else '',
-                'inspection_status': inspection_status,
-                'notes': equipment.notes,
-                'created_date': equipment.created_date.strftime('%Y-%m-%d') if equipment.created_date else ''
-            })
-        
-        return render_template('equipment/list.html', equipment=equipment_data)
+        # 점검 상태가 날짜에 따라 바뀌므로 목록 조각 캐시 키에 오늘 날짜를 포함
+        today = date.today()
+        equipment_data = lazy_rows(lambda: _equipment_rows(today))
+        return render_template('equipment/list.html', equipment=equipment_data, today=today)
     except Exception as e:
         flash(f'장비 목록을 불러오는 중 오류가 발생했습니다: {str(e)}', 'error')
-        return render_template('equipment/list.html', equipment=[])
+        return render_template('equipment/list.html', equipment=[], today=None)
 
 
 @equipment_pages_bp.route('/reservations')
@@ -0,0 +1,83 @@
+"""
+변경 이벤트 스트림 라우트 (Server-Sent Events)
+
+예약/일정 화면이 EventSource로 연결해 다른 사용자의 변경을 받는다. 연결 하나가 응답을 계속
+열어 두므로 gevent 워커(gunicorn_events.conf.py)에서 제공하고, 요청마다 프로세스를 점유하는
+sync 워커에서는 503을 돌려준다 (EventSource는 재연결하지 않고 화면은 기존처럼 동작).
+"""
+import json
+import time
+
+from flask import Blueprint, Response, current_app, request
+
+from services.change_events import EVENT_ENTITIES, RESET, change_events
+from utils.response_utils import json_error_response
+
+events_bp = Blueprint('events', __name__)
+
+# 연결이 끊겼을 때 브라우저가 재접속까지 기다리는 시간(ms)
+RETRY_MS = 3000
+
+
+def _format_event(change) -> str:
+    return f"id: {change['event_id']}\nevent: change\ndata: {json.dumps(change, ensure_ascii=False)}\n\n"
+
+
+@events_bp.route('/stream')
+def stream():
+    """변경 이벤트 스트림
+
+    쿼리: entities=reservation,schedule (생략 시 전체)
+    이벤트: change {"entity", "id", "op": create|update|delete|bulk, "version", "event_id"}
+            reset  놓친 이벤트를 알 수 없음 - 목록 전체를 다시 불러와야 함
+    재접속 시 브라우저가 보내는 Last-Event-ID 이후의 이벤트를 다시 보낸다.
+    """
+    config = current_app.config
+    if config.get('EVENTS_REQUIRE_ASYNC_WORKER', True) and not request.environ.get('wsgi.multithread'):
+        return json_error_response('이벤트 스트림은 비동기 워커에서만 제공합니다.', 503)
+    if not change_events.enabled:
+        return json_error_response('변경 이벤트가 비활성화되어 있습니다.', 503)
+
+    entities = {name for name in request.args.get('entities', '').split(',') if name}
+    unknown = entities - set(EVENT_ENTITIES.values())
+    if unknown:
+        return json_error_response(f"지원하지 않는 대상입니다: {', '.join(sorted(unknown))}")
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    try:
+        last_event_id = int(last_event_id) if last_event_id else None
+    except ValueError:
+        last_event_id = None
+
+    heartbeat = config.get('EVENTS_HEARTBEAT_SECONDS', 15)
+    max_seconds = config.get('EVENTS_STREAM_MAX_SECONDS', 3600)
+    subscription, backlog = change_events.subscribe(entities, last_event_id)
+
+    def generate():
+        # 요청/앱 컨텍스트 밖에서 실행된다 (DB 세션을 잡고 있지 않음)
+        try:
+            yield f'retry: {RETRY_MS}\n\n'
+            if backlog is RESET:
+                yield 'event: reset\ndata: {}\n\n'
+            else:
+                for change in backlog:
+                    yield _format_event(change)
+            # 최대 연결 시간이 지나면 끊어 워커 재시작/배포 시 연결이 다른 워커로 고르게 옮겨 가게 한다
+            deadline = time.monotonic() + max_seconds
+            while time.monotonic() < deadline:
+                change = subscription.get(timeout=heartbeat)
+                if change is None:
+                    yield ': keepalive\n\n'
+                elif change is RESET:
+                    yield 'event: reset\ndata: {}\n\n'
+                    return
+                else:
+                    yield _format_event(change)
+        finally:
+            change_events.unsubscribe(subscription)
+
+    response = Response(generate(), mimetype='text/event-stream')
+    # 스트림을 시작하기 전에 연결이 끊겨도 구독을 해제
+    response.call_on_close(lambda: change_events.unsubscribe(subscription))
+    # nginx가 응답을 모아 두지 않고 바로 보내도록
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
@@ -1,30 +1,16 @@
 from flask import Blueprint, render_template, request, redirect, url_for, flash
 from database import db, Contact
+from services.serializers import serialize_all
+from services.template_cache import lazy_rows
 from datetime import datetime
 
 external_bp = Blueprint('external', __name__)
 
 @external_bp.route('/contacts')
 def contacts():
-    contacts = Contact.query.order_by(Contact.created_date.desc()).all()
-    contacts_json = [
-        {
-            'id': c.id,
-            'contact_id': c.contact_id,
-            'name': c.name,
-            'company': c.company,
-            'position': c.position,
-            'department': c.department,
-            'phone': c.phone,
-            'email': c.email,
-            'address': c.address,
-            'category': c.category,
-            'relationship': c.relationship,
-            'notes': c.notes,
-            'created_date': c.created_date.strftime('%Y-%m-%d') if c.created_date else ''
-        }
-        for c in contacts
-    ]
+    # 목록 조각이 캐시되어 있으면 조회하지 않음
+    contacts = lazy_rows(lambda: Contact.query.order_by(Contact.created_date.desc()).all())
+    contacts_json = lazy_rows(lambda: serialize_all(Contact, contacts))
     return render_template('external/contacts.html', contacts=contacts, contacts_json=contacts_json)
 
 @external_bp.route('/contacts/add', methods=['POST'])
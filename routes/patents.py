@@ -1,5 +1,9 @@
 from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify
+from sqlalchemy.orm import selectinload
 from database import db, Patent
+from services.patent_service import PatentService
+from services.serializers import serialize_all
+from services.template_cache import lazy_rows
 from datetime import datetime
 
 patents_bp = Blueprint('patents', __name__)
@@ -12,36 +16,17 @@ def parse_date(date_str):
     except Exception:
         return None
 
+def _co_inventor_shares():
+    """공동 발명자 지분율 입력값 (발명자 입력 칸 수만큼, 부족하면 None으로 채움)"""
+    shares = request.form.getlist('co_inventors_share[]')
+    return shares + [None] * (len(request.form.getlist('co_inventors')) - len(shares))
+
 @patents_bp.route('/list')
 def patent_list():
-    patents = Patent.query.order_by(Patent.created_date.desc()).all()
-    patents_list = []
-    for p in patents:
-        patents_list.append({
-            'id': p.id,
-            'title': p.title,
-            'application_number': p.application_number,
-            'registration_number': p.registration_number,
-            'application_date': p.application_date.strftime('%Y-%m-%d') if p.application_date else '',
-            'status': p.status,
-            'inventors': p.inventors,
-            'description': p.description,
-            'patent_office': p.patent_office,
-
-            'main_inventor': p.main_inventor,
-            'co_inventors': p.co_inventors,
-            'application_draft_link': p.application_draft_link,
-            'prior_art_report_link': p.prior_art_report_link,
-            'application_form_link': p.application_form_link,
-            'application_review_link': p.application_review_link,
-            'office_action_link': p.office_action_link,
-            'response_link': p.response_link,
-            'amendment_link': p.amendment_link,
-            'publication_link': p.publication_link,
-            'registration_review_link': p.registration_review_link,
-            'notes': p.notes,
-            'created_date': p.created_date.strftime('%Y-%m-%d') if p.created_date else ''
-        })
+    # 목록 조각이 캐시되어 있으면 조회하지 않음
+    patents_list = lazy_rows(lambda: serialize_all(
+        Patent, Patent.query.options(selectinload(Patent.inventor_links)).order_by(Patent.created_date.desc())
+    ))
     return render_template('patents/list.html', patents=patents_list)
 
 @patents_bp.route('/add', methods=['POST'])
@@ -54,8 +39,8 @@ def add_patent():
 
         # 발명자 정보 처리
         main_inventor = request.form.get('main_inventor', '')
-        co_inventors_list = request.form.getlist('co_inventors')
-        co_inventors_list = [co for co in co_inventors_list if co.strip()]
+        co_inventor_pairs = list(zip(request.form.getlist('co_inventors'), _co_inventor_shares()))
+        co_inventors_list = [co for co in request.form.getlist('co_inventors') if co.strip()]
         
         # 발명자들을 하나의 문자열로 결합
         all_inventors = [main_inventor] + co_inventors_list
@@ -88,6 +73,7 @@ def add_patent():
             created_date=datetime.now()
         )
         db.session.add(patent)
+        PatentService.sync_inventors(patent, main_inventor, patent.main_inventor_share, co_inventor_pairs)
         db.session.commit()
         flash('특허가 성공적으로 추가되었습니다.', 'success')
     except Exception as e:
@@ -110,8 +96,8 @@ def update_patent(patent_id):
 
         # 발명자 정보 처리
         main_inventor = request.form.get('main_inventor', '')
-        co_inventors_list = request.form.getlist('co_inventors')
-        co_inventors_list = [co for co in co_inventors_list if co.strip()]
+        co_inventor_pairs = list(zip(request.form.getlist('co_inventors'), _co_inventor_shares()))
+        co_inventors_list = [co for co in request.form.getlist('co_inventors') if co.strip()]
         
         # 발명자들을 하나의 문자열로 결합
         all_inventors = [main_inventor] + co_inventors_list
@@ -138,7 +124,8 @@ def update_patent(patent_id):
         patent.publication_link = request.form.get('publication_link')
         patent.registration_review_link = request.form.get('registration_review_link')
         patent.notes = request.form.get('notes')
-        
+        PatentService.sync_inventors(patent, main_inventor, patent.main_inventor_share, co_inventor_pairs)
+
         db.session.commit()
         flash('특허 정보가 성공적으로 수정되었습니다.', 'success')
     except Exception as e:
@@ -161,5 +148,32 @@ def delete_patent(patent_id):
         flash(f'특허 삭제 중 오류가 발생했습니다: {str(e)}', 'error')
     return redirect(url_for('patents.patent_list'))
 
+@patents_bp.route('/api/stats')
+def api_stats():
+    """특허 포트폴리오 통계 API (특허 변경 시 캐시 무효화)"""
+    try:
+        stats, cached = PatentService.get_stats()
+        return jsonify({'success': True, 'stats': stats, 'cached': cached})
+    except Exception as e:
+        return jsonify({'success': False, 'message': f'특허 통계를 불러오는 중 오류가 발생했습니다: {str(e)}'}), 500
 
+@patents_bp.route('/api/inventors')
+def api_inventors():
+    """발명자별 특허 건수/지분율 합계 API"""
+    try:
+        return jsonify({'success': True, 'inventors': PatentService.get_inventor_totals()})
+    except Exception as e:
+        return jsonify({'success': False, 'message': f'발명자 통계를 불러오는 중 오류가 발생했습니다: {str(e)}'}), 500
 
+@patents_bp.route('/api/inventors/patents')
+def api_inventor_patents():
+    """발명자별 특허 목록 API (?name=이름 또는 ?researcher_id=연구원 id)"""
+    name = request.args.get('name', '').strip()
+    researcher_id = request.args.get('researcher_id', type=int)
+    if not name and researcher_id is None:
+        return jsonify({'success': False, 'message': 'name 또는 researcher_id가 필요합니다.'}), 400
+    try:
+        patents = PatentService.get_patents_by_inventor(name=name or None, researcher_id=researcher_id)
+        return jsonify({'success': True, 'patents': patents})
+    except Exception as e:
+        return jsonify({'success': False, 'message': f'발명자 특허 목록을 불러오는 중 오류가 발생했습니다: {str(e)}'}), 500
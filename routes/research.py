@@ -1,5 +1,9 @@
 from flask import Blueprint, render_template, request, redirect, url_for, jsonify, flash
+from sqlalchemy.orm import contains_eager
 from database import db, Project, Researcher, Week, WeeklyScheduleNew
+from services.batch_service import apply_schedule_changes
+from services.week_service import WeekService
+from utils.date_utils import parse_date
 import uuid
 from datetime import datetime
 
@@ -122,24 +126,23 @@ def api_schedule_add():
     week = int(data.get('week'))
     title = data.get('task')
     description = data.get('notes')
-    # week_id 찾기
-    week_obj = Week.query.filter_by(year=year, month=month, week_number=week).first()
-    if not week_obj:
-        week_obj = Week(year=year, month=month, week_number=week)
-        db.session.add(week_obj)
-        db.session.commit()
+    # week_id 찾기 (사전 생성된 주차 캘린더, 쿼리 없음)
+    week_id = WeekService.get_week_id(year, month, week)
+    if week_id is None:
+        return jsonify({'success': False, 'message': '지원하지 않는 주차입니다.'}), 400
     schedule = WeeklyScheduleNew(
         project_name=project_name,
         researcher_name=researcher_name,
-        week_id=week_obj.id,
+        week_id=week_id,
         title=title,
         description=description,
-        start_week_id=week_obj.id,
-        end_week_id=week_obj.id
+        start_week_id=week_id,
+        end_week_id=week_id,
+        priority=data.get('priority') or '보통'
     )
     db.session.add(schedule)
     db.session.commit()
-    return jsonify({'success': True})
+    return jsonify({'success': True, 'schedule': {'id': schedule.id}})
 
 @research_bp.route('/schedule/update/<int:id>', methods=['PUT'])
 def api_schedule_update(id):
@@ -147,40 +150,45 @@ def api_schedule_update(id):
     schedule = WeeklyScheduleNew.query.get(id)
     if not schedule:
         return jsonify({'success': False, 'message': '일정이 존재하지 않습니다.'})
-    schedule.title = data.get('task')
-    schedule.description = data.get('notes')
-    schedule.project_name = data.get('project')
-    schedule.researcher_name = data.get('researcher')
     # 주차 정보 변경
     year = int(data.get('year'))
     month = int(data.get('month'))
     week = int(data.get('week'))
-    week_obj = Week.query.filter_by(year=year, month=month, week_number=week).first()
-    if not week_obj:
-        week_obj = Week(year=year, month=month, week_number=week)
-        db.session.add(week_obj)
-        db.session.commit()
-    schedule.week_id = week_obj.id
-    schedule.start_week_id = week_obj.id
-    schedule.end_week_id = week_obj.id
+    week_id = WeekService.get_week_id(year, month, week)
+    if week_id is None:
+        return jsonify({'success': False, 'message': '지원하지 않는 주차입니다.'}), 400
+    schedule.title = data.get('task')
+    schedule.description = data.get('notes')
+    schedule.project_name = data.get('project')
+    schedule.researcher_name = data.get('researcher')
+    schedule.week_id = week_id
+    schedule.start_week_id = week_id
+    schedule.end_week_id = week_id
     db.session.commit()
     return jsonify({'success': True})
 
 @research_bp.route('/api/schedule')
 def api_schedule():
-    schedules = WeeklyScheduleNew.query.all()
+    # start/end(YYYY-MM-DD)가 주어지면 해당 기간과 겹치는 주차의 일정만 조회
+    query = _weekly_schedule_query()
+    start = parse_date(request.args.get('start'))
+    end = parse_date(request.args.get('end'))
+    if start:
+        query = query.filter(Week.end_date >= start)
+    if end:
+        query = query.filter(Week.start_date <= end)
     result = []
-    for s in schedules:
-        week = Week.query.get(s.week_id)
+    for s in query.all():
+        year, month, week = s.week.year, s.week.month, s.week.week_number
         result.append({
             'id': s.id,
             'title': s.title,
             'extendedProps': {
                 'project': s.project_name,
                 'researcher': s.researcher_name,
-                'year': week.year if week else None,
-                'month': week.month if week else None,
-                'week': week.week_number if week else None,
+                'year': year,
+                'month': month,
+                'week': week,
                 'notes': s.description
             }
         })
@@ -195,6 +203,101 @@ def api_schedule_delete(id):
     db.session.commit()
     return jsonify({'success': True})
 
+# ---- 주간 일정(weekly-schedule.js) API ----
+def _weekly_schedule_query():
+    """Week를 조인해 한 번의 쿼리로 일정과 주차를 함께 로드"""
+    return (WeeklyScheduleNew.query
+            .join(WeeklyScheduleNew.week)
+            .options(contains_eager(WeeklyScheduleNew.week))
+            .order_by(Week.year, Week.month, Week.week_number, WeeklyScheduleNew.created_at))
+
+def _weekly_schedule_to_dict(schedule):
+    return {
+        'id': schedule.id,
+        'task': schedule.title,
+        'researcher': schedule.researcher_name or '',
+        'project': schedule.project_name or '',
+        'priority': schedule.priority or '보통',
+        'status': schedule.status,
+        'notes': schedule.description or '',
+        'createdAt': schedule.created_at.isoformat() if schedule.created_at else None
+    }
+
+@research_bp.route('/api/weekly-schedule/<int:year>/<int:month>')
+def api_weekly_schedule_month(year, month):
+    """월별 주간 일정 API - 주차 번호별로 묶어서 반환"""
+    schedules = _weekly_schedule_query().filter(Week.year == year, Week.month == month).all()
+    result = {}
+    for s in schedules:
+        result.setdefault(str(s.week.week_number), []).append(_weekly_schedule_to_dict(s))
+    return jsonify(result)
+
+@research_bp.route('/api/weekly-schedule/update/<int:id>', methods=['PUT'])
+def api_weekly_schedule_update(id):
+    """주간 일정 수정 API"""
+    schedule = WeeklyScheduleNew.query.get(id)
+    if not schedule:
+        return jsonify({'success': False, 'message': '일정이 존재하지 않습니다.'}), 404
+    error = apply_schedule_changes(schedule, request.get_json() or {})
+    if error:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': error}), 400
+    db.session.commit()
+    return jsonify({'success': True})
+
+@research_bp.route('/api/weekly-schedule/move/<int:id>', methods=['PUT'])
+def api_weekly_schedule_move(id):
+    """주간 일정 주차 이동 API (year/month 생략 시 같은 달 안에서 이동)"""
+    data = request.get_json() or {}
+    schedule = WeeklyScheduleNew.query.get(id)
+    if not schedule:
+        return jsonify({'success': False, 'message': '일정이 존재하지 않습니다.'}), 404
+    error = apply_schedule_changes(schedule, {
+        key: data[key] for key in ('year', 'month', 'week') if key in data
+    })
+    if error:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': error}), 400
+    db.session.commit()
+    return jsonify({'success': True})
+
+@research_bp.route('/api/weekly-schedule/delete/<int:id>', methods=['DELETE'])
+def api_weekly_schedule_delete(id):
+    """주간 일정 삭제 API"""
+    deleted = WeeklyScheduleNew.query.filter_by(id=id).delete(synchronize_session=False)
+    if not deleted:
+        return jsonify({'success': False, 'message': '일정이 존재하지 않습니다.'}), 404
+    db.session.commit()
+    return jsonify({'success': True})
+
+@research_bp.route('/api/weekly-schedule/batch', methods=['PUT'])
+def api_weekly_schedule_batch():
+    """여러 일정의 이동/수정을 하나의 트랜잭션으로 처리하는 API
+
+    요청: {"items": [{"id": 1, "week": 3}, {"id": 2, "task": "...", "priority": "높음"}]}
+    하나라도 실패하면 전체를 롤백한다.
+    """
+    payload = request.get_json(silent=True) or {}
+    items = payload.get('items') if isinstance(payload, dict) else None
+    if not isinstance(items, list) or not items or any(not isinstance(item, dict) for item in items):
+        return jsonify({'success': False, 'message': '변경할 일정 목록이 올바르지 않습니다.'}), 400
+    ids = [item.get('id') for item in items]
+    if any(not isinstance(i, int) or isinstance(i, bool) for i in ids):
+        return jsonify({'success': False, 'message': '변경할 일정 id 목록이 필요합니다.'}), 400
+
+    schedules = {s.id: s for s in WeeklyScheduleNew.query.filter(WeeklyScheduleNew.id.in_(ids))}
+    for item in items:
+        schedule = schedules.get(item['id'])
+        if schedule is None:
+            db.session.rollback()
+            return jsonify({'success': False, 'message': f"일정이 존재하지 않습니다: {item['id']}"}), 404
+        error = apply_schedule_changes(schedule, item)
+        if error:
+            db.session.rollback()
+            return jsonify({'success': False, 'message': f"{item['id']}: {error}"}), 400
+    db.session.commit()
+    return jsonify({'success': True, 'updated': len(schedules)})
+
 @research_bp.route('/projects/api')
 def api_projects():
     projects = Project.query.order_by(Project.created_date.desc()).all()
@@ -1,10 +1,23 @@
 from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify
 from datetime import datetime
+from sqlalchemy.orm import selectinload
+from urllib.parse import unquote
 from database import db, SafetyMaterial, Accident, AccidentDocument, SafetyProcedure
+from services.accident_document_service import AccidentDocumentService
+from services.accident_stats_service import AccidentStatsService
+from services.file_store import FileTooLarge
+from services.procedure_service import ProcedureService, procedure_to_dict
+from services.serializers import serialize_all
 import math
 
 safety_bp = Blueprint('safety', __name__)
 
+ACCIDENTS_PER_PAGE = 20
+ACCIDENTS_MAX_PER_PAGE = 100
+
+PROCEDURES_PER_PAGE = 50
+PROCEDURE_DUE_DAYS = 30
+
 @safety_bp.route('/materials')
 def materials():
     """안전 교육자료 목록 페이지"""
@@ -16,18 +29,8 @@ def api_materials():
     """교육자료 목록 API"""
     try:
         materials = SafetyMaterial.query.order_by(SafetyMaterial.created_date.desc()).all()
-        materials_list = []
-        
-        for material in materials:
-            materials_list.append({
-                'id': material.id,
-                'title': material.title,
-                'content': material.content,
-                'link': material.link,
-                'created_date': material.created_date.strftime('%Y-%m-%d %H:%M:%S') if material.created_date else '',
-                'updated_date': material.updated_date.strftime('%Y-%m-%d %H:%M:%S') if material.updated_date else ''
-            })
-        
+        materials_list = serialize_all(SafetyMaterial, materials)
+
         return jsonify({
             'success': True,
             'materials': materials_list
@@ -138,42 +141,59 @@ def api_delete_material(material_id):
 
 @safety_bp.route('/accidents')
 def accidents():
-    """사고관리 페이지"""
-    accidents = Accident.query.order_by(Accident.date.desc()).all()
-    return render_template('safety/accidents.html', accidents=accidents)
+    """사고관리 페이지 (목록은 API로 페이지 단위 로드)"""
+    return render_template('safety/accidents.html')
+
+def _accident_page(page, per_page):
+    """사고 목록 한 페이지와 관련 자료 (사고 1쿼리 + 관련 자료 selectin 1쿼리)"""
+    # 다음 페이지 여부는 COUNT 대신 1건 더 조회해서 판단
+    accidents = Accident.query.options(selectinload(Accident.documents)) \
+        .order_by(Accident.date.desc(), Accident.id.desc()) \
+        .offset((page - 1) * per_page).limit(per_page + 1).all()
+    return accidents[:per_page], len(accidents) > per_page
+
+def _accident_to_dict(accident):
+    return {
+        'id': accident.id,
+        'incident_date': accident.date.strftime('%Y-%m-%d') if accident.date else '',
+        'location': accident.location or '',
+        'involved_person': accident.injured_person or '',
+        'incident_type': accident.severity or '',
+        'severity': accident.severity or '',
+        'description': accident.description or '',
+        'immediate_action': accident.action_taken or '',
+        'follow_up': '',
+        'prevention': '',
+        'reporter': '',
+        'status': accident.status or '',
+        'created_date': accident.created_date.strftime('%Y-%m-%d %H:%M:%S') if accident.created_date else '',
+        'documents': [_accident_document_to_dict(doc) for doc in accident.documents]
+    }
+
+def _accident_document_to_dict(doc):
+    return {
+        'id': doc.id,
+        'title': doc.title or doc.file_name or '',
+        'url': doc.url or doc.file_path or '',
+        'file_name': doc.file_name or '',
+        'file_size': doc.file_size,
+        'content_type': doc.content_type or ''
+    }
 
 @safety_bp.route('/api/accidents')
 def api_accidents():
-    """사고 목록 API (DB 기반)"""
+    """사고 목록 API (DB 기반, ?page=&per_page= 페이지 단위)"""
     try:
-        accidents = Accident.query.order_by(Accident.date.desc()).all()
-        accidents_list = []
-        for accident in accidents:
-                accidents_list.append({
-                'id': accident.id,
-                'incident_date': accident.date.strftime('%Y-%m-%d') if accident.date else '',
-                'location': accident.location or '',
-                'involved_person': accident.injured_person or '',
-                'incident_type': accident.severity or '',
-                'severity': accident.severity or '',
-                'description': accident.description or '',
-                'immediate_action': accident.action_taken or '',
-                'follow_up': '',
-                'prevention': '',
-                'reporter': '',
-                'status': accident.status or '',
-                'created_date': accident.created_date.strftime('%Y-%m-%d %H:%M:%S') if accident.created_date else '',
-                'documents': [
-                    {
-                        'id': doc.id,
-                        'title': doc.title,
-                        'url': doc.url
-                    } for doc in getattr(accident, 'documents', [])
-                ]
-                })
+        page = max(request.args.get('page', 1, type=int) or 1, 1)
+        per_page = request.args.get('per_page', ACCIDENTS_PER_PAGE, type=int) or ACCIDENTS_PER_PAGE
+        per_page = min(max(per_page, 1), ACCIDENTS_MAX_PER_PAGE)
+        accidents, has_next = _accident_page(page, per_page)
         return jsonify({
             'success': True,
-            'accidents': accidents_list
+            'accidents': [_accident_to_dict(accident) for accident in accidents],
+            'page': page,
+            'per_page': per_page,
+            'has_next': has_next
         })
     except Exception as e:
         print(f"Error in api_accidents: {str(e)}")
@@ -182,6 +202,24 @@ def api_accidents():
             'message': f'사고 목록을 불러오는 중 오류가 발생했습니다: {str(e)}'
         }), 500
 
+@safety_bp.route('/api/accidents/stats')
+def api_accident_stats():
+    """사고 통계 API (?start=YYYY-MM[-DD]&end=YYYY-MM[-DD], 월 단위 기간은 월별 집계 테이블에서 계산)"""
+    try:
+        stats = AccidentStatsService.get_stats(request.args.get('start'), request.args.get('end'))
+    except ValueError:
+        return jsonify({
+            'success': False,
+            'message': '기간은 YYYY-MM 또는 YYYY-MM-DD 형식이어야 하며 시작일이 종료일보다 늦을 수 없습니다.'
+        }), 400
+    except Exception as e:
+        print(f"Error in api_accident_stats: {str(e)}")
+        return jsonify({
+            'success': False,
+            'message': f'사고 통계를 불러오는 중 오류가 발생했습니다: {str(e)}'
+        }), 500
+    return jsonify({'success': True, 'stats': stats})
+
 @safety_bp.route('/api/accidents/<int:accident_id>', methods=['PUT'])
 def api_update_accident(accident_id):
     """사고 정보 수정 API"""
@@ -223,12 +261,12 @@ def api_delete_accident(accident_id):
     """사고 삭제 API"""
     try:
         accident = Accident.query.get_or_404(accident_id)
+        digests = [doc.content_hash for doc in accident.documents]
         
-        # 관련 문서도 함께 삭제
-        AccidentDocument.query.filter_by(accident_id=accident_id).delete()
-        
+        # 관련 문서는 relationship cascade로 함께 삭제
         db.session.delete(accident)
         db.session.commit()
+        AccidentDocumentService.release(digests)
         
         return jsonify({
             'success': True,
@@ -283,6 +321,72 @@ def api_add_accident_document(accident_id):
             'message': f'관련 자료 추가 중 오류가 발생했습니다: {str(e)}'
         }), 500
 
+@safety_bp.route('/api/accidents/<int:accident_id>/documents/upload', methods=['POST'])
+def api_upload_accident_document(accident_id):
+    """사고 관련 파일 업로드 API
+
+    multipart/form-data(file 필드) 또는 요청 본문 전체를 파일로 받는다.
+    본문 업로드 시 파일명은 X-File-Name 헤더(URL 인코딩) 또는 ?filename= 으로 전달한다.
+    """
+    document = None
+    try:
+        accident = Accident.query.get_or_404(accident_id)
+        upload = request.files.get('file')
+        if upload is not None:
+            stream, file_name, content_type = upload.stream, upload.filename, upload.mimetype
+            title = request.form.get('title')
+        else:
+            stream = request.stream
+            file_name = unquote(request.headers.get('X-File-Name', '')) or request.args.get('filename', '')
+            content_type = request.mimetype
+            title = request.args.get('title')
+        if not file_name:
+            return jsonify({
+                'success': False,
+                'message': '업로드할 파일명이 필요합니다.'
+            }), 400
+
+        document = AccidentDocumentService.upload(accident, stream, file_name, content_type, title=title)
+        db.session.flush()
+        document.url = url_for('safety.api_download_accident_document',
+                               accident_id=accident_id, document_id=document.id)
+        db.session.commit()
+        
+        return jsonify({
+            'success': True,
+            'message': '파일이 성공적으로 업로드되었습니다.',
+            'document': _accident_document_to_dict(document)
+        })
+    except FileTooLarge:
+        db.session.rollback()
+        return jsonify({
+            'success': False,
+            'message': '파일 크기가 허용된 최대 크기를 초과했습니다.'
+        }), 413
+    except Exception as e:
+        db.session.rollback()
+        if document is not None:
+            AccidentDocumentService.release([document.content_hash])
+        print(f"Error in api_upload_accident_document: {str(e)}")
+        return jsonify({
+            'success': False,
+            'message': f'파일 업로드 중 오류가 발생했습니다: {str(e)}'
+        }), 500
+
+@safety_bp.route('/api/accidents/<int:accident_id>/documents/<int:document_id>/file')
+def api_download_accident_document(accident_id, document_id):
+    """사고 관련 파일 다운로드 API (Range 요청 지원, ?inline=1 이면 브라우저에서 열기)"""
+    document = AccidentDocument.query.filter_by(
+        id=document_id,
+        accident_id=accident_id
+    ).first_or_404()
+    if not AccidentDocumentService.has_file(document):
+        return jsonify({
+            'success': False,
+            'message': '업로드된 파일이 없는 자료입니다.'
+        }), 404
+    return AccidentDocumentService.send(document, as_attachment=request.args.get('inline') != '1')
+
 @safety_bp.route('/api/accidents/<int:accident_id>/documents/<int:document_id>', methods=['DELETE'])
 def api_delete_accident_document(accident_id, document_id):
     """사고 관련 문서 삭제 API"""
@@ -291,9 +395,11 @@ def api_delete_accident_document(accident_id, document_id):
             id=document_id, 
             accident_id=accident_id
         ).first_or_404()
+        digest = document.content_hash
         
         db.session.delete(document)
         db.session.commit()
+        AccidentDocumentService.release([digest])
         
         return jsonify({
             'success': True,
@@ -317,17 +423,18 @@ def add_accident():
                 return datetime.strptime(date_str, '%Y-%m-%d').date()
             except Exception:
                 return None
+        incident_date = parse_date(request.form.get('incident_date'))
+        if not incident_date or not request.form.get('description'):
+            flash('발생일시와 사고 내용은 필수 입력 항목입니다.', 'error')
+            return redirect(url_for('safety.accidents'))
         accident = Accident(
-            incident_date=parse_date(request.form.get('incident_date')),
+            accident_id=f"ACC-{datetime.now().strftime('%Y%m%d%H%M%S%f')}",
+            date=incident_date,
             location=request.form.get('location'),
-            involved_person=request.form.get('involved_person'),
-            incident_type=request.form.get('incident_type'),
+            injured_person=request.form.get('involved_person'),
             severity=request.form.get('severity'),
             description=request.form.get('description'),
-            immediate_action=request.form.get('immediate_action'),
-            follow_up=request.form.get('follow_up'),
-            prevention=request.form.get('prevention'),
-            reporter=request.form.get('reporter'),
+            action_taken=request.form.get('immediate_action'),
             status=request.form.get('status', '조사중'),
             created_date=datetime.now()
         )
@@ -372,29 +479,50 @@ def add_education():
 
 @safety_bp.route('/procedures')
 def procedures():
-    """작업절차서 및 위험성평가 페이지"""
-    procedures_data = SafetyProcedure.query.order_by(SafetyProcedure.created_date.desc()).all()
-    
-    # 딕셔너리로 변환하여 JSON 직렬화 가능하게 만들기
-    procedures = []
-    for proc in procedures_data:
-        procedures.append({
-            'id': proc.id,
-            'title': proc.title,
-            'category': proc.category,
-            'description': proc.description,
-            'version': proc.version,
-            'created_by': proc.responsible_person,
-            'review_date': proc.review_date.strftime('%Y-%m-%d') if proc.review_date else '',
-            'status': proc.status,
-            'procedure_link': proc.procedure_link,
-            'risk_assessment_link': proc.risk_assessment_link
-        })
+    """작업절차서 및 위험성평가 페이지 (검토 예정 목록 + 연도별 페이지 목록)"""
+    today = datetime.now().date()
+    due = [procedure_to_dict(proc, today) for proc in ProcedureService.get_due(PROCEDURE_DUE_DAYS, today)]
+
+    year = request.args.get('year', '')
+    page = max(request.args.get('page', 1, type=int) or 1, 1)
+    query = SafetyProcedure.query
+    if year:
+        query = query.filter(SafetyProcedure.version == year)
+    rows = query.order_by(SafetyProcedure.created_date.desc(), SafetyProcedure.id.desc()) \
+        .offset((page - 1) * PROCEDURES_PER_PAGE).limit(PROCEDURES_PER_PAGE + 1).all()
+    procedures = [procedure_to_dict(proc, today) for proc in rows[:PROCEDURES_PER_PAGE]]
     
     # 현재 연도 계산
     current_year = datetime.now().year
     
-    return render_template('safety/procedures.html', procedures=procedures, current_year=current_year)
+    return render_template('safety/procedures.html', procedures=procedures, due_procedures=due,
+                           due_days=PROCEDURE_DUE_DAYS, current_year=current_year, year=year,
+                           page=page, has_next=len(rows) > PROCEDURES_PER_PAGE)
+
+@safety_bp.route('/api/procedures/due')
+def api_procedures_due():
+    """검토 예정/지연 절차서 API (?within=일수, 기본 30일)"""
+    within = request.args.get('within', PROCEDURE_DUE_DAYS, type=int)
+    if within is None or not 0 <= within <= 3650:
+        return jsonify({
+            'success': False,
+            'message': 'within은 0~3650 사이의 일수여야 합니다.'
+        }), 400
+    try:
+        today = datetime.now().date()
+        procedures = [procedure_to_dict(proc, today) for proc in ProcedureService.get_due(within, today)]
+        return jsonify({
+            'success': True,
+            'within': within,
+            'overdue_count': sum(1 for proc in procedures if proc['overdue']),
+            'procedures': procedures
+        })
+    except Exception as e:
+        print(f"Error in api_procedures_due: {str(e)}")
+        return jsonify({
+            'success': False,
+            'message': f'검토 예정 절차서를 불러오는 중 오류가 발생했습니다: {str(e)}'
+        }), 500
 
 @safety_bp.route('/procedures/update', methods=['POST'])
 def update_procedure():
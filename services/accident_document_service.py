@@ -0,0 +1,57 @@
+"""
+사고 관련 자료 파일 업로드/다운로드 서비스
+"""
+import mimetypes
+import os
+from typing import BinaryIO, Optional
+
+from database import db, Accident, AccidentDocument
+from services.file_store import FileStore
+
+accident_document_store = FileStore('accidents', max_size_config='ACCIDENT_DOCUMENT_MAX_SIZE')
+
+
+class AccidentDocumentService:
+    """사고 관련 자료 파일 관리 서비스 클래스"""
+
+    @staticmethod
+    def upload(accident: Accident, stream: BinaryIO, file_name: str, content_type: Optional[str] = None,
+               title: Optional[str] = None, document_type: Optional[str] = None) -> AccidentDocument:
+        """파일을 저장소에 스트리밍 저장하고 자료 행을 추가 (커밋은 호출자가 수행)"""
+        file_name = os.path.basename(file_name.replace('\\', '/')) or 'file'
+        # 자료 행을 커밋할 때까지 같은 내용의 객체가 release()로 지워지지 않도록 pin
+        digest, size, _ = accident_document_store.save_stream(stream, session=db.session)
+        if not content_type or content_type == 'application/octet-stream':
+            content_type = mimetypes.guess_type(file_name)[0] or 'application/octet-stream'
+
+        document = AccidentDocument(
+            accident_id=accident.id,
+            title=title or file_name,
+            document_type=document_type,
+            file_name=file_name[:200],
+            file_path=accident_document_store.relative_path(digest),
+            content_hash=digest,
+            content_type=content_type[:100],
+            file_size=size
+        )
+        db.session.add(document)
+        return document
+
+    @staticmethod
+    def release(digests) -> None:
+        """더 이상 어떤 자료도 참조하지 않는 파일 삭제 (커밋 이후 호출)"""
+        accident_document_store.delete_unreferenced(digests, AccidentDocumentService._referenced)
+
+    @staticmethod
+    def _referenced(digests) -> set:
+        return {row[0] for row in db.session.query(AccidentDocument.content_hash)
+                .filter(AccidentDocument.content_hash.in_(digests)).distinct()}
+
+    @staticmethod
+    def has_file(document: AccidentDocument) -> bool:
+        return bool(document.content_hash) and accident_document_store.exists(document.content_hash)
+
+    @staticmethod
+    def send(document: AccidentDocument, as_attachment: bool = True):
+        return accident_document_store.send(document.content_hash, document.file_name or document.content_hash,
+                                            mimetype=document.content_type, as_attachment=as_attachment)
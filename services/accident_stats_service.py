@@ -0,0 +1,184 @@
+"""
+사고 통계 서비스
+
+사고가 등록/수정/삭제되면 같은 트랜잭션 안에서 영향받은 월의 집계 행
+(accident_monthly_stats)을 원본에서 다시 계산한다. 월 단위 기간 조회는 집계
+테이블만 읽으므로 여러 해의 추이도 원본 사고를 내려받지 않고 바로 계산된다.
+월 중간 날짜로 자르는 조회는 accidents.date 인덱스로 원본을 집계한다.
+
+Query.update()/delete() 같은 일괄 쓰기는 flush 이벤트를 거치지 않으므로
+그 뒤에는 rebuild()로 전체를 다시 계산해야 한다.
+"""
+import calendar
+from datetime import date
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from sqlalchemy import and_, event, extract, func, inspect, literal, or_, select, tuple_
+from sqlalchemy.orm import Session
+
+from database import db, Accident, AccidentMonthlyStat
+
+Month = Tuple[int, int]
+
+UNSPECIFIED = '미지정'
+
+# 월별 재계산 직렬화용 PostgreSQL advisory lock 네임스페이스 (pg_advisory_xact_lock(키1, 키2)의 키1)
+ROLLUP_LOCK_NAMESPACE = 35001
+
+
+def _months_of(obj: Accident) -> Set[Month]:
+    """객체의 현재 날짜와 변경 전 날짜가 속한 (연, 월)"""
+    history = inspect(obj).attrs.date.history
+    dates = list(history.added or ()) + list(history.deleted or ()) + list(history.unchanged or ())
+    return {(d.year, d.month) for d in dates if d is not None}
+
+
+def _refresh_months(connection, months: Iterable[Month]) -> None:
+    """지정한 월의 집계 행을 원본 사고에서 다시 계산"""
+    months = sorted(set(months))
+    if not months:
+        return
+    stats = AccidentMonthlyStat.__table__
+    accidents = Accident.__table__
+    year = extract('year', accidents.c.date)
+    month = extract('month', accidents.c.date)
+    location = func.coalesce(accidents.c.location, '')
+    severity = func.coalesce(accidents.c.severity, '')
+
+    if connection.dialect.name == 'postgresql':
+        # 같은 월을 갱신하는 트랜잭션이 동시에 DELETE 후 INSERT하면 (READ COMMITTED에서 상대가 커밋한
+        # 행을 지우지 못해) 유니크 제약 위반이 난다. 월마다 트랜잭션 단위 잠금을 정렬된 순서로 잡아
+        # 차례로 재계산한다. 잠금을 얻은 뒤의 문장은 앞선 트랜잭션이 커밋한 사고와 집계 행을 본다.
+        for y, m in months:
+            connection.execute(select(func.pg_advisory_xact_lock(ROLLUP_LOCK_NAMESPACE, y * 100 + m)))
+    connection.execute(stats.delete().where(tuple_(stats.c.year, stats.c.month).in_(months)))
+    month_filter = or_(*[
+        accidents.c.date.between(date(y, m, 1), date(y, m, calendar.monthrange(y, m)[1]))
+        for y, m in months
+    ])
+    connection.execute(stats.insert().from_select(
+        ['year', 'month', 'location', 'severity', 'count'],
+        select(year, month, location, severity, func.count(accidents.c.id))
+        .where(month_filter)
+        .group_by(year, month, location, severity)
+    ))
+
+
+@event.listens_for(Session, 'after_flush')
+def _refresh_on_flush(session, flush_context):
+    months: Set[Month] = set()
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, Accident):
+            months |= _months_of(obj)
+    if months:
+        _refresh_months(session.connection(), months)
+
+
+def _parse_bound(value: Optional[str], end: bool) -> Tuple[Optional[date], bool]:
+    """'YYYY-MM' 또는 'YYYY-MM-DD'를 날짜로 변환. (날짜, 월 경계 여부) 반환. 형식 오류는 ValueError"""
+    if not value:
+        return None, True
+    parts = [int(p) for p in value.split('-')]
+    if len(parts) == 2:
+        y, m = parts
+        return date(y, m, calendar.monthrange(y, m)[1] if end else 1), True
+    if len(parts) == 3:
+        d = date(*parts)
+        boundary = d.day == calendar.monthrange(d.year, d.month)[1] if end else d.day == 1
+        return d, boundary
+    raise ValueError(value)
+
+
+class AccidentStatsService:
+    """사고 통계 서비스 클래스"""
+
+    @staticmethod
+    def rebuild() -> None:
+        """집계 테이블 전체 재계산 (최초 도입 시 또는 일괄 쓰기 이후)"""
+        months = {
+            (int(y), int(m)) for y, m in db.session.query(
+                extract('year', Accident.date), extract('month', Accident.date)
+            ).distinct().all()
+        }
+        db.session.query(AccidentMonthlyStat).delete()
+        _refresh_months(db.session.connection(), months)
+        db.session.commit()
+
+    @staticmethod
+    def ensure_rollup() -> bool:
+        """사고는 있는데 집계가 비어 있으면 재계산. 재계산 여부 반환"""
+        if db.session.query(AccidentMonthlyStat.id).first() is not None:
+            return False
+        if db.session.query(Accident.id).first() is None:
+            return False
+        AccidentStatsService.rebuild()
+        return True
+
+    @staticmethod
+    def get_stats(start: Optional[str] = None, end: Optional[str] = None) -> Dict:
+        """기간 내 월별/장소별/심각도별 사고 건수. start/end는 'YYYY-MM' 또는 'YYYY-MM-DD'"""
+        start_date, start_aligned = _parse_bound(start, end=False)
+        end_date, end_aligned = _parse_bound(end, end=True)
+        if start_date and end_date and start_date > end_date:
+            raise ValueError('시작일이 종료일보다 늦습니다.')
+
+        if start_aligned and end_aligned:
+            rows, source = AccidentStatsService._from_rollup(start_date, end_date), 'rollup'
+        else:
+            rows, source = AccidentStatsService._from_accidents(start_date, end_date), 'accidents'
+
+        by_month: Dict[str, int] = {}
+        by_location: Dict[str, int] = {}
+        by_severity: Dict[str, int] = {}
+        by_month_severity: Dict[str, Dict[str, int]] = {}
+        for y, m, loc, sev, count in rows:
+            key = f'{int(y):04d}-{int(m):02d}'
+            loc = loc or UNSPECIFIED
+            sev = sev or UNSPECIFIED
+            by_month[key] = by_month.get(key, 0) + count
+            by_location[loc] = by_location.get(loc, 0) + count
+            by_severity[sev] = by_severity.get(sev, 0) + count
+            month_severity = by_month_severity.setdefault(key, {})
+            month_severity[sev] = month_severity.get(sev, 0) + count
+
+        return {
+            'start': start_date.strftime('%Y-%m-%d') if start_date else None,
+            'end': end_date.strftime('%Y-%m-%d') if end_date else None,
+            'source': source,
+            'total': sum(by_month.values()),
+            'by_month': by_month,
+            'by_location': by_location,
+            'by_severity': by_severity,
+            'by_month_severity': by_month_severity
+        }
+
+    @staticmethod
+    def _from_rollup(start_date: Optional[date], end_date: Optional[date]):
+        query = db.session.query(
+            AccidentMonthlyStat.year, AccidentMonthlyStat.month, AccidentMonthlyStat.location,
+            AccidentMonthlyStat.severity, AccidentMonthlyStat.count
+        )
+        if start_date:
+            query = query.filter(or_(
+                AccidentMonthlyStat.year > start_date.year,
+                and_(AccidentMonthlyStat.year == start_date.year, AccidentMonthlyStat.month >= start_date.month)
+            ))
+        if end_date:
+            query = query.filter(or_(
+                AccidentMonthlyStat.year < end_date.year,
+                and_(AccidentMonthlyStat.year == end_date.year, AccidentMonthlyStat.month <= end_date.month)
+            ))
+        return query.order_by(AccidentMonthlyStat.year, AccidentMonthlyStat.month).all()
+
+    @staticmethod
+    def _from_accidents(start_date: Optional[date], end_date: Optional[date]):
+        year = extract('year', Accident.date)
+        month = extract('month', Accident.date)
+        location = func.coalesce(Accident.location, literal(''))
+        severity = func.coalesce(Accident.severity, literal(''))
+        query = db.session.query(year, month, location, severity, func.count(Accident.id))
+        if start_date:
+            query = query.filter(Accident.date >= start_date)
+        if end_date:
+            query = query.filter(Accident.date <= end_date)
+        return query.group_by(year, month, location, severity).order_by(year, month).all()
@@ -0,0 +1,284 @@
+"""
+배치 API 서비스
+
+주간 일정/장비 캘린더 화면이 드래그, 수정, 삭제마다 한 번씩 보내던 요청을 묶어서
+처리한다. 연산 목록을 순서대로 하나의 트랜잭션에서 실행하고 연산별 결과를 돌려준다.
+
+연산 형식:
+    {"entity": "reservation", "op": "update", "id": 12, "data": {"start_date": "2025-06-03"}}
+
+- entity: reservation, usage_log, schedule, inspection
+- op: create, update, delete
+- update는 data에 전달된 필드만 반영한다 (부분 수정)
+- id에 "$0"처럼 쓰면 같은 배치에서 앞선 같은 대상의 create 연산(0번)이 만든 id를 가리킨다
+- atomic(기본)이면 하나라도 실패할 때 전체를 롤백하고, atomic이 아니면 연산마다
+  SAVEPOINT를 두어 실패한 연산만 되돌리고 나머지는 커밋한다
+"""
+from datetime import datetime, time, timedelta
+from typing import Any, Dict, List, Optional
+
+from database import db, Equipment, EquipmentInspection, Reservation, UsageLog, WeeklyScheduleNew
+from services.week_service import WeekService
+from utils.date_utils import parse_date, get_inspection_status
+
+OPERATIONS = ('create', 'update', 'delete')
+
+
+class BatchError(ValueError):
+    """연산 하나의 실패 (상태 코드 포함)"""
+
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.status = status
+
+
+def _parse_time(value: Any) -> Optional[time]:
+    if not value:
+        return None
+    text = str(value)
+    try:
+        return datetime.strptime(text, '%H:%M:%S' if text.count(':') == 2 else '%H:%M').time()
+    except ValueError:
+        raise BatchError(f'시간 형식이 올바르지 않습니다: {text}')
+
+
+def _parse_required_date(value: Any, label: str):
+    parsed = parse_date(str(value)) if value else None
+    if parsed is None:
+        raise BatchError(f'{label}이(가) 올바르지 않습니다: {value}')
+    return parsed
+
+
+def _equipment_name(data: Dict[str, Any]) -> Optional[str]:
+    """equipment_id가 있으면 equipment_name으로 변환 (단건 API와 동일)"""
+    if data.get('equipment_id'):
+        equipment = db.session.get(Equipment, int(data['equipment_id']))
+        if equipment is None:
+            raise BatchError('존재하지 않는 장비입니다.')
+        return equipment.name
+    return data.get('equipment_name')
+
+
+def _set_fields(obj, data: Dict[str, Any], fields: Dict[str, str]) -> None:
+    for key, attribute in fields.items():
+        if key in data:
+            setattr(obj, attribute, data[key])
+
+
+def apply_reservation(reservation: Reservation, data: Dict[str, Any], creating: bool) -> None:
+    if creating or 'equipment_id' in data or 'equipment_name' in data:
+        reservation.equipment_name = _equipment_name(data)
+    _set_fields(reservation, data, {'reserver': 'reserver', 'purpose': 'purpose', 'status': 'status', 'notes': 'notes'})
+    if creating or 'start_date' in data:
+        reservation.start_date = _parse_required_date(data.get('start_date'), '시작일')
+    if creating or 'end_date' in data:
+        reservation.end_date = parse_date(data.get('end_date')) or reservation.start_date
+    if 'start_time' in data:
+        reservation.start_time = _parse_time(data['start_time'])
+    if 'end_time' in data:
+        reservation.end_time = _parse_time(data['end_time'])
+    if reservation.end_date < reservation.start_date:
+        raise BatchError('종료일이 시작일보다 빠릅니다.')
+    if creating:
+        reservation.status = reservation.status or '예약'
+        reservation.created_date = datetime.now()
+
+
+def apply_usage_log(log: UsageLog, data: Dict[str, Any], creating: bool) -> None:
+    if creating or 'equipment_id' in data or 'equipment_name' in data:
+        log.equipment_name = _equipment_name(data)
+    _set_fields(log, data, {
+        'user': 'user', 'purpose': 'purpose', 'notes': 'notes', 'issues': 'issues',
+        'condition_before': 'condition_before', 'condition_after': 'condition_after',
+    })
+    if creating or 'usage_date' in data:
+        log.usage_date = _parse_required_date(data.get('usage_date'), '사용일')
+    if 'start_time' in data:
+        log.start_time = _parse_time(data['start_time'])
+    if 'end_time' in data:
+        log.end_time = _parse_time(data['end_time'])
+    if creating:
+        log.created_date = datetime.now()
+
+
+def apply_inspection(inspection: EquipmentInspection, data: Dict[str, Any], creating: bool) -> None:
+    if creating or 'equipment_id' in data:
+        equipment = db.session.get(Equipment, int(data.get('equipment_id') or 0))
+        if equipment is None:
+            raise BatchError('존재하지 않는 장비입니다.')
+        inspection.equipment_id = equipment.id
+    _set_fields(inspection, data, {
+        'inspector': 'inspector', 'inspection_type': 'inspection_type', 'result': 'result',
+        'condition_before': 'condition_before', 'condition_after': 'condition_after',
+        'findings': 'findings', 'actions_taken': 'actions_taken', 'notes': 'notes',
+    })
+    if creating or 'inspection_date' in data:
+        inspection.inspection_date = _parse_required_date(data.get('inspection_date'), '점검일')
+    if data.get('next_inspection_date'):
+        inspection.next_inspection_date = _parse_required_date(data['next_inspection_date'], '다음 점검일')
+    if not creating:
+        return
+
+    inspection.inspection_type = inspection.inspection_type or '정기점검'
+    inspection.result = inspection.result or '정상'
+    if inspection.next_inspection_date is None:
+        inspection.next_inspection_date = inspection.inspection_date + timedelta(days=365)
+    # 점검 기록 추가 API와 같이 장비의 점검일/상태도 갱신
+    equipment = db.session.get(Equipment, inspection.equipment_id)
+    equipment.last_inspection_date = inspection.inspection_date
+    equipment.next_inspection_date = inspection.next_inspection_date
+    equipment.inspection_status = get_inspection_status(inspection.next_inspection_date)
+
+
+def apply_schedule_changes(schedule: WeeklyScheduleNew, data: Dict[str, Any]) -> Optional[str]:
+    """요청 데이터 중 전달된 필드만 반영. 주차 이동 시 오류 메시지를 반환"""
+    if 'week' in data:
+        current = WeekService.get_week_key(schedule.week_id) or (None, None, None)
+        try:
+            year = int(data.get('year') or current[0])
+            month = int(data.get('month') or current[1])
+            week = int(data.get('week'))
+        except (TypeError, ValueError):
+            return '주차 정보가 올바르지 않습니다.'
+        week_id = WeekService.get_week_id(year, month, week)
+        if week_id is None:
+            return '지원하지 않는 주차입니다.'
+        schedule.week_id = week_id
+        schedule.start_week_id = week_id
+        schedule.end_week_id = week_id
+    if 'task' in data:
+        schedule.title = data.get('task')
+    if 'notes' in data:
+        schedule.description = data.get('notes')
+    if 'project' in data:
+        schedule.project_name = data.get('project')
+    if 'researcher' in data:
+        schedule.researcher_name = data.get('researcher')
+    if 'priority' in data:
+        schedule.priority = data.get('priority') or '보통'
+    if 'status' in data:
+        schedule.status = data.get('status')
+    return None
+
+
+def apply_schedule(schedule: WeeklyScheduleNew, data: Dict[str, Any], creating: bool) -> None:
+    if creating and 'week' not in data:
+        raise BatchError('주차 정보가 올바르지 않습니다.')
+    error = apply_schedule_changes(schedule, data)
+    if error:
+        raise BatchError(error)
+    if creating:
+        schedule.priority = schedule.priority or '보통'
+
+
+# entity 이름: (모델, 필드 반영 함수, 표시 이름)
+ENTITIES: Dict[str, tuple] = {
+    'reservation': (Reservation, apply_reservation, '예약'),
+    'usage_log': (UsageLog, apply_usage_log, '사용일지'),
+    'schedule': (WeeklyScheduleNew, apply_schedule, '일정'),
+    'inspection': (EquipmentInspection, apply_inspection, '점검 기록'),
+}
+
+
+class BatchService:
+    """여러 엔티티의 생성/수정/삭제 연산을 하나의 트랜잭션으로 실행"""
+
+    @staticmethod
+    def validate(operations: Any, max_operations: int) -> Optional[str]:
+        """요청 형식 검증. 문제가 있으면 오류 메시지 반환"""
+        if not isinstance(operations, list) or not operations:
+            return '연산 목록(operations)이 필요합니다.'
+        if len(operations) > max_operations:
+            return f'한 번에 최대 {max_operations}개 연산까지 처리할 수 있습니다.'
+        for index, operation in enumerate(operations):
+            if not isinstance(operation, dict):
+                return f'{index}번 연산 형식이 올바르지 않습니다.'
+            if operation.get('entity') not in ENTITIES:
+                return f"{index}번 연산: 지원하지 않는 대상입니다: {operation.get('entity')}"
+            if operation.get('op') not in OPERATIONS:
+                return f"{index}번 연산: 지원하지 않는 연산입니다: {operation.get('op')}"
+            if operation['op'] != 'create' and operation.get('id') is None:
+                return f'{index}번 연산: id가 필요합니다.'
+            if not isinstance(operation.get('data', {}), dict):
+                return f'{index}번 연산: data는 객체여야 합니다.'
+        return None
+
+    @staticmethod
+    def run(operations: List[Dict[str, Any]], atomic: bool = True) -> Dict[str, Any]:
+        """
+        연산을 순서대로 실행하고 커밋
+
+        반환: {'success', 'results': [연산별 {'success', 'id'} 또는 {'success': False, 'error'}],
+               'failed_index'(atomic 실패 시), 'error', 'status'}
+        """
+        results: List[Dict[str, Any]] = []
+        for index, operation in enumerate(operations):
+            try:
+                if atomic:
+                    results.append(BatchService._execute(operation, operations, results))
+                else:
+                    with db.session.begin_nested():
+                        results.append(BatchService._execute(operation, operations, results))
+            except Exception as e:
+                status = e.status if isinstance(e, BatchError) else 400
+                if atomic:
+                    db.session.rollback()
+                    return {
+                        'success': False,
+                        'failed_index': index,
+                        'error': f'{index}번 연산 실패: {e}',
+                        'status': status,
+                        'results': results + [{'success': False, 'error': str(e)}],
+                    }
+                results.append({'success': False, 'error': str(e)})
+
+        try:
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            return {'success': False, 'failed_index': None, 'error': str(e), 'status': 400, 'results': results}
+        return {'success': True, 'results': results}
+
+    @staticmethod
+    def _resolve_id(value: Any, entity: str, operations: List[Dict[str, Any]],
+                    results: List[Dict[str, Any]]) -> int:
+        """"$n" 참조를 앞선 같은 대상의 create 결과 id로 바꾼다"""
+        if isinstance(value, str) and value.startswith('$'):
+            try:
+                index = int(value[1:])
+            except ValueError:
+                raise BatchError(f'참조할 수 없는 id입니다: {value}')
+            if not 0 <= index < len(results):
+                raise BatchError(f'참조할 수 없는 id입니다: {value}')
+            referenced, result = operations[index], results[index]
+            if referenced['op'] != 'create' or referenced['entity'] != entity or not result['success']:
+                raise BatchError(f'참조할 수 없는 id입니다: {value}')
+            return result['id']
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            raise BatchError(f'id가 올바르지 않습니다: {value}')
+
+    @staticmethod
+    def _execute(operation: Dict[str, Any], operations: List[Dict[str, Any]],
+                 results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        model, apply, label = ENTITIES[operation['entity']]
+        op = operation['op']
+        data = operation.get('data') or {}
+
+        if op == 'create':
+            obj = model()
+            apply(obj, data, True)
+            db.session.add(obj)
+        else:
+            obj_id = BatchService._resolve_id(operation.get('id'), operation['entity'], operations, results)
+            obj = db.session.get(model, obj_id)
+            if obj is None:
+                raise BatchError(f'{label}이(가) 존재하지 않습니다: {obj_id}', 404)
+            if op == 'update':
+                apply(obj, data, False)
+            else:
+                db.session.delete(obj)
+        # 제약 조건 오류가 해당 연산의 결과로 잡히고 create의 id를 알 수 있도록 연산마다 flush
+        db.session.flush()
+        return {'success': True, 'id': obj.id}
@@ -0,0 +1,142 @@
+"""
+테이블 버전 기반 캐시 서비스
+
+추적 대상 테이블에 쓰기가 발생하면 같은 트랜잭션 안에서 table_versions의
+버전을 1 증가시킨다. 캐시는 계산 당시의 버전을 함께 저장하고, 조회 시
+버전(PK 조회 1회)만 비교해 유효성을 판단하므로 여러 워커/호스트에서도
+쓰기 직후 오래된 결과를 돌려주지 않는다.
+"""
+import threading
+from collections import OrderedDict
+from itertools import chain
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Set, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from database import db, TableVersion
+
+_tracked_tables: Set[str] = set()
+
+
+def track_tables(*table_names: str) -> None:
+    """쓰기 시 버전을 증가시킬 테이블 등록"""
+    _tracked_tables.update(table_names)
+
+
+def bump_versions(connection, table_names: Iterable[str]) -> None:
+    """현재 트랜잭션 안에서 테이블 버전 증가 (행이 없으면 생성)"""
+    names = sorted(set(table_names))
+    if not names:
+        return
+    table = TableVersion.__table__
+    result = connection.execute(
+        table.update().where(table.c.table_name.in_(names)).values(version=table.c.version + 1)
+    )
+    if result.rowcount == len(names):
+        return
+    existing = {row[0] for row in connection.execute(
+        table.select().with_only_columns(table.c.table_name).where(table.c.table_name.in_(names))
+    )}
+    missing = [{'table_name': name, 'version': 1} for name in names if name not in existing]
+    try:
+        with connection.begin_nested():
+            connection.execute(table.insert(), missing)
+    except IntegrityError:
+        # 다른 트랜잭션이 먼저 생성한 경우 - 그 쪽의 증가로 무효화됨
+        pass
+
+
+def current_versions(table_names: Iterable[str]) -> Tuple[int, ...]:
+    names = tuple(table_names)
+    rows = dict(db.session.query(TableVersion.table_name, TableVersion.version)
+                .filter(TableVersion.table_name.in_(names)).all())
+    return tuple(rows.get(name, 0) for name in names)
+
+
+@event.listens_for(Session, 'after_flush')
+def _bump_on_flush(session, flush_context):
+    if not _tracked_tables:
+        return
+    names = {
+        obj.__table__.name
+        for obj in chain(session.new, session.dirty, session.deleted)
+        if getattr(obj, '__table__', None) is not None and obj.__table__.name in _tracked_tables
+    }
+    if names:
+        bump_versions(session.connection(), names)
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _bump_on_bulk_write(orm_execute_state):
+    # Query.update()/delete() 등 flush를 거치지 않는 일괄 쓰기
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and mapper.local_table.name in _tracked_tables:
+        bump_versions(orm_execute_state.session.connection(), [mapper.local_table.name])
+
+
+class VersionedCache:
+    """테이블 버전이 바뀌면 자동으로 무효화되는 워커 단위 LRU 캐시"""
+
+    def __init__(self, *table_names: str, max_entries: int = 256):
+        self.table_names = tuple(sorted(table_names))
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[Hashable, Tuple[Tuple[int, ...], Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+        track_tables(*table_names)
+
+    def version(self) -> Tuple[int, ...]:
+        return current_versions(self.table_names)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Tuple[Any, bool]:
+        """(값, 캐시 사용 여부) 반환"""
+        version = self.version()
+        hit, value = self._get(key, version)
+        if hit:
+            return value, True
+
+        value = compute()
+        self._put(key, version, value)
+        return value, False
+
+    def get_many(self, keys: Iterable[Hashable],
+                 compute_missing: Callable[[List[Hashable]], Dict[Hashable, Any]]) -> Tuple[Dict[Hashable, Any], int]:
+        """여러 키를 한 번에 조회. 캐시에 없는 키만 compute_missing으로 일괄 계산. (값, 캐시 적중 수) 반환"""
+        version = self.version()
+        values = {}
+        missing = []
+        for key in dict.fromkeys(keys):
+            hit, value = self._get(key, version)
+            if hit:
+                values[key] = value
+            else:
+                missing.append(key)
+        if missing:
+            computed = compute_missing(missing)
+            for key in missing:
+                value = computed.get(key)
+                self._put(key, version, value)
+                values[key] = value
+        return values, len(values) - len(missing)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _get(self, key: Hashable, version: Tuple[int, ...]) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != version:
+                return False, None
+            self._entries.move_to_end(key)
+            return True, entry[1]
+
+    def _put(self, key: Hashable, version: Tuple[int, ...], value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (version, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
@@ -0,0 +1,348 @@
+"""
+변경 이벤트 서비스 (Server-Sent Events 푸시)
+
+예약/주간 일정 등을 여러 사람이 동시에 보고 있을 때 주기적으로 목록을 다시 불러오지 않도록,
+커밋된 변경을 {entity, id, op, version} 이벤트로 같은 호스트의 모든 워커에 전달한다.
+
+- 수집: flush 시 추적 대상 모델의 생성/수정/삭제를 세션에 모아 두고, 최상위 트랜잭션이
+  커밋되면 발행한다. 롤백된 트랜잭션(SAVEPOINT 포함)의 변경은 버린다.
+  Query.delete()나 여러 행 INSERT처럼 행을 알 수 없는 일괄 쓰기는 id 없이 op='bulk'로 보낸다.
+- version: 해당 테이블의 table_versions 값 (cache_service). 같은 테이블의 이벤트는 version이
+  커질수록 나중 변경이다.
+- 전달: 구독자가 있는 워커마다 EVENTS_SOCKET_DIR 아래에 UNIX 데이터그램 소켓을 하나 열고,
+  커밋한 프로세스는 디렉터리의 모든 소켓으로 이벤트를 보낸다 (별도 브로커 없음, 단일 호스트).
+  종료된 워커가 남긴 소켓 파일은 발행 시 지운다.
+- 구독: 워커의 수신 스레드(gevent 워커에서는 greenlet)가 구독자별 큐에 넣고, 최근 이벤트를
+  EVENTS_BUFFER_SIZE개 보관해 재접속(Last-Event-ID) 시 놓친 이벤트를 다시 보낸다. 보관 범위를
+  벗어났거나 구독자 큐가 넘치면 reset을 보내 클라이언트가 목록 전체를 다시 불러오게 한다.
+"""
+import atexit
+import json
+import os
+import queue
+import socket
+import threading
+import time
+import uuid
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from database import EquipmentInspection, Reservation, TableVersion, UsageLog, WeeklyScheduleNew
+from services.cache_service import track_tables
+
+# 테이블 이름 → 이벤트 entity 이름 (배치 API의 entity 이름과 같음)
+EVENT_ENTITIES: Dict[str, str] = {
+    Reservation.__tablename__: 'reservation',
+    WeeklyScheduleNew.__tablename__: 'schedule',
+    UsageLog.__tablename__: 'usage_log',
+    EquipmentInspection.__tablename__: 'inspection',
+}
+
+# 데이터그램 하나에 담는 이벤트 수 (큰 배치 커밋도 소켓 버퍼 한도 안에 들도록)
+EVENTS_PER_DATAGRAM = 50
+MAX_DATAGRAM_SIZE = 65536
+
+# 구독자 큐가 넘쳤을 때 get()이 돌려주는 값
+RESET = object()
+
+_EVENTS_KEY = 'change_events'
+_MARKS_KEY = 'change_event_marks'
+
+
+class Subscription:
+    """스트림 연결 하나의 이벤트 큐"""
+
+    def __init__(self, entities: Optional[Set[str]], maxsize: int):
+        self.entities = entities
+        self.overflowed = False
+        self._queue: 'queue.Queue[Dict[str, Any]]' = queue.Queue(maxsize)
+
+    def wants(self, change: Dict[str, Any]) -> bool:
+        return self.entities is None or change['entity'] in self.entities
+
+    def offer(self, change: Dict[str, Any]) -> None:
+        try:
+            self._queue.put_nowait(change)
+        except queue.Full:
+            self.overflowed = True
+
+    def get(self, timeout: float):
+        """다음 이벤트. timeout 동안 없으면 None, 큐가 넘쳤으면 RESET"""
+        if self.overflowed:
+            return RESET
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+class ChangeEventBus:
+    """워커 프로세스 단위 변경 이벤트 발행/수신"""
+
+    def __init__(self, app=None):
+        self.app = None
+        self.enabled = False
+        self.socket_dir: Optional[str] = None
+        self.buffer_size = 500
+        self.queue_size = 200
+        self._reset()
+        os.register_at_fork(after_in_child=self._reset)
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app) -> None:
+        self.app = app
+        self.enabled = app.config.get('EVENTS_ENABLED', True)
+        self.socket_dir = app.config.get('EVENTS_SOCKET_DIR') or os.path.join(app.instance_path, 'events')
+        self.buffer_size = int(app.config.get('EVENTS_BUFFER_SIZE', self.buffer_size))
+        self.queue_size = int(app.config.get('EVENTS_SUBSCRIBER_QUEUE_SIZE', self.queue_size))
+        self._recent = deque(maxlen=self.buffer_size)
+        app.extensions['change_events'] = self
+        if self.enabled:
+            track_tables(*EVENT_ENTITIES)
+        atexit.register(self.close)
+
+    def _reset(self) -> None:
+        """초기화 (fork 이후 자식 프로세스는 부모의 소켓/수신 스레드를 물려받지 않는다)"""
+        self._lock = threading.Lock()
+        self._sender: Optional[socket.socket] = None
+        self._receiver: Optional[socket.socket] = None
+        self._receiver_path: Optional[str] = None
+        self._subscribers: Set[Subscription] = set()
+        self._recent: deque = deque(maxlen=self.buffer_size)
+        self._covered_from = 0
+        self.dropped = 0
+
+    # 발행 ------------------------------------------------------------------
+
+    def publish(self, changes: List[Dict[str, Any]]) -> None:
+        """이벤트에 id(발행 시각, ns)를 붙여 구독 중인 모든 워커로 전송. 실패해도 예외를 내지 않는다"""
+        if not changes or not self.socket_dir:
+            return
+        try:
+            targets = [os.path.join(self.socket_dir, name)
+                       for name in os.listdir(self.socket_dir) if name.endswith('.sock')]
+        except FileNotFoundError:
+            return
+        if not targets:
+            return
+
+        base_id = time.time_ns()
+        for index, change in enumerate(changes):
+            change['event_id'] = base_id + index
+        payloads = [
+            json.dumps(changes[offset:offset + EVENTS_PER_DATAGRAM], ensure_ascii=False).encode('utf-8')
+            for offset in range(0, len(changes), EVENTS_PER_DATAGRAM)
+        ]
+
+        sender = self._sender_socket()
+        for path in targets:
+            for payload in payloads:
+                try:
+                    sender.sendto(payload, path)
+                except (ConnectionRefusedError, FileNotFoundError):
+                    # 종료된 워커의 소켓 파일
+                    try:
+                        os.unlink(path)
+                    except OSError:
+                        pass
+                    break
+                except BlockingIOError:
+                    # 수신 측 소켓 버퍼가 가득 참 - 해당 워커의 구독자는 이 이벤트를 놓친다
+                    self.dropped += 1
+                except OSError as e:
+                    self._log_error(f'변경 이벤트 전송 실패 ({path}): {e}')
+                    break
+
+    def _sender_socket(self) -> socket.socket:
+        if self._sender is None:
+            sender = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            sender.setblocking(False)
+            self._sender = sender
+        return self._sender
+
+    # 구독 ------------------------------------------------------------------
+
+    def subscribe(self, entities: Optional[Iterable[str]] = None,
+                  last_event_id: Optional[int] = None):
+        """
+        구독 시작. (Subscription, 다시 보낼 이벤트 목록 또는 RESET) 반환
+
+        last_event_id가 이 워커의 보관 범위보다 오래됐으면 놓친 이벤트를 알 수 없으므로 RESET
+        """
+        self._ensure_receiver()
+        subscription = Subscription(set(entities) if entities else None, self.queue_size)
+        with self._lock:
+            self._subscribers.add(subscription)
+            if last_event_id is None:
+                return subscription, []
+            if last_event_id < self._covered_from:
+                return subscription, RESET
+            return subscription, [change for change in self._recent
+                                  if change['event_id'] > last_event_id and subscription.wants(change)]
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def _ensure_receiver(self) -> None:
+        if self._receiver is not None:
+            return
+        with self._lock:
+            if self._receiver is not None:
+                return
+            os.makedirs(self.socket_dir, exist_ok=True)
+            path = os.path.join(self.socket_dir, f'{os.getpid()}-{uuid.uuid4().hex[:8]}.sock')
+            receiver = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            receiver.bind(path)
+            self._receiver = receiver
+            self._receiver_path = path
+            # 수신을 시작한 시점 이전의 이벤트는 보관하지 않았으므로 재전송할 수 없다
+            self._covered_from = time.time_ns()
+            threading.Thread(target=self._receive, args=(receiver,), name='change-events', daemon=True).start()
+
+    def _receive(self, receiver: socket.socket) -> None:
+        while True:
+            try:
+                data = receiver.recv(MAX_DATAGRAM_SIZE)
+            except OSError:
+                return  # close()
+            try:
+                changes = json.loads(data)
+            except ValueError:
+                continue
+            with self._lock:
+                for change in changes:
+                    if len(self._recent) == self._recent.maxlen:
+                        self._covered_from = self._recent[0]['event_id']
+                    self._recent.append(change)
+                    for subscription in self._subscribers:
+                        if subscription.wants(change):
+                            subscription.offer(change)
+
+    def close(self) -> None:
+        """수신 소켓을 닫고 소켓 파일 삭제"""
+        receiver, path = self._receiver, self._receiver_path
+        self._receiver = self._receiver_path = None
+        if receiver is not None:
+            receiver.close()
+        if path:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+    def _log_error(self, message: str) -> None:
+        if self.app is not None:
+            self.app.logger.error(message)
+
+
+change_events = ChangeEventBus()
+
+
+# 세션 이벤트 --------------------------------------------------------------------
+
+def _pending(session) -> List[Dict[str, Any]]:
+    return session.info.setdefault(_EVENTS_KEY, [])
+
+
+def _read_versions(connection, table_names: Iterable[str]) -> Dict[str, int]:
+    table = TableVersion.__table__
+    return dict(connection.execute(
+        table.select().with_only_columns(table.c.table_name, table.c.version)
+        .where(table.c.table_name.in_(sorted(set(table_names))))
+    ).all())
+
+
+def _object_id(obj) -> Any:
+    # 삭제된 객체는 속성을 다시 읽지 않도록 identity key에서 id를 꺼낸다
+    key = inspect(obj).key
+    return key[1][0] if key is not None else obj.id
+
+
+# cache_service의 버전 증가 리스너(import 시 등록)보다 뒤에 실행되므로 증가된 버전을 읽는다
+@event.listens_for(Session, 'after_flush')
+def _collect_on_flush(session, flush_context):
+    if not change_events.enabled:
+        return
+    changes = []
+    for op, objects in (('create', session.new), ('update', session.dirty), ('delete', session.deleted)):
+        for obj in objects:
+            table_name = getattr(obj, '__tablename__', None)
+            if table_name not in EVENT_ENTITIES:
+                continue
+            if op == 'update' and not session.is_modified(obj, include_collections=False):
+                continue
+            changes.append((table_name, _object_id(obj), op))
+    if not changes:
+        return
+    versions = _read_versions(session.connection(), (table_name for table_name, _, _ in changes))
+    _pending(session).extend(
+        {'entity': EVENT_ENTITIES[table_name], 'id': obj_id, 'op': op, 'version': versions.get(table_name)}
+        for table_name, obj_id, op in changes
+    )
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _collect_bulk_write(orm_execute_state):
+    if not change_events.enabled:
+        return
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert):
+        return
+    mapper = orm_execute_state.bind_mapper
+    table_name = mapper.local_table.name if mapper is not None else None
+    if table_name not in EVENT_ENTITIES:
+        return
+    session = orm_execute_state.session
+    versions = _read_versions(session.connection(), [table_name])
+    _pending(session).append(
+        {'entity': EVENT_ENTITIES[table_name], 'id': None, 'op': 'bulk', 'version': versions.get(table_name)}
+    )
+
+
+@event.listens_for(Session, 'after_transaction_create')
+def _mark_savepoint(session, transaction):
+    if transaction.nested and _EVENTS_KEY in session.info:
+        session.info.setdefault(_MARKS_KEY, {})[transaction] = len(session.info[_EVENTS_KEY])
+
+
+@event.listens_for(Session, 'after_soft_rollback')
+def _discard_rolled_back(session, previous_transaction):
+    if not previous_transaction.nested:
+        return
+    # SAVEPOINT 이후에 모은 이벤트만 버린다
+    mark = session.info.get(_MARKS_KEY, {}).pop(previous_transaction, 0)
+    if _EVENTS_KEY in session.info:
+        del session.info[_EVENTS_KEY][mark:]
+
+
+@event.listens_for(Session, 'after_commit')
+def _publish_on_commit(session):
+    if session.get_nested_transaction() is not None:
+        return  # SAVEPOINT 커밋 - 최상위 트랜잭션 커밋 때 발행
+    changes = session.info.pop(_EVENTS_KEY, None)
+    session.info.pop(_MARKS_KEY, None)
+    if not changes:
+        return
+    # 같은 행의 여러 변경은 마지막 것만 보낸다 (생성 후 수정은 생성, 일괄 쓰기는 테이블당 하나)
+    latest: Dict[tuple, Dict[str, Any]] = {}
+    for change in changes:
+        key = (change['entity'], change['id'])
+        previous = latest.pop(key, None)
+        if previous is not None and previous['op'] == 'create' and change['op'] == 'update':
+            change['op'] = 'create'
+        latest[key] = change
+    change_events.publish(list(latest.values()))
+
+
+@event.listens_for(Session, 'after_transaction_end')
+def _clear_on_end(session, transaction):
+    if transaction.parent is None:
+        session.info.pop(_EVENTS_KEY, None)
+        session.info.pop(_MARKS_KEY, None)
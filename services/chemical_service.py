@@ -0,0 +1,369 @@
+"""
+화학물질 재고 서비스
+
+quantity는 자유 입력 문자열이므로 저장 시 수량(quantity_amount)과 기준 단위
+(quantity_unit)로 분리해 두고, 유효기간 임박 목록과 보관 위치별 합계는
+인덱스를 사용하는 집계 쿼리로 계산한다. 주기 작업(chemicals.expiry_scan)이 기본
+조회 기간의 집계를 미리 계산해 공유 스냅샷으로 저장하며, chemicals 테이블이
+변경되면 다음 조회 시 다시 계산한다.
+"""
+import json
+import os
+import re
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from flask import current_app
+from sqlalchemy import bindparam, func
+
+from database import db, Chemical, ChemicalInventorySnapshot
+from services.cache_service import VersionedCache, bump_versions, current_versions
+from services.file_store import FileStore
+
+# 단위 표기 -> (기준 단위, 환산 계수)
+UNIT_ALIASES = {
+    'l': ('L', 1.0), 'ℓ': ('L', 1.0), 'liter': ('L', 1.0), 'liters': ('L', 1.0),
+    'litre': ('L', 1.0), 'litres': ('L', 1.0), '리터': ('L', 1.0),
+    'ml': ('L', 0.001), '㎖': ('L', 0.001), 'cc': ('L', 0.001), '밀리리터': ('L', 0.001),
+    'ul': ('L', 0.000001), 'μl': ('L', 0.000001), 'µl': ('L', 0.000001),
+    'kg': ('kg', 1.0), '㎏': ('kg', 1.0), '킬로그램': ('kg', 1.0),
+    'g': ('kg', 0.001), '그램': ('kg', 0.001),
+    'mg': ('kg', 0.000001), '㎎': ('kg', 0.000001),
+    'ea': ('ea', 1.0), '개': ('ea', 1.0), '병': ('ea', 1.0), '통': ('ea', 1.0),
+    'bottle': ('ea', 1.0), 'bottles': ('ea', 1.0), 'btl': ('ea', 1.0),
+    'box': ('ea', 1.0), 'boxes': ('ea', 1.0), '박스': ('ea', 1.0),
+}
+
+# 예: "500mL", "2.5 L", "1,000 g", "3 x 500 mL", "500mL*3", "2 boxes"
+# x는 숫자 사이(공백 허용)에 있을 때만 곱셈으로 본다 ("box"의 x는 단위의 일부)
+_QUANTITY_PATTERN = re.compile(
+    r'(?:(\d+)\s*(?:[×*]|x(?=\s*\d))\s*)?(\d[\d,]*(?:\.\d+)?)\s*'
+    r'([^\d\s,;/()×*]+?(?=$|[\s\d,;/()×*]|x\s*\d))?(?:\s*[x×*]\s*(\d+))?',
+    re.IGNORECASE
+)
+
+_CAS_PATTERN = re.compile(r'^(\d{2,7})-?(\d{2})-?(\d)$')
+_CAS_IN_TEXT = re.compile(r'(?<!\d)\d{2,7}-\d{2}-\d(?!\d)')
+
+# MSDS PDF 저장소 (objects/ab/cd/<sha256>.pdf, 웹 서버가 직접 제공)
+msds_store = FileStore('msds', suffix='.pdf')
+
+# CAS 일괄 조회 시 한 번의 IN 쿼리에 넣는 최대 개수 (SQLite 바인드 변수 제한 대비)
+LOOKUP_CHUNK_SIZE = 500
+
+_inventory_cache = VersionedCache(Chemical.__tablename__)
+# CAS 키 -> 등록된 MSDS 목록 (chemicals 변경 시 무효화)
+_cas_cache = VersionedCache(Chemical.__tablename__, max_entries=4096)
+
+
+def normalize_cas(text: Optional[str]) -> Optional[str]:
+    """CAS 번호를 'NNNNNNN-NN-N' 표기로 정규화. 형식이나 체크 디지트가 틀리면 None"""
+    compact = re.sub(r'[\s\u2010-\u2015]', '', text or '').replace('－', '-')
+    match = _CAS_PATTERN.match(compact)
+    if not match:
+        return None
+    head, middle, check = match.groups()
+    head = head.lstrip('0')
+    if len(head) < 2:
+        return None
+    digits = (head + middle)[::-1]
+    if sum(int(d) * (i + 1) for i, d in enumerate(digits)) % 10 != int(check):
+        return None
+    return f'{head}-{middle}-{check}'
+
+
+def parse_quantity(text: Optional[str]) -> Tuple[Optional[float], Optional[str]]:
+    """수량 문자열을 (기준 단위 수량, 기준 단위)로 변환. 알 수 없는 단위는 입력 그대로 유지"""
+    match = _QUANTITY_PATTERN.search(text or '')
+    if not match:
+        return None, None
+    prefix_count, number, unit, suffix_count = match.groups()
+    amount = float(number.replace(',', ''))
+    amount *= int(prefix_count or 1) * int(suffix_count or 1)
+    if not unit:
+        return amount, None
+    base_unit, factor = UNIT_ALIASES.get(unit.lower(), (unit[:20], 1.0))
+    return round(amount * factor, 9), base_unit
+
+
+def msds_file_url(digest: Optional[str]) -> Optional[str]:
+    """로컬 MSDS 파일의 공개 URL (Flask를 거치지 않고 nginx 또는 WSGI 정적 파일 처리기가 응답)"""
+    if not digest:
+        return None
+    prefix = current_app.config.get('MSDS_FILES_URL_PREFIX', '/msds-files').rstrip('/')
+    return prefix + '/' + msds_store.relative_path(digest)[len('objects/'):]
+
+
+class ChemicalService:
+    """화학물질 재고 관리 서비스 클래스"""
+
+    @staticmethod
+    def apply_quantity(chem: Chemical, quantity: Optional[str]) -> None:
+        """quantity 문자열과 파싱한 수량/단위를 함께 설정"""
+        chem.quantity = quantity
+        chem.quantity_amount, chem.quantity_unit = parse_quantity(quantity)
+
+    @staticmethod
+    def apply_cas(chem: Chemical, cas_number: Optional[str]) -> None:
+        """cas_number와 검증된 정규화 키를 함께 설정"""
+        chem.cas_number = cas_number
+        chem.cas_key = normalize_cas(cas_number)
+
+    @staticmethod
+    def backfill_cas_keys(batch_size: int = 1000) -> int:
+        """CAS 키가 없는 기존 행을 배치 UPDATE로 채움. 유효한 CAS 번호로 채운 행 수 반환"""
+        table = Chemical.__table__
+        stmt = table.update().where(table.c.id == bindparam('b_id')).values(
+            cas_key=bindparam('b_key'),
+            updated_date=table.c.updated_date
+        )
+        updated = 0
+        last_id = 0
+        while True:
+            rows = db.session.query(Chemical.id, Chemical.cas_number).filter(
+                Chemical.id > last_id,
+                Chemical.cas_number.isnot(None),
+                Chemical.cas_number != '',
+                Chemical.cas_key.is_(None)
+            ).order_by(Chemical.id).limit(batch_size).all()
+            if not rows:
+                break
+            params = [
+                {'b_id': chem_id, 'b_key': key}
+                for chem_id, key in ((chem_id, normalize_cas(cas)) for chem_id, cas in rows)
+                if key
+            ]
+            if params:
+                db.session.execute(stmt, params)
+                # Core UPDATE는 세션 이벤트를 거치지 않으므로 캐시 무효화를 위해 직접 버전 증가
+                bump_versions(db.session.connection(), [Chemical.__tablename__])
+            db.session.commit()
+            updated += len(params)
+            last_id = rows[-1][0]
+        return updated
+
+    @staticmethod
+    def lookup_cas(cas_numbers: Iterable[str]) -> Dict:
+        """CAS 번호 목록을 MSDS 등록 정보로 일괄 변환 (캐시에 없는 키만 IN 쿼리로 조회)"""
+        keys = {}
+        invalid = []
+        for cas in cas_numbers:
+            key = normalize_cas(cas)
+            if key:
+                keys[cas] = key
+            else:
+                invalid.append(cas)
+
+        found, cache_hits = _cas_cache.get_many(keys.values(), ChemicalService._load_by_cas_keys)
+        results = {cas: {'cas_key': key, 'chemicals': found.get(key) or []} for cas, key in keys.items()}
+        return {
+            'results': results,
+            'not_found': [cas for cas, result in results.items() if not result['chemicals']],
+            'invalid': invalid,
+            'cache_hits': cache_hits
+        }
+
+    @staticmethod
+    def _load_by_cas_keys(keys: List[str]) -> Dict[str, List[Dict]]:
+        found: Dict[str, List[Dict]] = {key: [] for key in keys}
+        for start in range(0, len(keys), LOOKUP_CHUNK_SIZE):
+            rows = db.session.query(
+                Chemical.cas_key, Chemical.chem_id, Chemical.chemical_name, Chemical.manufacturer,
+                Chemical.hazard_class, Chemical.location, Chemical.msds_file_link, Chemical.expiry_date
+            ).filter(Chemical.cas_key.in_(keys[start:start + LOOKUP_CHUNK_SIZE])) \
+                .order_by(Chemical.cas_key, Chemical.chemical_name).all()
+            for key, chem_id, name, manufacturer, hazard_class, location, msds_link, expiry_date in rows:
+                found[key].append({
+                    'id': chem_id,
+                    'chemical_name': name,
+                    'manufacturer': manufacturer,
+                    'hazard_class': hazard_class,
+                    'location': location,
+                    'msds_file_link': msds_link,
+                    'expiry_date': expiry_date.strftime('%Y-%m-%d') if expiry_date else ''
+                })
+        return found
+
+    @staticmethod
+    def ingest_msds_files(paths: Iterable[str], keys: Optional[Dict[str, str]] = None) -> Dict:
+        """MSDS 파일을 저장소에 넣고 화학물질에 연결
+
+        파일마다 연결 키(keys[path], 없으면 파일명)에 CAS 번호가 있으면 해당 CAS의
+        모든 화학물질에, 없으면 키와 같은 chem_id의 화학물질에 연결한다.
+        같은 내용의 파일은 하나만 저장된다.
+        """
+        by_cas: Dict[str, Tuple[str, int]] = {}
+        by_chem_id: Dict[str, Tuple[str, int]] = {}
+        stored = 0
+        saved: Dict[str, str] = {}
+        for path in paths:
+            key = (keys or {}).get(path) or os.path.splitext(os.path.basename(path))[0]
+            with open(path, 'rb') as f:
+                # 연결을 커밋할 때까지 release_msds가 재사용한 파일을 지우지 않도록 pin
+                digest, size, created = msds_store.save_stream(f, session=db.session)
+            stored += int(created)
+            saved[path] = digest
+            cas_match = _CAS_IN_TEXT.search(key)
+            cas_key = normalize_cas(cas_match.group(0)) if cas_match else None
+            if cas_key:
+                by_cas[cas_key] = (digest, size)
+            else:
+                by_chem_id[key.strip()] = (digest, size)
+
+        params = []
+        for column, mapping in ((Chemical.cas_key, by_cas), (Chemical.chem_id, by_chem_id)):
+            keys_list = list(mapping)
+            for start in range(0, len(keys_list), LOOKUP_CHUNK_SIZE):
+                rows = db.session.query(Chemical.id, column, Chemical.msds_hash) \
+                    .filter(column.in_(keys_list[start:start + LOOKUP_CHUNK_SIZE])).all()
+                for chem_pk, key, old_hash in rows:
+                    digest, size = mapping[key]
+                    params.append({'b_id': chem_pk, 'b_hash': digest, 'b_size': size, 'old_hash': old_hash})
+
+        matched = {p['b_hash'] for p in params}
+        unmatched = [path for path, digest in saved.items() if digest not in matched]
+        previous = {p.pop('old_hash') for p in params}
+        if params:
+            table = Chemical.__table__
+            db.session.execute(
+                table.update().where(table.c.id == bindparam('b_id')).values(
+                    msds_hash=bindparam('b_hash'), msds_file_size=bindparam('b_size')
+                ),
+                params
+            )
+            # Core UPDATE는 세션 이벤트를 거치지 않으므로 목록 조각/CAS 캐시 무효화를 위해 직접 버전 증가
+            bump_versions(db.session.connection(), [Chemical.__tablename__])
+        db.session.commit()
+        ChemicalService.release_msds(previous | set(saved.values()))
+        return {'files': len(saved), 'stored': stored, 'chemicals': len(params), 'unmatched': unmatched}
+
+    @staticmethod
+    def release_msds(digests: Iterable[Optional[str]]) -> None:
+        """어떤 화학물질도 참조하지 않는 MSDS 파일 삭제 (커밋 이후 호출)"""
+        msds_store.delete_unreferenced(digests, ChemicalService._msds_referenced)
+
+    @staticmethod
+    def _msds_referenced(digests) -> set:
+        return {row[0] for row in db.session.query(Chemical.msds_hash)
+                .filter(Chemical.msds_hash.in_(digests)).distinct()}
+
+    @staticmethod
+    def backfill_quantities(batch_size: int = 1000) -> int:
+        """수량이 파싱되지 않은 기존 행을 배치 UPDATE로 채움. 파싱에 성공한 행 수 반환"""
+        table = Chemical.__table__
+        stmt = table.update().where(table.c.id == bindparam('b_id')).values(
+            quantity_amount=bindparam('b_amount'),
+            quantity_unit=bindparam('b_unit'),
+            # 파생 컬럼 보정이므로 수정일(onupdate)은 유지
+            updated_date=table.c.updated_date
+        )
+        updated = 0
+        last_id = 0
+        while True:
+            rows = db.session.query(Chemical.id, Chemical.quantity).filter(
+                Chemical.id > last_id,
+                Chemical.quantity.isnot(None),
+                Chemical.quantity != '',
+                Chemical.quantity_amount.is_(None)
+            ).order_by(Chemical.id).limit(batch_size).all()
+            if not rows:
+                break
+            params = []
+            for chem_id, quantity in rows:
+                amount, unit = parse_quantity(quantity)
+                if amount is not None:
+                    params.append({'b_id': chem_id, 'b_amount': amount, 'b_unit': unit})
+            if params:
+                db.session.execute(stmt, params)
+                # Core UPDATE는 세션 이벤트를 거치지 않으므로 캐시 무효화를 위해 직접 버전 증가
+                bump_versions(db.session.connection(), [Chemical.__tablename__])
+            db.session.commit()
+            updated += len(params)
+            last_id = rows[-1][0]
+        return updated
+
+    @staticmethod
+    def get_inventory(within_days: int) -> Tuple[Dict, bool]:
+        """유효기간 임박 목록과 보관 위치별 합계. (집계, 캐시 사용 여부) 반환
+
+        chemicals.expiry_scan 작업이 저장한 오늘자 집계가 있고 그 뒤로 chemicals가 바뀌지 않았으면 그것을 쓴다.
+        """
+        today = date.today()
+        return _inventory_cache.get_or_compute(
+            (today, within_days),
+            lambda: ChemicalService._load_snapshot(today, within_days) or ChemicalService._scan(today, within_days)
+        )
+
+    @staticmethod
+    def refresh_inventory_snapshot(within_days: int) -> Dict:
+        """재고 집계를 계산해 공유 스냅샷으로 저장 (주기 작업에서 호출)"""
+        today = date.today()
+        # 계산 전에 버전을 읽어 계산 도중의 변경은 다음 조회에서 스냅샷을 무시하게 한다
+        version = current_versions([Chemical.__tablename__])[0]
+        inventory = ChemicalService._scan(today, within_days)
+        db.session.merge(ChemicalInventorySnapshot(
+            within_days=within_days,
+            scan_date=today,
+            chemicals_version=version,
+            data=json.dumps(inventory, ensure_ascii=False),
+            created_date=datetime.utcnow()
+        ))
+        db.session.commit()
+        return {'within_days': within_days, 'expiring': len(inventory['expiring']),
+                'expired': inventory['expired_count']}
+
+    @staticmethod
+    def _load_snapshot(today: date, within_days: int) -> Optional[Dict]:
+        snapshot = db.session.get(ChemicalInventorySnapshot, within_days)
+        if snapshot is None or snapshot.scan_date != today:
+            return None
+        if snapshot.chemicals_version != current_versions([Chemical.__tablename__])[0]:
+            return None
+        return json.loads(snapshot.data)
+
+    @staticmethod
+    def _scan(today: date, within_days: int) -> Dict:
+        until = today + timedelta(days=within_days)
+        expiring = db.session.query(
+            Chemical.chem_id, Chemical.chemical_name, Chemical.cas_number, Chemical.location,
+            Chemical.quantity, Chemical.expiry_date
+        ).filter(Chemical.expiry_date.between(today, until)).order_by(Chemical.expiry_date).all()
+        expired_count = db.session.query(func.count(Chemical.id)).filter(Chemical.expiry_date < today).scalar()
+
+        location = func.coalesce(Chemical.location, '')
+        by_location = db.session.query(
+            location, Chemical.quantity_unit, func.count(Chemical.id), func.sum(Chemical.quantity_amount)
+        ).group_by(location, Chemical.quantity_unit).order_by(location).all()
+        by_chemical = db.session.query(
+            location, Chemical.chemical_name, Chemical.quantity_unit,
+            func.count(Chemical.id), func.sum(Chemical.quantity_amount)
+        ).group_by(location, Chemical.chemical_name, Chemical.quantity_unit) \
+            .order_by(location, Chemical.chemical_name).all()
+
+        return {
+            'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'within_days': within_days,
+            'expired_count': expired_count,
+            'expiring': [
+                {
+                    'id': chem_id,
+                    'chemical_name': name,
+                    'cas_number': cas_number,
+                    'location': loc,
+                    'quantity': quantity,
+                    'expiry_date': expiry_date.strftime('%Y-%m-%d'),
+                    'days_left': (expiry_date - today).days
+                }
+                for chem_id, name, cas_number, loc, quantity, expiry_date in expiring
+            ],
+            'by_location': [
+                {'location': loc or '미지정', 'unit': unit, 'count': count,
+                 'total': round(total, 6) if total is not None else None}
+                for loc, unit, count, total in by_location
+            ],
+            'by_location_chemical': [
+                {'location': loc or '미지정', 'chemical_name': name, 'unit': unit, 'count': count,
+                 'total': round(total, 6) if total is not None else None}
+                for loc, name, unit, count, total in by_chemical
+            ]
+        }
@@ -1,14 +1,52 @@
 """
 장비 관련 비즈니스 로직 서비스
 """
-from typing import List, Dict, Optional, Any
-from datetime import datetime
+from typing import Iterator, List, Dict, Optional, Any
+from datetime import date, datetime, time, timedelta
+from sqlalchemy import and_, or_
 from database import db, Equipment, Reservation
 from utils.date_utils import (
-    parse_date, format_date, calculate_next_inspection_date, 
+    parse_date, calculate_next_inspection_date, 
     get_inspection_status, generate_equipment_id
 )
-from utils.response_utils import success_response, error_response
+from utils.response_utils import success_response, error_response, STREAM_BATCH_SIZE
+from services.serializers import get_serializer
+
+# 예약 가능한 장비 상태 (예약 페이지와 동일)
+AVAILABLE_STATUSES = ('사용 가능', '사용가능')
+
+# 가용 장비 검색 결과 최대 개수
+AVAILABILITY_LIMIT = 500
+
+
+def reservation_overlap_clause(start_date: date, end_date: date,
+                               start_time: Optional[time] = None, end_time: Optional[time] = None):
+    """
+    예약이 [start_date start_time, end_date end_time) 구간과 겹치는 조건 (취소된 예약 제외)
+
+    시간이 없는 쪽은 하루 전체로 본다. end_date >= 구간 시작일, start_date <= 구간 끝날을
+    먼저 두어 ix_reservations_equipment_dates(equipment_name, end_date, start_date) 범위 스캔이 되게 한다.
+    """
+    conditions = [
+        Reservation.end_date >= start_date,
+        Reservation.start_date <= end_date,
+        or_(Reservation.status.is_(None), Reservation.status != '취소'),
+    ]
+    if start_time is not None:
+        # 구간 시작일에 끝나는 예약은 start_time 이후에 끝나야 겹친다
+        conditions.append(or_(
+            Reservation.end_date > start_date,
+            Reservation.end_time.is_(None),
+            Reservation.end_time > start_time,
+        ))
+    if end_time is not None:
+        # 구간 끝날에 시작하는 예약은 end_time 전에 시작해야 겹친다
+        conditions.append(or_(
+            Reservation.start_date < end_date,
+            Reservation.start_time.is_(None),
+            Reservation.start_time < end_time,
+        ))
+    return and_(*conditions)
 
 
 class EquipmentService:
@@ -17,32 +55,25 @@ class EquipmentService:
     @staticmethod
     def get_all_equipment() -> List[Dict]:
         """모든 장비 조회"""
-        equipment_list = Equipment.query.order_by(Equipment.created_date.desc()).all()
-        equipment_data = []
-        
-        for equipment in equipment_list:
-            # 점검 상태 업데이트
-            EquipmentService._update_inspection_status(equipment)
-            
-            equipment_data.append({
-                'id': equipment.id,
-                'name': equipment.name,
-                'model': equipment.model,
-                'manufacturer': equipment.manufacturer,
-                'location': equipment.location,
-                'status': equipment.status,
-                'asset_number': getattr(equipment, 'asset_number', ''),
-                'purchase_date': format_date(equipment.purchase_date),
-                'maintenance_date': format_date(equipment.maintenance_date),
-                'inspection_cycle_days': equipment.inspection_cycle_days,
-                'last_inspection_date': format_date(equipment.last_inspection_date),
-                'next_inspection_date': format_date(equipment.next_inspection_date),
-                'inspection_status': equipment.inspection_status,
-                'notes': equipment.notes,
-                'created_date': format_date(equipment.created_date)
-            })
-        
-        return equipment_data
+        return list(EquipmentService.iter_equipment())
+
+    @staticmethod
+    def iter_equipment(batch_size: int = STREAM_BATCH_SIZE) -> Iterator[Dict]:
+        """장비 목록을 batch_size씩 읽어 한 행씩 직렬화 (스트리밍 응답용)"""
+        serialize = get_serializer(Equipment)
+        query = Equipment.query.order_by(Equipment.created_date.desc()).yield_per(batch_size)
+
+        # 점검 상태는 읽으면서 반영하고 끝에 한 번 커밋 (바뀐 행만 세션에 남음)
+        changed = False
+        for equipment in query:
+            changed = EquipmentService._apply_inspection_schedule(equipment) or changed
+            yield serialize(equipment)
+        if changed:
+            try:
+                db.session.commit()
+            except Exception as e:
+                print(f"점검 상태 업데이트 중 오류: {e}")
+                db.session.rollback()
     
     @staticmethod
     def create_equipment(data: Dict[str, Any]) -> Dict:
@@ -147,6 +178,40 @@ class EquipmentService:
             db.session.rollback()
             return error_response(f"장비 삭제 중 오류가 발생했습니다: {str(e)}")
     
+    @staticmethod
+    def refresh_inspection_statuses(today: Optional[date] = None) -> int:
+        """다음 점검일 기준 점검 상태를 집합 UPDATE 세 번으로 갱신 (주기 작업). 변경한 행 수 반환"""
+        today = today or date.today()
+        warning_date = today + timedelta(days=30)
+        base = Equipment.query.filter(Equipment.next_inspection_date.isnot(None))
+        rules = (
+            ('점검지연', Equipment.next_inspection_date < today),
+            ('점검필요', db.and_(Equipment.next_inspection_date >= today,
+                              Equipment.next_inspection_date <= warning_date)),
+            ('정상', Equipment.next_inspection_date > warning_date),
+        )
+        changed = 0
+        for status, condition in rules:
+            changed += base.filter(
+                condition,
+                db.or_(Equipment.inspection_status.is_(None), Equipment.inspection_status != status)
+            ).update({Equipment.inspection_status: status}, synchronize_session=False)
+        db.session.commit()
+        return changed
+
+    @staticmethod
+    def _apply_inspection_schedule(equipment: Equipment) -> bool:
+        """마지막 점검일과 주기로 다음 점검일/점검 상태를 계산해 반영 (커밋하지 않음). 변경 여부 반환"""
+        if not (equipment.last_inspection_date and equipment.inspection_cycle_days):
+            return False
+        next_date = calculate_next_inspection_date(equipment.last_inspection_date, equipment.inspection_cycle_days)
+        status = get_inspection_status(next_date)
+        if equipment.next_inspection_date == next_date and equipment.inspection_status == status:
+            return False
+        equipment.next_inspection_date = next_date
+        equipment.inspection_status = status
+        return True
+
     @staticmethod
     def _update_inspection_status(equipment: Equipment) -> None:
         """장비의 점검 상태를 업데이트하는 내부 메서드"""
@@ -162,4 +227,27 @@ class EquipmentService:
             db.session.commit()
         except Exception as e:
             print(f"점검 상태 업데이트 중 오류: {e}")
-            db.session.rollback() 
\ No newline at end of file
+            db.session.rollback() 
+
+    @staticmethod
+    def find_available(start_date: date, end_date: date, start_time: Optional[time] = None,
+                       end_time: Optional[time] = None, category: Optional[str] = None,
+                       location: Optional[str] = None, limit: int = AVAILABILITY_LIMIT) -> List[Dict]:
+        """
+        구간 안에 겹치는 예약이 없는 예약 가능 장비 (이름순, 최대 limit개)
+
+        장비마다 겹치는 예약이 있는지를 NOT EXISTS(anti-join)로 확인하므로 장비 하나당
+        인덱스 탐색 한 번이면 되고, 과거 예약 수와 관계없이 일정한 시간에 응답한다.
+        """
+        overlapping = (db.session.query(Reservation.id)
+                       .filter(Reservation.equipment_name == Equipment.name,
+                               reservation_overlap_clause(start_date, end_date, start_time, end_time))
+                       .exists())
+        columns = ('id', 'equipment_id', 'name', 'category', 'location', 'manager', 'status')
+        query = (db.session.query(*(getattr(Equipment, column) for column in columns))
+                 .filter(Equipment.status.in_(AVAILABLE_STATUSES), ~overlapping))
+        if category:
+            query = query.filter(Equipment.category == category)
+        if location:
+            query = query.filter(Equipment.location == location)
+        return [dict(zip(columns, row)) for row in query.order_by(Equipment.name, Equipment.id).limit(limit)]
@@ -0,0 +1,224 @@
+"""
+내용 주소 기반(content-addressed) 로컬 파일 저장소
+
+업로드는 고정 크기 청크로 임시 파일에 기록하면서 SHA-256을 계산하므로
+파일 크기와 관계없이 메모리 사용량이 일정하다. 같은 내용의 파일은 해시가
+같은 하나의 객체 파일만 남긴다. 객체 경로는 objects/ab/cd/<sha256> 형태.
+
+다운로드는 Werkzeug send_file(conditional=True)로 Range/If-None-Match를
+처리하고, 설정에 따라 nginx(X-Accel-Redirect)나 Apache/lighttpd(X-Sendfile,
+Flask USE_X_SENDFILE)에 전송을 넘긴다.
+
+참조 행이 없는 객체의 삭제(delete_unreferenced)와 같은 내용의 업로드가 경합하지 않도록,
+객체 확정(이동 또는 기존 객체 재사용)과 삭제 판단은 해시별 파일 잠금(flock) 안에서 한다.
+업로드는 참조 행을 커밋할 때까지 객체에 pin을 남기고, 삭제는 pin이 있으면 건너뛴다.
+"""
+import fcntl
+import hashlib
+import os
+import tempfile
+import time
+import uuid
+from contextlib import contextmanager
+from typing import BinaryIO, Callable, Iterable, Optional, Set, Tuple
+from urllib.parse import quote
+
+from flask import current_app, send_file
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from werkzeug.utils import secure_filename
+
+CHUNK_SIZE = 1024 * 1024
+
+_PINS_KEY = 'file_store_pins'
+
+
+class FileTooLarge(Exception):
+    """저장소 최대 크기를 넘는 업로드"""
+
+
+class FileStore:
+    """하나의 저장소 루트 디렉터리 (예: uploads/accidents)"""
+
+    def __init__(self, name: str, max_size_config: Optional[str] = None, suffix: str = ''):
+        self.name = name
+        self.max_size_config = max_size_config
+        # 객체 파일 확장자 (웹 서버가 경로만으로 Content-Type을 정할 수 있도록)
+        self.suffix = suffix
+
+    @property
+    def root(self) -> str:
+        return os.path.join(current_app.config['FILE_STORE_ROOT'], self.name)
+
+    @property
+    def max_size(self) -> Optional[int]:
+        return current_app.config.get(self.max_size_config) if self.max_size_config else None
+
+    def relative_path(self, digest: str) -> str:
+        return '/'.join(('objects', digest[:2], digest[2:4], digest + self.suffix))
+
+    @property
+    def objects_root(self) -> str:
+        return os.path.join(self.root, 'objects')
+
+    def path_for(self, digest: str) -> str:
+        return os.path.join(self.root, *self.relative_path(digest).split('/'))
+
+    def exists(self, digest: str) -> bool:
+        return os.path.isfile(self.path_for(digest))
+
+    @contextmanager
+    def lock(self, digest: str):
+        """같은 해시의 객체 확정/삭제를 프로세스 간에 직렬화 (해시 앞 2자리로 나눈 256개 잠금 파일)"""
+        lock_dir = os.path.join(self.root, 'locks')
+        os.makedirs(lock_dir, exist_ok=True)
+        with open(os.path.join(lock_dir, digest[:2] + '.lock'), 'a') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _pin_dir(self, digest: str) -> str:
+        return os.path.join(self.root, 'pins', digest)
+
+    def is_pinned(self, digest: str) -> bool:
+        try:
+            return bool(os.listdir(self._pin_dir(digest)))
+        except FileNotFoundError:
+            return False
+
+    def unpin(self, digest: str, token: str) -> None:
+        with self.lock(digest):
+            pin_dir = self._pin_dir(digest)
+            try:
+                os.unlink(os.path.join(pin_dir, token))
+                os.rmdir(pin_dir)
+            except OSError:
+                pass  # 다른 업로드의 pin이 남아 있음
+
+    def save_stream(self, stream: BinaryIO, session: Optional[Session] = None) -> Tuple[str, int, bool]:
+        """스트림을 청크 단위로 저장. (sha256, 크기, 새로 저장했는지 여부) 반환
+
+        session을 주면 그 세션의 현재 트랜잭션이 끝날 때(참조 행 커밋 또는 롤백)까지 객체에 pin을
+        남겨, 그 사이 다른 요청의 delete_unreferenced가 재사용한 객체를 지우지 못하게 한다.
+        """
+        tmp_dir = os.path.join(self.root, 'tmp')
+        os.makedirs(tmp_dir, exist_ok=True)
+        max_size = self.max_size
+        digest = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=tmp_dir)
+        try:
+            with os.fdopen(fd, 'wb') as tmp:
+                while True:
+                    chunk = stream.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    size += len(chunk)
+                    if max_size is not None and size > max_size:
+                        raise FileTooLarge(size)
+                    digest.update(chunk)
+                    tmp.write(chunk)
+
+            hexdigest = digest.hexdigest()
+            final_path = self.path_for(hexdigest)
+            with self.lock(hexdigest):
+                if session is not None:
+                    token = f'{os.getpid()}-{uuid.uuid4().hex}'
+                    os.makedirs(self._pin_dir(hexdigest), exist_ok=True)
+                    open(os.path.join(self._pin_dir(hexdigest), token), 'w').close()
+                    session.info.setdefault(_PINS_KEY, []).append((self, hexdigest, token))
+                if os.path.exists(final_path):
+                    os.unlink(tmp_path)
+                    return hexdigest, size, False
+                os.makedirs(os.path.dirname(final_path), exist_ok=True)
+                os.chmod(tmp_path, 0o644)
+                os.replace(tmp_path, final_path)
+            return hexdigest, size, True
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def cleanup_tmp(self, max_age_seconds: int = 86400) -> int:
+        """중단된 업로드가 남긴 임시 파일과 (프로세스 종료로) 해제되지 않은 pin 삭제. 삭제한 파일 수 반환"""
+        cutoff = time.time() - max_age_seconds
+        removed = 0
+        tmp_dir = os.path.join(self.root, 'tmp')
+        if os.path.isdir(tmp_dir):
+            for entry in os.scandir(tmp_dir):
+                try:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                        removed += 1
+                except FileNotFoundError:
+                    pass
+        pins_dir = os.path.join(self.root, 'pins')
+        if os.path.isdir(pins_dir):
+            for pin_dir in os.scandir(pins_dir):
+                for entry in os.scandir(pin_dir.path):
+                    try:
+                        if entry.stat().st_mtime < cutoff:
+                            self.unpin(pin_dir.name, entry.name)
+                            removed += 1
+                    except FileNotFoundError:
+                        pass
+        return removed
+
+    def delete(self, digest: str) -> None:
+        """객체 파일 삭제 (참조하는 행이 더 이상 없을 때만 호출)"""
+        try:
+            os.unlink(self.path_for(digest))
+        except FileNotFoundError:
+            pass
+
+    def delete_unreferenced(self, digests: Iterable[Optional[str]],
+                            referenced: Callable[[Set[str]], Set[str]]) -> int:
+        """
+        referenced(해시 집합)가 돌려준 커밋된 참조도, 진행 중인 업로드의 pin도 없는 객체 삭제.
+        판단과 삭제를 해시별 잠금 안에서 하므로 같은 내용의 동시 업로드와 경합하지 않는다. 삭제 수 반환
+        """
+        removed = 0
+        for digest in sorted({d for d in digests if d}):
+            with self.lock(digest):
+                if self.is_pinned(digest) or referenced({digest}):
+                    continue
+                if self.exists(digest):
+                    self.delete(digest)
+                    removed += 1
+        return removed
+
+    def send(self, digest: str, download_name: str, mimetype: Optional[str] = None,
+             as_attachment: bool = True):
+        """객체 파일 응답. FILE_STORE_ACCEL_PREFIX가 설정되면 nginx 내부 리다이렉트로 위임"""
+        mimetype = mimetype or 'application/octet-stream'
+        accel_prefix = current_app.config.get('FILE_STORE_ACCEL_PREFIX')
+        if accel_prefix:
+            response = current_app.response_class(mimetype=mimetype)
+            response.headers['X-Accel-Redirect'] = (
+                accel_prefix.rstrip('/') + '/' + self.name + '/' + self.relative_path(digest)
+            )
+            disposition = 'attachment' if as_attachment else 'inline'
+            response.headers['Content-Disposition'] = (
+                f"{disposition}; filename=\"{secure_filename(download_name) or digest}\"; "
+                f"filename*=UTF-8''{quote(download_name)}"
+            )
+            # 내용이 바뀌면 해시(경로)도 바뀌므로 해시를 ETag로 사용
+            response.set_etag(digest)
+            return response
+
+        # USE_X_SENDFILE이 켜져 있으면 Flask가 X-Sendfile 헤더로 응답한다
+        response = send_file(self.path_for(digest), mimetype=mimetype, as_attachment=as_attachment,
+                             download_name=download_name, conditional=True, etag=digest)
+        response.headers['Accept-Ranges'] = 'bytes'
+        return response
+
+
+@event.listens_for(Session, 'after_transaction_end')
+def _unpin_on_end(session, transaction):
+    # 최상위 트랜잭션이 끝나면(커밋이면 참조 행이 보이고, 롤백이면 호출자가 정리) pin 해제
+    if transaction.parent is not None:
+        return
+    for store, digest, token in session.info.pop(_PINS_KEY, ()):
+        store.unpin(digest, token)
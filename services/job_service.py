@@ -0,0 +1,237 @@
+"""
+DB 기반 주기 작업 실행기
+
+작업은 register_job()으로 등록하고 jobs 테이블에 다음 실행 시각과 임대(lease)를
+기록한다. 실행할 차례가 된 작업은 조건부 UPDATE 한 번으로 임대를 얻은 워커만
+실행하므로 여러 gunicorn 워커나 여러 호스트가 같은 DB를 써도 한 번만 실행된다.
+임대가 만료되면(실행 중 프로세스 종료 등) 다른 워커가 다시 가져간다.
+
+실행 위치는 둘 중 하나:
+  - 별도 프로세스: python tools/job_worker.py
+  - gunicorn 워커 내부 스레드: JOBS_RUN_IN_APP=true (gunicorn.conf.py post_worker_init)
+"""
+import os
+import socket
+import threading
+import time
+import traceback
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, or_
+
+from database import db, Job
+
+# 실패 시 재시도 간격 (연속 실패마다 2배, 최대 작업 주기)
+RETRY_BASE_SECONDS = 60
+
+
+@dataclass(frozen=True)
+class JobDefinition:
+    name: str
+    interval_seconds: int
+    func: Callable[[], object]
+    description: str = ''
+
+
+_registry: Dict[str, JobDefinition] = {}
+
+
+def register_job(name: str, interval_seconds: int, description: str = ''):
+    """주기 작업 등록 데코레이터. 함수는 앱 컨텍스트 안에서 호출되며 반환값은 로그에 남는다"""
+    def decorator(func):
+        _registry[name] = JobDefinition(name, interval_seconds, func, description)
+        return func
+    return decorator
+
+
+def registered_jobs() -> Dict[str, JobDefinition]:
+    return dict(_registry)
+
+
+def job_to_dict(job: Job) -> Dict:
+    definition = _registry.get(job.name)
+
+    def fmt(value):
+        return value.strftime('%Y-%m-%d %H:%M:%S') if value else None
+
+    return {
+        'name': job.name,
+        'description': definition.description if definition else '',
+        'interval_seconds': job.interval_seconds,
+        'enabled': job.enabled,
+        'next_run_at': fmt(job.next_run_at),
+        'running': bool(job.lease_owner and job.lease_expires_at and job.lease_expires_at > datetime.utcnow()),
+        'lease_owner': job.lease_owner,
+        'attempts': job.attempts,
+        'run_count': job.run_count,
+        'last_started_at': fmt(job.last_started_at),
+        'last_finished_at': fmt(job.last_finished_at),
+        'last_duration_ms': round(job.last_duration_ms, 1) if job.last_duration_ms is not None else None,
+        'last_status': job.last_status,
+        'last_error': job.last_error
+    }
+
+
+class JobRunner:
+    """등록된 주기 작업을 임대 방식으로 실행"""
+
+    def __init__(self, app=None, lease_seconds: int = 600, poll_interval: float = 30.0):
+        self.app = None
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self._reset()
+        os.register_at_fork(after_in_child=self._reset)
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app) -> None:
+        self.app = app
+        self.lease_seconds = int(app.config.get('JOBS_LEASE_SECONDS', self.lease_seconds))
+        self.poll_interval = float(app.config.get('JOBS_POLL_INTERVAL', self.poll_interval))
+        app.extensions['job_runner'] = self
+
+    def _reset(self) -> None:
+        """초기화 (fork 이후 자식 프로세스에서는 부모의 스레드를 물려받지 않도록 새로 만든다)"""
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @property
+    def owner(self) -> str:
+        return f'{socket.gethostname()}:{os.getpid()}'
+
+    def sync_jobs(self) -> int:
+        """등록된 작업의 jobs 행을 생성하고 주기를 맞춤. 새로 만든 행 수 반환 (앱 컨텍스트 필요)"""
+        existing = {job.name: job for job in Job.query.all()}
+        now = datetime.utcnow()
+        created = 0
+        for definition in _registry.values():
+            job = existing.get(definition.name)
+            if job is None:
+                db.session.add(Job(name=definition.name, interval_seconds=definition.interval_seconds,
+                                   enabled=True, next_run_at=now, attempts=0, run_count=0))
+                created += 1
+            elif job.interval_seconds != definition.interval_seconds:
+                job.interval_seconds = definition.interval_seconds
+        db.session.commit()
+        return created
+
+    def run_pending(self) -> List[Tuple[str, str]]:
+        """실행할 차례인 작업을 임대를 얻은 것만 실행. [(작업명, 결과)] 반환 (앱 컨텍스트 필요)"""
+        now = datetime.utcnow()
+        due = [name for (name,) in db.session.query(Job.name).filter(
+            Job.enabled.is_(True),
+            Job.next_run_at <= now,
+            or_(Job.lease_expires_at.is_(None), Job.lease_expires_at < now)
+        ).order_by(Job.next_run_at).all()]
+        db.session.commit()
+
+        results = []
+        for name in due:
+            if name not in _registry:
+                continue
+            if self._claim(name):
+                results.append((name, self._execute(_registry[name])))
+        return results
+
+    def _claim(self, name: str) -> bool:
+        """조건부 UPDATE로 임대 획득 (다른 워커가 먼저 가져갔으면 0행이 갱신됨)"""
+        now = datetime.utcnow()
+        table = Job.__table__
+        result = db.session.execute(
+            table.update().where(and_(
+                table.c.name == name,
+                table.c.enabled.is_(True),
+                table.c.next_run_at <= now,
+                or_(table.c.lease_expires_at.is_(None), table.c.lease_expires_at < now)
+            )).values(
+                lease_owner=self.owner,
+                lease_expires_at=now + timedelta(seconds=self.lease_seconds),
+                attempts=table.c.attempts + 1,
+                last_started_at=now
+            )
+        )
+        db.session.commit()
+        return result.rowcount == 1
+
+    def _execute(self, definition: JobDefinition) -> str:
+        owner = self.owner
+        started = time.perf_counter()
+        error = None
+        try:
+            outcome = definition.func()
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            error = traceback.format_exc(limit=5)
+            outcome = None
+        duration_ms = (time.perf_counter() - started) * 1000
+        finished = datetime.utcnow()
+
+        table = Job.__table__
+        job = db.session.get(Job, definition.name)
+        if error is None:
+            values = {'attempts': 0, 'last_status': 'success', 'last_error': None,
+                      'next_run_at': finished + timedelta(seconds=definition.interval_seconds)}
+        else:
+            retry = min(definition.interval_seconds, RETRY_BASE_SECONDS * 2 ** max((job.attempts if job else 1) - 1, 0))
+            values = {'last_status': 'failed', 'last_error': error[-4000:],
+                      'next_run_at': finished + timedelta(seconds=retry)}
+        # 임대를 잃은 경우(만료 후 다른 워커가 가져감)에는 기록하지 않는다
+        db.session.execute(
+            table.update().where(and_(table.c.name == definition.name, table.c.lease_owner == owner)).values(
+                lease_owner=None,
+                lease_expires_at=None,
+                run_count=table.c.run_count + 1,
+                last_finished_at=finished,
+                last_duration_ms=duration_ms,
+                **values
+            )
+        )
+        db.session.commit()
+
+        if self.app is not None:
+            if error is None:
+                self.app.logger.info(f"작업 {definition.name} 완료 ({duration_ms:.0f}ms): {outcome}")
+            else:
+                self.app.logger.error(f"작업 {definition.name} 실패 ({duration_ms:.0f}ms): {error}")
+        return 'success' if error is None else 'failed'
+
+    def request_run(self, name: str) -> bool:
+        """작업을 다음 폴링 때 실행하도록 예약 (요청 처리 중에는 실행하지 않음)"""
+        count = Job.query.filter_by(name=name).update({Job.next_run_at: datetime.utcnow()},
+                                                       synchronize_session=False)
+        db.session.commit()
+        return count == 1
+
+    def run_forever(self) -> None:
+        """폴링 루프 (별도 프로세스 또는 스레드에서 실행)"""
+        with self.app.app_context():
+            self.sync_jobs()
+            db.session.remove()
+        while not self._stop.is_set():
+            with self.app.app_context():
+                try:
+                    self.run_pending()
+                except Exception as e:
+                    db.session.rollback()
+                    self.app.logger.error(f"작업 실행기 오류: {str(e)}")
+                finally:
+                    db.session.remove()
+            self._stop.wait(self.poll_interval)
+
+    def start(self) -> None:
+        """gunicorn 워커 안에서 폴링 스레드 시작"""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self.run_forever, name='job-runner', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+
+job_runner = JobRunner()
@@ -0,0 +1,58 @@
+"""
+정기 유지보수 작업 등록
+
+각 작업은 services.job_service.JobRunner가 앱 컨텍스트 안에서 실행한다.
+반환값은 실행 로그에 남는다.
+"""
+from services.job_service import register_job
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+
+@register_job('procedures.mark_overdue', DAY, '검토일이 지난 작업절차서를 검토필요로 변경')
+def mark_overdue_procedures():
+    from services.procedure_service import ProcedureService
+    return {'updated': ProcedureService.mark_overdue()}
+
+
+@register_job('equipment.inspection_status', DAY, '다음 점검일 기준 장비 점검 상태 갱신')
+def refresh_equipment_inspection_status():
+    from services.equipment_service import EquipmentService
+    return {'updated': EquipmentService.refresh_inspection_statuses()}
+
+
+@register_job('accidents.rebuild_stats', DAY, '사고 월별 집계 전체 재계산 (일괄 쓰기 보정)')
+def rebuild_accident_stats():
+    from services.accident_stats_service import AccidentStatsService
+    AccidentStatsService.rebuild()
+    return {'rebuilt': True}
+
+
+@register_job('chemicals.backfill', HOUR, '화학물질 수량/CAS 파생 컬럼 보정')
+def backfill_chemicals():
+    from services.chemical_service import ChemicalService
+    return {
+        'quantities': ChemicalService.backfill_quantities(),
+        'cas_keys': ChemicalService.backfill_cas_keys()
+    }
+
+
+@register_job('chemicals.expiry_scan', HOUR, '화학물질 유효기간 임박 목록과 보관 위치별 재고 집계 미리 계산')
+def scan_chemical_inventory():
+    from flask import current_app
+    from services.chemical_service import ChemicalService
+    return ChemicalService.refresh_inventory_snapshot(current_app.config.get('CHEMICAL_EXPIRY_WARNING_DAYS', 30))
+
+
+@register_job('uploads.cleanup_tmp', DAY, '중단된 업로드의 임시 파일 삭제')
+def cleanup_upload_tmp():
+    from services.accident_document_service import accident_document_store
+    from services.chemical_service import msds_store
+    return {store.name: store.cleanup_tmp() for store in (accident_document_store, msds_store)}
+
+
+@register_job('reservations.extend_series', DAY, '반복 예약 발생 건을 구체화 범위(horizon)까지 생성')
+def extend_reservation_series():
+    from services.reservation_series_service import ReservationSeriesService
+    return ReservationSeriesService.extend_all()
@@ -0,0 +1,192 @@
+"""
+특허 관련 비즈니스 로직 서비스
+"""
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import extract, func
+
+from database import db, Patent, PatentInventor, Researcher
+from services.cache_service import VersionedCache, bump_versions
+
+# patents / patent_inventors 테이블에 쓰기가 커밋되면 무효화
+_stats_cache = VersionedCache(Patent.__tablename__, PatentInventor.__tablename__)
+
+MAIN_INVENTOR_ROLE = '대표발명자'
+CO_INVENTOR_ROLE = '공동발명자'
+
+_NAME_SEPARATORS = re.compile(r'[,;/\n]+')
+
+
+def split_inventor_names(text: Optional[str]) -> List[str]:
+    """쉼표 등으로 이어 붙인 발명자 문자열을 이름 목록으로 분리 (중복 제거, 순서 유지)"""
+    names = []
+    for name in _NAME_SEPARATORS.split(text or ''):
+        name = name.strip()
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+def parse_share(value) -> Optional[int]:
+    """지분율 입력값을 0~100 정수로 변환 (비어 있거나 잘못된 값은 None)"""
+    try:
+        share = int(float(value))
+    except (TypeError, ValueError):
+        return None
+    return share if 0 <= share <= 100 else None
+
+
+class PatentService:
+    """특허 관리 서비스 클래스"""
+
+    @staticmethod
+    def get_stats() -> Tuple[Dict, bool]:
+        """특허 포트폴리오 집계 (상태/출원국/출원연도/발명자별 건수). (통계, 캐시 사용 여부) 반환"""
+        return _stats_cache.get_or_compute('portfolio', PatentService._compute_stats)
+
+    @staticmethod
+    def _compute_stats() -> Dict:
+        def grouped(column):
+            rows = db.session.query(column, func.count(Patent.id)).group_by(column).all()
+            return {(key if key is not None else '미지정'): count for key, count in rows}
+
+        year = extract('year', Patent.application_date)
+        by_year = {
+            str(int(key)) if key is not None else '미지정': count
+            for key, count in db.session.query(year, func.count(Patent.id)).group_by(year).order_by(year).all()
+        }
+        return {
+            'total': db.session.query(func.count(Patent.id)).scalar(),
+            'by_status': grouped(Patent.status),
+            'by_office': grouped(Patent.patent_office),
+            'by_year': by_year,
+            'by_inventor': {
+                name: count for name, count in db.session.query(
+                    PatentInventor.inventor_name, func.count(PatentInventor.patent_id)
+                ).group_by(PatentInventor.inventor_name).all()
+            }
+        }
+
+    @staticmethod
+    def sync_inventors(patent: Patent, main_inventor: str, main_share,
+                       co_inventors: Iterable[Tuple[str, object]]) -> None:
+        """특허의 정규화된 발명자 목록을 폼 입력 기준으로 교체 (커밋은 호출자가 수행)"""
+        entries = []
+        if main_inventor and main_inventor.strip():
+            entries.append((main_inventor.strip(), MAIN_INVENTOR_ROLE, parse_share(main_share)))
+        for name, share in co_inventors:
+            if name and name.strip():
+                entries.append((name.strip(), CO_INVENTOR_ROLE, parse_share(share)))
+
+        if patent.inventor_links:
+            # 같은 이름을 다시 넣을 때 (patent_id, inventor_name) 유니크 제약에 걸리지 않도록 기존 행을 먼저 삭제
+            patent.inventor_links = []
+            db.session.flush()
+
+        researcher_ids = PatentService._researcher_ids_by_name(name for name, _, _ in entries)
+        seen = set()
+        links = []
+        for name, role, share in entries:
+            if name in seen:
+                continue
+            seen.add(name)
+            links.append(PatentInventor(
+                inventor_name=name,
+                researcher_id=researcher_ids.get(name),
+                role=role,
+                share=share,
+                position=len(links)
+            ))
+        patent.inventor_links = links
+
+    @staticmethod
+    def backfill_inventors(batch_size: int = 1000) -> int:
+        """발명자 행이 없는 특허의 inventors/co_inventors 문자열을 분리해 일괄 입력. 입력한 행 수 반환"""
+        researcher_ids = PatentService._researcher_ids_by_name(None)
+        has_links = db.session.query(PatentInventor.id).filter(PatentInventor.patent_id == Patent.id).exists()
+        inserted = 0
+        last_id = 0
+        while True:
+            patents = db.session.query(
+                Patent.id, Patent.main_inventor, Patent.main_inventor_share, Patent.co_inventors, Patent.inventors
+            ).filter(Patent.id > last_id, ~has_links).order_by(Patent.id).limit(batch_size).all()
+            if not patents:
+                break
+
+            rows = []
+            for patent_id, main_inventor, main_share, co_inventors, inventors in patents:
+                names = split_inventor_names(main_inventor)[:1]
+                # 대표 발명자가 없으면 inventors 문자열의 첫 번째 이름을 대표로 사용
+                all_names = split_inventor_names(inventors)
+                if not names and all_names:
+                    names = all_names[:1]
+                for name in split_inventor_names(co_inventors) + all_names:
+                    if name not in names:
+                        names.append(name)
+                for position, name in enumerate(names):
+                    rows.append({
+                        'patent_id': patent_id,
+                        'researcher_id': researcher_ids.get(name),
+                        'inventor_name': name[:100],
+                        'role': MAIN_INVENTOR_ROLE if position == 0 else CO_INVENTOR_ROLE,
+                        'share': parse_share(main_share) if position == 0 else None,
+                        'position': position
+                    })
+            if rows:
+                db.session.execute(PatentInventor.__table__.insert(), rows)
+                # Core INSERT는 세션 이벤트를 거치지 않으므로 통계 캐시 무효화를 위해 직접 버전 증가
+                bump_versions(db.session.connection(), [PatentInventor.__tablename__])
+            db.session.commit()
+            inserted += len(rows)
+            last_id = patents[-1][0]
+        return inserted
+
+    @staticmethod
+    def get_inventor_totals() -> List[Dict]:
+        """발명자별 특허 건수와 지분율 합계"""
+        rows = db.session.query(
+            PatentInventor.inventor_name,
+            func.max(PatentInventor.researcher_id),
+            func.count(PatentInventor.patent_id),
+            func.coalesce(func.sum(PatentInventor.share), 0)
+        ).group_by(PatentInventor.inventor_name).order_by(func.count(PatentInventor.patent_id).desc()).all()
+        return [
+            {'inventor_name': name, 'researcher_id': researcher_id, 'patent_count': count, 'share_total': int(share_total)}
+            for name, researcher_id, count, share_total in rows
+        ]
+
+    @staticmethod
+    def get_patents_by_inventor(name: Optional[str] = None, researcher_id: Optional[int] = None) -> List[Dict]:
+        """특정 발명자(이름 또는 연구원 id)의 특허 목록 (patent_inventors 인덱스 조회)"""
+        query = db.session.query(Patent, PatentInventor.role, PatentInventor.share) \
+            .join(PatentInventor, PatentInventor.patent_id == Patent.id)
+        if researcher_id is not None:
+            query = query.filter(PatentInventor.researcher_id == researcher_id)
+        else:
+            query = query.filter(PatentInventor.inventor_name == name)
+        return [
+            {
+                'id': patent.id,
+                'title': patent.title,
+                'status': patent.status,
+                'patent_office': patent.patent_office,
+                'application_number': patent.application_number,
+                'application_date': patent.application_date.strftime('%Y-%m-%d') if patent.application_date else '',
+                'role': role,
+                'share': share
+            }
+            for patent, role, share in query.order_by(Patent.application_date.desc()).all()
+        ]
+
+    @staticmethod
+    def _researcher_ids_by_name(names: Optional[Iterable[str]]) -> Dict[str, int]:
+        """이름이 유일한 연구원만 연결 (names가 None이면 전체 연구원 대상)"""
+        query = db.session.query(Researcher.name, func.min(Researcher.id)) \
+            .group_by(Researcher.name).having(func.count(Researcher.id) == 1)
+        if names is not None:
+            names = list(names)
+            if not names:
+                return {}
+            query = query.filter(Researcher.name.in_(names))
+        return dict(query.all())
@@ -0,0 +1,60 @@
+"""
+작업절차서 검토 일정 서비스
+
+검토 대상은 (status, review_date) 인덱스로 조회한다. 검토일이 지난 '유효'
+절차서는 일일 배치가 한 번의 UPDATE로 '검토필요' 상태로 바꾼다.
+"""
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+
+from database import db, SafetyProcedure
+
+STATUS_VALID = '유효'
+STATUS_REVIEWING = '검토중'
+STATUS_REVIEW_OVERDUE = '검토필요'
+
+# 검토 일정 관리 대상 상태 (폐기된 절차서는 제외)
+REVIEW_STATUSES = (STATUS_VALID, STATUS_REVIEWING, STATUS_REVIEW_OVERDUE)
+
+
+def procedure_to_dict(proc: SafetyProcedure, today: Optional[date] = None) -> Dict:
+    today = today or date.today()
+    days_left = (proc.review_date - today).days if proc.review_date else None
+    return {
+        'id': proc.id,
+        'title': proc.title,
+        'category': proc.category,
+        'description': proc.description,
+        'version': proc.version,
+        'created_by': proc.responsible_person,
+        'review_date': proc.review_date.strftime('%Y-%m-%d') if proc.review_date else '',
+        'status': proc.status,
+        'procedure_link': proc.procedure_link,
+        'risk_assessment_link': proc.risk_assessment_link,
+        'days_left': days_left,
+        'overdue': days_left is not None and days_left < 0
+    }
+
+
+class ProcedureService:
+    """작업절차서 검토 일정 서비스 클래스"""
+
+    @staticmethod
+    def get_due(within_days: int, today: Optional[date] = None) -> List[SafetyProcedure]:
+        """검토일이 오늘부터 within_days일 이내이거나 이미 지난 절차서 (검토일 순)"""
+        today = today or date.today()
+        return SafetyProcedure.query.filter(
+            SafetyProcedure.status.in_(REVIEW_STATUSES),
+            SafetyProcedure.review_date <= today + timedelta(days=within_days)
+        ).order_by(SafetyProcedure.review_date, SafetyProcedure.id).all()
+
+    @staticmethod
+    def mark_overdue(today: Optional[date] = None) -> int:
+        """검토일이 지난 '유효' 절차서를 '검토필요'로 일괄 변경. 변경한 행 수 반환"""
+        today = today or date.today()
+        count = SafetyProcedure.query.filter(
+            SafetyProcedure.status == STATUS_VALID,
+            SafetyProcedure.review_date < today
+        ).update({SafetyProcedure.status: STATUS_REVIEW_OVERDUE}, synchronize_session=False)
+        db.session.commit()
+        return count
@@ -0,0 +1,262 @@
+"""
+반복 예약 서비스
+
+반복 규칙(utils/recurrence.py)으로 발생 날짜를 전개하고, 같은 장비의 기존 예약과의 충돌을
+한 번의 기간 조회로 검사한 뒤 여러 행 INSERT 문(INSERT_CHUNK_SIZE행씩)으로 저장한다.
+
+- 전개 범위 제한: 예약은 시작일(또는 오늘)부터 RESERVATION_SERIES_HORIZON_DAYS일 뒤까지만
+  만들고 그 날짜를 materialized_until에 기록한다. 이후 구간은 주기 작업
+  (reservations.extend_series)이 매일 범위를 늘리며 생성한다.
+- 한 번에 전개하는 발생 건은 RESERVATION_SERIES_MAX_OCCURRENCES개까지
+- 생성 요청에서 충돌이 있으면 기본적으로 아무것도 만들지 않고 충돌 목록을 돌려주며,
+  skip_conflicts이면 충돌한 날짜만 건너뛴다. 주기 작업은 항상 건너뛴다.
+"""
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from flask import current_app
+from sqlalchemy import insert, or_
+
+from database import db, Equipment, Reservation, ReservationSeries
+from utils.date_utils import parse_date, format_date
+from utils.recurrence import RecurrenceRule, iter_occurrences, parse_rrule
+
+INSERT_CHUNK_SIZE = 500
+
+CANCELLED_STATUS = '취소'
+
+
+class ReservationConflictError(ValueError):
+    """반복 예약 발생 건이 기존 예약과 겹침"""
+
+    def __init__(self, conflicts: List[Dict[str, Any]]):
+        super().__init__(f'기존 예약과 겹치는 날짜가 {len(conflicts)}건 있습니다.')
+        self.conflicts = conflicts
+
+
+def _parse_time(value: Optional[str]) -> Optional[time]:
+    return datetime.strptime(value, '%H:%M').time() if value else None
+
+
+def _interval(start_date: date, end_date: date, start_time: Optional[time], end_time: Optional[time]):
+    """예약이 차지하는 [시작, 끝) 시각. 시간이 없으면 하루 전체"""
+    return (
+        datetime.combine(start_date, start_time or time.min),
+        datetime.combine(end_date, end_time) if end_time else datetime.combine(end_date + timedelta(days=1), time.min),
+    )
+
+
+class ReservationSeriesService:
+    """반복 예약 생성/구체화/취소"""
+
+    @staticmethod
+    def horizon(series: ReservationSeries, today: Optional[date] = None) -> date:
+        days = current_app.config.get('RESERVATION_SERIES_HORIZON_DAYS', 120)
+        return max(today or date.today(), series.dtstart) + timedelta(days=days)
+
+    @staticmethod
+    def create_series(data: Dict[str, Any], skip_conflicts: bool = False) -> Dict[str, Any]:
+        """
+        반복 예약 생성 후 커밋. 입력 오류는 ValueError,
+        충돌이 있고 skip_conflicts가 아니면 ReservationConflictError (아무것도 저장하지 않음)
+        """
+        rule = parse_rrule(data.get('rrule'))
+        dtstart = parse_date(data.get('start_date'))
+        if dtstart is None:
+            raise ValueError('시작일이 필요합니다.')
+        end_date = parse_date(data.get('end_date')) or dtstart
+        if end_date < dtstart:
+            raise ValueError('종료일이 시작일보다 빠릅니다.')
+        start_time = _parse_time(data.get('start_time'))
+        end_time = _parse_time(data.get('end_time'))
+        if end_date == dtstart and start_time and end_time and end_time <= start_time:
+            raise ValueError('종료 시간이 시작 시간보다 빠릅니다.')
+
+        equipment_name = data.get('equipment_name')
+        if data.get('equipment_id'):
+            equipment = db.session.get(Equipment, int(data['equipment_id']))
+            if equipment is None:
+                raise ValueError('존재하지 않는 장비입니다.')
+            equipment_name = equipment.name
+        if not equipment_name or not data.get('reserver'):
+            raise ValueError('장비와 예약자는 필수 입력 항목입니다.')
+
+        series = ReservationSeries(
+            equipment_name=equipment_name,
+            reserver=data.get('reserver'),
+            purpose=data.get('purpose', ''),
+            notes=data.get('notes', ''),
+            rrule=rule.to_string(),
+            dtstart=dtstart,
+            duration_days=(end_date - dtstart).days,
+            start_time=start_time,
+            end_time=end_time,
+            active=True,
+            created_date=datetime.now()
+        )
+        try:
+            db.session.add(series)
+            db.session.flush()
+            result = ReservationSeriesService._materialize(
+                series, rule, ReservationSeriesService.horizon(series), skip_conflicts
+            )
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        result['series_id'] = series.id
+        return result
+
+    @staticmethod
+    def extend_all(today: Optional[date] = None) -> Dict[str, int]:
+        """활성 반복 예약의 구체화 범위를 오늘 기준 horizon까지 늘린다 (충돌 날짜는 건너뜀)"""
+        today = today or date.today()
+        days = current_app.config.get('RESERVATION_SERIES_HORIZON_DAYS', 120)
+        pending = ReservationSeries.query.filter(
+            ReservationSeries.active.is_(True),
+            or_(ReservationSeries.materialized_until.is_(None),
+                ReservationSeries.materialized_until < today + timedelta(days=days))
+        ).all()
+        totals = {'series': len(pending), 'created': 0, 'skipped': 0, 'failed': 0}
+        for series in pending:
+            try:
+                with db.session.begin_nested():
+                    result = ReservationSeriesService._materialize(
+                        series, parse_rrule(series.rrule), ReservationSeriesService.horizon(series, today), True
+                    )
+                totals['created'] += result['created']
+                totals['skipped'] += len(result['skipped'])
+            except Exception as e:
+                current_app.logger.error(f'반복 예약 {series.id} 구체화 실패: {e}')
+                totals['failed'] += 1
+        db.session.commit()
+        return totals
+
+    @staticmethod
+    def cancel_series(series_id: int, from_date: Optional[date] = None) -> int:
+        """from_date(기본 오늘) 이후의 발생 건을 삭제하고 반복을 멈춘다. 삭제한 예약 수 반환"""
+        series = db.session.get(ReservationSeries, series_id)
+        if series is None:
+            raise LookupError('반복 예약이 존재하지 않습니다.')
+        try:
+            deleted = Reservation.query.filter(
+                Reservation.series_id == series_id,
+                Reservation.start_date >= (from_date or date.today())
+            ).delete(synchronize_session=False)
+            series.active = False
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        return deleted
+
+    @staticmethod
+    def _materialize(series: ReservationSeries, rule: RecurrenceRule, until: date,
+                     skip_conflicts: bool) -> Dict[str, Any]:
+        """materialized_until 다음 날부터 until까지의 발생 건을 생성 (커밋하지 않음)"""
+        max_occurrences = current_app.config.get('RESERVATION_SERIES_MAX_OCCURRENCES', 366)
+        done = series.materialized_until
+        duration = timedelta(days=series.duration_days or 0)
+
+        dates: List[date] = []
+        emitted = 0
+        truncated = False
+        for day in iter_occurrences(rule, series.dtstart, until):
+            emitted += 1
+            if done is not None and day <= done:
+                continue
+            if len(dates) >= max_occurrences:
+                truncated = True
+                break
+            dates.append(day)
+
+        occurrences = [(day, day + duration) for day in dates]
+        ReservationSeriesService._check_self_overlap(series, occurrences)
+        conflicts = ReservationSeriesService.find_conflicts(
+            series.equipment_name, occurrences, series.start_time, series.end_time
+        )
+        if conflicts and not skip_conflicts:
+            raise ReservationConflictError(conflicts)
+
+        conflict_dates = {conflict['date'] for conflict in conflicts}
+        now = datetime.now()
+        rows = [
+            {
+                'equipment_name': series.equipment_name,
+                'reserver': series.reserver,
+                'purpose': series.purpose,
+                'notes': series.notes,
+                'start_date': start,
+                'end_date': end,
+                'start_time': series.start_time,
+                'end_time': series.end_time,
+                'status': '예약',
+                'created_date': now,
+                'series_id': series.id,
+            }
+            for start, end in occurrences if format_date(start) not in conflict_dates
+        ]
+        for offset in range(0, len(rows), INSERT_CHUNK_SIZE):
+            db.session.execute(insert(Reservation).values(rows[offset:offset + INSERT_CHUNK_SIZE]))
+
+        series.materialized_until = dates[-1] if truncated else until
+        # 유한한 규칙(COUNT/UNTIL)의 마지막 발생 건까지 만들었으면 더 늘릴 필요 없음
+        if not truncated and ((rule.count is not None and emitted >= rule.count)
+                              or (rule.until is not None and rule.until <= until)):
+            series.active = False
+        return {
+            'created': len(rows),
+            'skipped': conflicts,
+            'materialized_until': format_date(series.materialized_until),
+            'active': series.active,
+        }
+
+    @staticmethod
+    def _check_self_overlap(series: ReservationSeries, occurrences: List[Tuple[date, date]]) -> None:
+        previous_end = None
+        for start, end in occurrences:
+            begin, finish = _interval(start, end, series.start_time, series.end_time)
+            if previous_end is not None and begin < previous_end:
+                raise ValueError('반복 예약의 발생 건끼리 겹칩니다. 기간이나 반복 간격을 확인하세요.')
+            previous_end = finish
+
+    @staticmethod
+    def find_conflicts(equipment_name: str, occurrences: List[Tuple[date, date]],
+                       start_time: Optional[time], end_time: Optional[time]) -> List[Dict[str, Any]]:
+        """
+        발생 건(시작일 순, 같은 길이) 중 기존 예약과 겹치는 것을 찾는다.
+
+        기간 전체를 덮는 조회 한 번(ix_reservations_equipment_dates)으로 기존 예약을 가져오고,
+        각 기존 예약마다 겹칠 수 있는 발생 건만 이분 탐색으로 골라 시각 단위로 비교한다.
+        """
+        if not occurrences:
+            return []
+        first = occurrences[0][0]
+        last = occurrences[-1][1]
+        existing = (db.session.query(Reservation.id, Reservation.start_date, Reservation.end_date,
+                                     Reservation.start_time, Reservation.end_time, Reservation.reserver)
+                    .filter(Reservation.equipment_name == equipment_name,
+                            Reservation.end_date >= first,
+                            Reservation.start_date <= last,
+                            or_(Reservation.status.is_(None), Reservation.status != CANCELLED_STATUS))
+                    .all())
+
+        starts = [start for start, _ in occurrences]
+        duration = occurrences[0][1] - occurrences[0][0]
+        conflicts: Dict[date, Dict[str, Any]] = {}
+        for row in existing:
+            row_begin, row_end = _interval(row.start_date, row.end_date, row.start_time, row.end_time)
+            low = bisect_left(starts, row.start_date - duration)
+            high = bisect_right(starts, row.end_date)
+            for start, end in occurrences[low:high]:
+                if start in conflicts:
+                    continue
+                begin, finish = _interval(start, end, start_time, end_time)
+                if begin < row_end and row_begin < finish:
+                    conflicts[start] = {
+                        'date': format_date(start),
+                        'reservation_id': row.id,
+                        'reserver': row.reserver,
+                    }
+        return [conflicts[start] for start in sorted(conflicts)]
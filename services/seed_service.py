@@ -0,0 +1,663 @@
+"""
+합성 데이터 생성 서비스
+
+운영 규모의 데이터를 로컬에서 재현하기 위한 생성기. 모든 모델을 참조 무결성을
+지켜 채운다 (예약/사용 기록의 장비명은 실제 장비, 발명자/일정/사용자는 실제 연구원,
+주간 일정은 실제 주차 행, 점검 이력은 장비의 점검 주기와 일치).
+
+  - 같은 시드와 기준일이면 항상 같은 데이터가 생성된다
+  - 장비 사용 빈도는 Zipf 분포로 일부 장비에 몰리고, 예약 일부는 의도적으로 겹친다
+  - 행은 CHUNK_SIZE 단위 executemany로 입력하고 PK를 직접 지정해 조회 없이 FK를 연결한다
+"""
+import random
+from time import perf_counter
+from datetime import date, datetime, time, timedelta
+from itertools import accumulate
+from typing import Dict, Iterable, List, Optional
+
+from database import (
+    db, Project, Researcher, ProjectType, Equipment, EquipmentInspection, Reservation, UsageLog, Week,
+    WeeklyScheduleNew, Patent, PatentInventor, SafetyMaterial, Accident, AccidentDocument, AccidentMonthlyStat,
+    SafetyProcedure, Contact, Communication, Chemical
+)
+from services.cache_service import bump_versions
+from services.chemical_service import normalize_cas, parse_quantity
+from utils.date_utils import get_inspection_status
+
+CHUNK_SIZE = 10000
+
+# --scale 1 기준 행 수 (파생 테이블 포함 약 500만 행)
+DEFAULT_COUNTS = {
+    'researchers': 2000,
+    'projects': 3000,
+    'equipment': 20000,
+    'reservations': 200000,
+    'usage_logs': 4000000,
+    'weekly_schedules': 200000,
+    'patents': 50000,
+    'safety_materials': 2000,
+    'accidents': 20000,
+    'safety_procedures': 5000,
+    'contacts': 10000,
+    'communications': 100000,
+    'chemicals': 50000,
+}
+
+# 다시 채울 때 삭제 순서 (자식 테이블 먼저). 주차(weeks)는 캘린더라 유지
+RESET_ORDER = [
+    PatentInventor, AccidentDocument, AccidentMonthlyStat, EquipmentInspection, WeeklyScheduleNew,
+    UsageLog, Reservation, Equipment, Patent, Accident, SafetyProcedure, SafetyMaterial, Contact,
+    Communication, Chemical, Project, ProjectType, Researcher,
+]
+
+SURNAMES = '김이박최정강조윤장임한오서신권황안송류전홍고문양손배백허유남심노하곽성차주우구민나진지엄채원천방공현함변염여추도소석선설마길연위표명기반왕금옥육인'
+# 성씨 빈도 가중치 (앞쪽일수록 흔함)
+SURNAME_WEIGHTS = [21.5, 14.7, 8.4, 4.7, 4.3, 2.3, 2.1, 2.0, 1.9, 1.6, 1.5, 1.5, 1.5, 1.4, 1.4, 1.3, 1.2, 1.2,
+                   0.9, 0.9, 0.8, 0.8, 0.8, 0.7, 0.7, 0.6, 0.6, 0.5, 0.5, 0.5, 0.5, 0.4, 0.4, 0.4, 0.4, 0.4, 0.3,
+                   0.3, 0.3, 0.3, 0.3, 0.3, 0.3, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.1, 0.1, 0.1,
+                   0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1]
+GIVEN_FIRST = '민서도지하예시주수채준유은현건우태성영동재승정혜소진상경'
+GIVEN_SECOND = '준연윤우은아원호서민현진훈희수빈영혁석율린환결후경미지'
+
+DEPARTMENTS = ['소재연구팀', '공정개발팀', '분석센터', '바이오연구팀', '에너지연구팀', '전자소자팀', '시스템설계팀', '안전환경팀']
+POSITIONS = ['연구원', '선임연구원', '책임연구원', '수석연구원', '팀장']
+SPECIALIZATIONS = ['고분자', '촉매', '전기화학', '박막', '분광분석', '세포배양', '반도체 공정', '열유체', '머신러닝']
+PROJECT_TYPES = [('NATIONAL', '국가과제'), ('INTERNAL', '자체과제'), ('INDUSTRY', '산학협력'),
+                 ('CONTRACT', '위탁과제'), ('INTERNATIONAL', '국제공동'), ('BASIC', '기초연구')]
+EQUIPMENT_KINDS = [
+    ('주사전자현미경', 'SEM', '분석', 'JEOL'), ('투과전자현미경', 'TEM', '분석', 'FEI'),
+    ('X선회절분석기', 'XRD', '분석', 'Rigaku'), ('가스크로마토그래프', 'GC', '분석', 'Agilent'),
+    ('액체크로마토그래프', 'HPLC', '분석', 'Waters'), ('적외선분광기', 'FTIR', '분석', 'Thermo'),
+    ('원심분리기', 'CF', '전처리', 'Eppendorf'), ('진공증착기', 'EVAP', '공정', 'ULVAC'),
+    ('스퍼터', 'SPT', '공정', 'AJA'), ('전기로', 'FUR', '공정', '대흥과학'),
+    ('3D 프린터', '3DP', '가공', 'Stratasys'), ('CNC 밀링', 'CNC', '가공', '화천기계'),
+    ('오실로스코프', 'OSC', '측정', 'Keysight'), ('임피던스분석기', 'IMP', '측정', 'Solartron'),
+]
+INSPECTION_CYCLES = [90, 180, 365, 730]
+INSPECTION_CYCLE_WEIGHTS = [1, 3, 5, 1]
+LOCATIONS = [f'{building}동 {floor}{room:02d}호' for building in '가나다라' for floor in range(1, 5) for room in range(1, 11)]
+PURPOSES = ['시료 분석', '공정 조건 확인', '반복 측정', '외부 의뢰 분석', '교육 실습', '장비 성능 점검', '논문 데이터 측정']
+PATENT_OFFICES = ['KIPO', 'USPTO', 'EPO', 'JPO', 'CNIPA']
+PATENT_OFFICE_WEIGHTS = [6, 2, 1, 0.5, 0.5]
+PATENT_TOPICS = ['이차전지 양극재', '고분자 분리막', '박막 트랜지스터', '촉매 담지체', '바이오 센서', '열전 소자', '수처리 멤브레인']
+ACCIDENT_KINDS = ['시약 누출', '유리기구 파손에 의한 자상', '화상', '가스 누출 경보', '전기 누전', '낙하물 충돌', '미끄러짐']
+SEVERITIES = ['경미', '보통', '중대']
+SEVERITY_WEIGHTS = [70, 25, 5]
+PROCEDURE_CATEGORIES = ['화학물질 취급', '고압가스', '전기 작업', '레이저', '생물 안전', '폐기물 처리']
+CONTACT_CATEGORIES = ['협력업체', '고객사', '연구기관', '공공기관']
+COMPANY_PREFIXES = ['한빛', '대성', '미래', '세진', '태광', '우진', '삼화', '동일', '신성', '한국']
+COMPANY_SUFFIXES = ['테크', '소재', '정밀', '바이오', '화학', '전자', '연구소', '엔지니어링']
+QUESTION_TYPES = ['일반', '화학물질', '장비', '보호구', '교육']
+URGENCIES = ['보통', '긴급', '낮음']
+CHEMICALS = [
+    ('에탄올', '64-17-5', '3급'), ('메탄올', '67-56-1', '2급'), ('아세톤', '67-64-1', '3급'),
+    ('염산', '7647-01-0', '2급'), ('황산', '7664-93-9', '1급'), ('질산', '7697-37-2', '1급'),
+    ('수산화나트륨', '1310-73-2', '2급'), ('톨루엔', '108-88-3', '2급'), ('헥산', '110-54-3', '3급'),
+    ('클로로포름', '67-66-3', '2급'), ('과산화수소', '7722-84-1', '2급'), ('아세토니트릴', '75-05-8', '3급'),
+    ('디메틸설폭사이드', '67-68-5', '4급'), ('이소프로필알코올', '67-63-0', '3급'), ('불산', '7664-39-3', '1급'),
+]
+QUANTITIES = ['500 mL', '1 L', '2.5 L', '4 L', '100 g', '500 g', '1 kg', '25 g', '10 ea']
+
+
+def seed_counts(scale: float = 1.0, overrides: Optional[Dict[str, int]] = None) -> Dict[str, int]:
+    """기본 행 수에 배율을 적용하고 지정한 테이블 수로 덮어씀"""
+    counts = {name: max(int(count * scale), 1) for name, count in DEFAULT_COUNTS.items()}
+    for name, count in (overrides or {}).items():
+        if name not in counts:
+            raise ValueError(f'알 수 없는 항목: {name}')
+        counts[name] = count
+    return counts
+
+
+class DataSeeder:
+    """시드 기반 합성 데이터 생성기 (앱 컨텍스트 필요)"""
+
+    def __init__(self, seed: int = 42, base_date: Optional[date] = None, years: int = 3,
+                 chunk_size: int = CHUNK_SIZE, progress=None):
+        self.rng = random.Random(seed)
+        self.base_date = base_date or date.today()
+        self.base_time = datetime.combine(self.base_date, time(9))
+        self.years = years
+        self.chunk_size = chunk_size
+        self.progress = progress or (lambda message: None)
+        self.inserted: Dict[str, int] = {}
+        self._equipment_cum_weights: List[float] = []
+
+    # ---- 공통 도구 ----
+
+    def _insert(self, model, rows: Iterable[Dict]) -> int:
+        """행 생성기를 chunk_size 단위로 입력"""
+        table = model.__table__
+        chunk: List[Dict] = []
+        total = 0
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= self.chunk_size:
+                db.session.execute(table.insert(), chunk)
+                db.session.commit()
+                total += len(chunk)
+                chunk = []
+        if chunk:
+            db.session.execute(table.insert(), chunk)
+            db.session.commit()
+            total += len(chunk)
+        self.inserted[table.name] = self.inserted.get(table.name, 0) + total
+        self.progress(f'{table.name}: {total}행')
+        return total
+
+    def _past_date(self, max_days: int) -> date:
+        return self.base_date - timedelta(days=self.rng.randint(0, max_days))
+
+    def _timestamp(self, day: date) -> datetime:
+        return datetime.combine(day, time(self.rng.randint(8, 19), self.rng.randint(0, 59)))
+
+    def _names(self, count: int, unique: bool = True) -> List[str]:
+        """성씨 빈도를 반영한 한국어 이름 (unique이면 중복 없음)"""
+        rng = self.rng
+        names, seen = [], set()
+        collisions = 0
+        while len(names) < count:
+            # 흔한 성씨 조합이 소진되면 성씨를 고르게 선택
+            if collisions < 50:
+                surname = rng.choices(SURNAMES, weights=SURNAME_WEIGHTS)[0]
+            else:
+                surname = rng.choice(SURNAMES)
+            name = surname + rng.choice(GIVEN_FIRST) + rng.choice(GIVEN_SECOND)
+            if unique and name in seen:
+                collisions += 1
+                continue
+            collisions = 0
+            seen.add(name)
+            names.append(name)
+        return names
+
+    @staticmethod
+    def _zipf_cum_weights(count: int, exponent: float = 1.1) -> List[float]:
+        return list(accumulate(1.0 / (rank ** exponent) for rank in range(1, count + 1)))
+
+    # ---- 실행 ----
+
+    def ensure_empty(self) -> None:
+        for model in RESET_ORDER:
+            if db.session.query(model.__table__.c.id).first() is not None:
+                raise RuntimeError(f'{model.__tablename__} 테이블에 데이터가 있습니다. --reset으로 비운 뒤 생성하세요.')
+
+    def reset(self) -> None:
+        for model in RESET_ORDER:
+            db.session.execute(model.__table__.delete())
+        db.session.commit()
+
+    def run(self, counts: Dict[str, int]) -> Dict[str, int]:
+        """모든 모델 데이터 생성. 테이블별 입력 행 수 반환"""
+        from services.accident_stats_service import AccidentStatsService
+        from services.week_service import WeekService
+
+        self.ensure_empty()
+        # 항목이 빠지면 0행 (벤치마크처럼 일부 테이블만 채울 때)
+        counts = {name: counts.get(name, 0) for name in DEFAULT_COUNTS}
+        WeekService.sync_calendar(self.base_date.year - self.years, self.base_date.year + 1)
+
+        researchers = self._researchers(counts['researchers'])
+        projects = self._projects(counts['projects'], researchers)
+        equipment = self._equipment(counts['equipment'], researchers)
+        self._reservations(counts['reservations'], equipment, researchers)
+        self._usage_logs(counts['usage_logs'], equipment, researchers)
+        self._weekly_schedules(counts['weekly_schedules'], projects, researchers)
+        self._patents(counts['patents'], researchers)
+        self._safety_materials(counts['safety_materials'])
+        self._accidents(counts['accidents'], researchers)
+        self._safety_procedures(counts['safety_procedures'], researchers)
+        self._contacts(counts['contacts'])
+        self._communications(counts['communications'], researchers)
+        self._chemicals(counts['chemicals'])
+
+        AccidentStatsService.rebuild()
+        self.inserted[AccidentMonthlyStat.__tablename__] = db.session.query(AccidentMonthlyStat).count()
+        self.progress(f'{AccidentMonthlyStat.__tablename__}: {self.inserted[AccidentMonthlyStat.__tablename__]}행')
+        self._fix_sequences()
+        # Core 일괄 입력은 세션 이벤트를 거치지 않으므로 캐시 버전을 직접 올림
+        bump_versions(db.session.connection(), self.inserted.keys())
+        db.session.commit()
+        return dict(self.inserted)
+
+    def _fix_sequences(self) -> None:
+        """PK를 직접 지정했으므로 PostgreSQL 시퀀스를 최대 id로 맞춤"""
+        if db.engine.dialect.name != 'postgresql':
+            return
+        for model in RESET_ORDER:
+            if model is ProjectType:
+                continue
+            table = model.__tablename__
+            db.session.execute(db.text(
+                f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), COALESCE((SELECT MAX(id) FROM {table}), 1))"
+            ))
+        db.session.commit()
+
+    # ---- 모델별 생성 ----
+
+    def _researchers(self, count: int) -> List[str]:
+        rng = self.rng
+        names = self._names(count)
+        self._insert(Researcher, ({
+            'id': i + 1,
+            'employee_id': f'R{i + 1:06d}',
+            'name': name,
+            'position': rng.choices(POSITIONS, weights=[5, 4, 3, 1, 1])[0],
+            'department': rng.choice(DEPARTMENTS),
+            'specialization': rng.choice(SPECIALIZATIONS),
+            'email': f'r{i + 1:06d}@example.com',
+            'phone': f'010-{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}',
+            'hire_date': self._past_date(20 * 365),
+            'status': '재직' if rng.random() < 0.92 else '퇴직',
+            'created_date': self.base_time,
+        } for i, name in enumerate(names)))
+        return names
+
+    def _projects(self, count: int, researchers: List[str]) -> List[str]:
+        rng = self.rng
+        self._insert(ProjectType, ({'id': type_id, 'project_type': label} for type_id, label in PROJECT_TYPES))
+        names = []
+
+        def row(i):
+            start = self._past_date(self.years * 365)
+            end = start + timedelta(days=rng.choice([180, 365, 730, 1095]))
+            name = f'{rng.choice(PATENT_TOPICS)} 개발 과제 {i + 1:05d}'
+            names.append(name)
+            status = '완료' if end < self.base_date else rng.choices(['진행중', '중단'], weights=[9, 1])[0]
+            progress = 100 if status == '완료' else min(int((self.base_date - start).days / max((end - start).days, 1) * 100), 99)
+            return {
+                'id': i + 1,
+                'project_id': f'PRJ{i + 1:06d}',
+                'name': name,
+                'description': f'{name}에 대한 연구개발',
+                'leader': rng.choice(researchers),
+                'department': rng.choice(DEPARTMENTS),
+                'start_date': start,
+                'end_date': end,
+                'budget': float(rng.randint(5, 500) * 10000000),
+                'status': status,
+                'progress': progress,
+                'participants': ', '.join(rng.sample(researchers, min(len(researchers), rng.randint(2, 6)))),
+                'created_date': self._timestamp(start),
+                'updated_date': self.base_time,
+            }
+        self._insert(Project, (row(i) for i in range(count)))
+        return names
+
+    def _equipment(self, count: int, researchers: List[str]) -> List[str]:
+        """장비와 점검 주기에 맞춘 점검 이력. 인기순(사용 빈도 Zipf 순위)으로 정렬한 장비명 반환"""
+        rng = self.rng
+        names = []
+        inspections = []
+
+        def rows():
+            inspection_id = 0
+            for i in range(count):
+                name_ko, code, category, maker = EQUIPMENT_KINDS[i % len(EQUIPMENT_KINDS)]
+                name = f'{name_ko} {code}-{i + 1:05d}'
+                names.append(name)
+                cycle = rng.choices(INSPECTION_CYCLES, weights=INSPECTION_CYCLE_WEIGHTS)[0]
+                purchase = self._past_date(self.years * 365 + 5 * 365)
+
+                # 구입 후 주기마다 점검 (±10일 지연). 일부 장비는 최근 점검을 놓쳐 점검지연 상태
+                history = []
+                day = purchase + timedelta(days=cycle + rng.randint(-10, 10))
+                while day <= self.base_date:
+                    history.append(day)
+                    day = day + timedelta(days=cycle + rng.randint(-10, 10))
+                if history and rng.random() < 0.1:
+                    history.pop()
+                last = history[-1] if history else None
+                next_date = (last or purchase) + timedelta(days=cycle)
+
+                for day in history:
+                    inspection_id += 1
+                    result = rng.choices(['정상', '이상발견', '수리필요'], weights=[90, 7, 3])[0]
+                    inspections.append({
+                        'id': inspection_id,
+                        'equipment_id': i + 1,
+                        'inspection_date': day,
+                        'inspector': rng.choice(researchers),
+                        'inspection_type': rng.choices(['정기점검', '특별점검', '수리후점검'], weights=[90, 6, 4])[0],
+                        'result': result,
+                        'condition_before': '정상 작동' if result == '정상' else '성능 저하',
+                        'condition_after': '정상 작동',
+                        'findings': None if result == '정상' else '소모품 마모',
+                        'actions_taken': None if result == '정상' else '부품 교체',
+                        'next_inspection_date': day + timedelta(days=cycle),
+                        'created_date': self._timestamp(day),
+                    })
+                status = rng.choices(['사용가능', '사용중', '점검중', '고장'], weights=[80, 12, 5, 3])[0]
+                yield {
+                    'id': i + 1,
+                    'equipment_id': f'EQ{i + 1:07d}',
+                    'name': name,
+                    'category': category,
+                    'manufacturer': maker,
+                    'model': f'{code}-{rng.randint(100, 9999)}',
+                    'serial_number': f'SN{rng.randint(10 ** 7, 10 ** 8 - 1)}',
+                    'location': rng.choice(LOCATIONS),
+                    'purchase_date': purchase,
+                    'purchase_price': float(rng.randint(1, 300) * 1000000),
+                    'status': status,
+                    'manager': rng.choice(researchers),
+                    'inspection_cycle_days': cycle,
+                    'last_inspection_date': last,
+                    'next_inspection_date': next_date,
+                    'inspection_status': self._inspection_status(next_date),
+                    'created_date': self._timestamp(purchase),
+                }
+
+        self._insert(Equipment, rows())
+        self._insert(EquipmentInspection, inspections)
+        rng.shuffle(names)
+        return names
+
+    def _inspection_status(self, next_date: date) -> str:
+        if self.base_date == date.today():
+            return get_inspection_status(next_date)
+        # 기준일이 오늘이 아니면 같은 규칙을 기준일로 적용 (결정적 결과)
+        if next_date < self.base_date:
+            return '점검지연'
+        return '점검필요' if (next_date - self.base_date).days <= 30 else '정상'
+
+    def _popular(self, equipment: List[str], k: int) -> List[str]:
+        if len(self._equipment_cum_weights) != len(equipment):
+            self._equipment_cum_weights = self._zipf_cum_weights(len(equipment))
+        return self.rng.choices(equipment, cum_weights=self._equipment_cum_weights, k=k)
+
+    def _reservations(self, count: int, equipment: List[str], researchers: List[str]) -> None:
+        rng = self.rng
+
+        def rows():
+            previous = None
+            produced = 0
+            while produced < count:
+                batch = min(self.chunk_size, count - produced)
+                for equipment_name in self._popular(equipment, batch):
+                    produced += 1
+                    if previous is not None and rng.random() < 0.1:
+                        # 직전 예약과 같은 장비/날짜에 시간이 겹치는 예약 (중복 예약 재현)
+                        equipment_name, start, end, start_hour = previous
+                        start_hour = min(start_hour + rng.randint(0, 2), 17)
+                    else:
+                        start = self.base_date + timedelta(days=rng.randint(-self.years * 365, 60))
+                        end = start + timedelta(days=rng.choices([0, 1, 2, 6], weights=[80, 10, 6, 4])[0])
+                        start_hour = rng.randint(8, 16)
+                    end_hour = min(start_hour + rng.randint(1, 4), 22)
+                    if start > self.base_date:
+                        status = '예약'
+                    else:
+                        status = rng.choices(['완료', '취소'], weights=[93, 7])[0]
+                    previous = (equipment_name, start, end, start_hour)
+                    yield {
+                        'id': produced,
+                        'equipment_name': equipment_name,
+                        'reserver': rng.choice(researchers),
+                        'purpose': rng.choice(PURPOSES),
+                        'start_date': start,
+                        'end_date': end,
+                        'start_time': time(start_hour, rng.choice([0, 30])),
+                        'end_time': time(end_hour, rng.choice([0, 30])),
+                        'status': status,
+                        'created_date': self._timestamp(min(start, self.base_date) - timedelta(days=rng.randint(1, 14))),
+                    }
+
+        self._insert(Reservation, rows())
+
+    def _usage_logs(self, count: int, equipment: List[str], researchers: List[str]) -> None:
+        rng = self.rng
+        span = self.years * 365
+        base = self.base_date
+        conditions = ['정상', '정상', '정상', '양호', '이상 있음']
+
+        def rows():
+            produced = 0
+            while produced < count:
+                batch = min(self.chunk_size, count - produced)
+                users = rng.choices(researchers, k=batch)
+                for equipment_name, user in zip(self._popular(equipment, batch), users):
+                    produced += 1
+                    usage_date = base - timedelta(days=rng.randint(0, span))
+                    start_hour = rng.randint(8, 18)
+                    condition_after = rng.choice(conditions)
+                    yield {
+                        'id': produced,
+                        'equipment_name': equipment_name,
+                        'user': user,
+                        'usage_date': usage_date,
+                        'start_time': time(start_hour, rng.choice([0, 30])),
+                        'end_time': time(min(start_hour + rng.randint(1, 4), 23), rng.choice([0, 30])),
+                        'purpose': rng.choice(PURPOSES),
+                        'condition_before': '정상',
+                        'condition_after': condition_after,
+                        'issues': '측정값 편차 발생' if condition_after == '이상 있음' else None,
+                        'created_date': datetime.combine(usage_date, time(start_hour)),
+                    }
+
+        self._insert(UsageLog, rows())
+
+    def _weekly_schedules(self, count: int, projects: List[str], researchers: List[str]) -> None:
+        rng = self.rng
+        week_ids = [week_id for (week_id,) in db.session.query(Week.id).order_by(Week.start_date, Week.id).all()]
+        if not week_ids or not projects:
+            return
+
+        def row(i):
+            start = rng.randrange(len(week_ids))
+            end = min(start + rng.choices([0, 1, 2, 4], weights=[60, 20, 15, 5])[0], len(week_ids) - 1)
+            return {
+                'id': i + 1,
+                'project_name': rng.choice(projects),
+                'researcher_name': rng.choice(researchers),
+                'week_id': week_ids[start],
+                'start_week_id': week_ids[start],
+                'end_week_id': week_ids[end],
+                'title': rng.choice(['실험 수행', '데이터 분석', '보고서 작성', '회의', '시료 준비', '장비 교육']),
+                'description': None,
+                'status': rng.choice(['계획', '진행중', '완료']),
+                'priority': rng.choices(['보통', '높음', '낮음'], weights=[6, 3, 1])[0],
+                'created_at': self.base_time,
+                'updated_at': self.base_time,
+            }
+        self._insert(WeeklyScheduleNew, (row(i) for i in range(count)))
+
+    def _patents(self, count: int, researchers: List[str]) -> None:
+        rng = self.rng
+        links = []
+
+        def rows():
+            link_id = 0
+            for i in range(count):
+                inventors = rng.sample(range(len(researchers)), min(len(researchers), rng.randint(1, 5)))
+                names = [researchers[index] for index in inventors]
+                main_share = rng.choice([40, 50, 60, 100]) if len(names) > 1 else 100
+                co_share = (100 - main_share) // max(len(names) - 1, 1)
+                for position, (index, name) in enumerate(zip(inventors, names)):
+                    link_id += 1
+                    links.append({
+                        'id': link_id,
+                        'patent_id': i + 1,
+                        'researcher_id': index + 1,
+                        'inventor_name': name,
+                        'role': '대표발명자' if position == 0 else '공동발명자',
+                        'share': main_share if position == 0 else co_share,
+                        'position': position,
+                    })
+                application = self._past_date(10 * 365)
+                status = rng.choices(['출원', '공개', '등록', '거절', '포기'], weights=[3, 2, 4, 0.5, 0.5])[0]
+                registered = status == '등록'
+                yield {
+                    'id': i + 1,
+                    'patent_id': f'PT{i + 1:07d}',
+                    'title': f'{rng.choice(PATENT_TOPICS)} 및 그 제조 방법 ({i + 1})',
+                    'inventors': ', '.join(names),
+                    'application_number': f'10-{application.year}-{rng.randint(1000000, 9999999):07d}',
+                    'registration_number': f'10-{rng.randint(1000000, 2999999):07d}' if registered else None,
+                    'application_date': application,
+                    'publication_date': application + timedelta(days=548) if status in ('공개', '등록') else None,
+                    'status': status,
+                    'patent_office': rng.choices(PATENT_OFFICES, weights=PATENT_OFFICE_WEIGHTS)[0],
+                    'main_inventor': names[0],
+                    'main_inventor_share': main_share,
+                    'co_inventors': ', '.join(names[1:]),
+                    'created_date': self._timestamp(application),
+                    'updated_date': self.base_time,
+                }
+
+        # 발명자 행은 FK 대상인 특허 행을 모두 입력한 뒤에 입력
+        self._insert(Patent, rows())
+        self._insert(PatentInventor, links)
+
+    def _safety_materials(self, count: int) -> None:
+        rng = self.rng
+        self._insert(SafetyMaterial, ({
+            'id': i + 1,
+            'title': f'{rng.choice(PROCEDURE_CATEGORIES)} 안전교육 자료 {i + 1}',
+            'content': '안전 수칙과 비상 조치 요령을 정리한 교육 자료입니다.',
+            'link': f'https://example.com/safety/materials/{i + 1}',
+            'created_date': self._timestamp(self._past_date(self.years * 365)),
+            'updated_date': self.base_time,
+        } for i in range(count)))
+
+    def _accidents(self, count: int, researchers: List[str]) -> None:
+        rng = self.rng
+        documents = []
+
+        def rows():
+            document_id = 0
+            for i in range(count):
+                day = self._past_date(self.years * 365)
+                for j in range(rng.choices([0, 1, 2, 3], weights=[4, 3, 2, 1])[0]):
+                    document_id += 1
+                    documents.append({
+                        'id': document_id,
+                        'accident_id': i + 1,
+                        'title': ['사고 보고서', '현장 사진', '재발 방지 대책'][j],
+                        'url': f'https://example.com/accidents/{i + 1}/{j + 1}',
+                        'document_type': ['보고서', '사진', '대책'][j],
+                        'uploaded_date': self._timestamp(day),
+                    })
+                severity = rng.choices(SEVERITIES, weights=SEVERITY_WEIGHTS)[0]
+                yield {
+                    'id': i + 1,
+                    'accident_id': f'ACC{i + 1:07d}',
+                    'date': day,
+                    'time': time(rng.randint(8, 20), rng.randint(0, 59)),
+                    'location': rng.choice(LOCATIONS[:20]),
+                    'description': rng.choice(ACCIDENT_KINDS),
+                    'severity': severity,
+                    'injured_person': rng.choice(researchers) if severity != '경미' or rng.random() < 0.3 else None,
+                    'cause': '작업 절차 미준수',
+                    'action_taken': '응급 조치 후 보고',
+                    'status': '완료' if (self.base_date - day).days > 30 else rng.choice(['보고', '조사중']),
+                    'created_date': self._timestamp(day),
+                    'updated_date': self.base_time,
+                }
+
+        self._insert(Accident, rows())
+        self._insert(AccidentDocument, documents)
+
+    def _safety_procedures(self, count: int, researchers: List[str]) -> None:
+        rng = self.rng
+
+        def row(i):
+            review = self.base_date + timedelta(days=rng.randint(-90, 365))
+            status = rng.choices(['유효', '검토중', '폐기'], weights=[85, 10, 5])[0]
+            if status == '유효' and review < self.base_date:
+                status = '검토필요'
+            return {
+                'id': i + 1,
+                'title': f'{rng.choice(PROCEDURE_CATEGORIES)} 작업절차서 {i + 1}',
+                'description': '작업 전 점검, 보호구 착용, 비상 조치 절차',
+                'category': rng.choice(PROCEDURE_CATEGORIES),
+                'version': f'v{rng.randint(1, 5)}.{rng.randint(0, 9)}',
+                'responsible_person': rng.choice(researchers),
+                'review_date': review,
+                'status': status,
+                'procedure_link': f'https://example.com/procedures/{i + 1}',
+                'created_date': self._timestamp(self._past_date(self.years * 365)),
+                'updated_date': self.base_time,
+            }
+        self._insert(SafetyProcedure, (row(i) for i in range(count)))
+
+    def _contacts(self, count: int) -> None:
+        rng = self.rng
+        names = self._names(count, unique=False)
+        self._insert(Contact, ({
+            'id': i + 1,
+            'contact_id': f'CT{i + 1:07d}',
+            'name': name,
+            'company': rng.choice(COMPANY_PREFIXES) + rng.choice(COMPANY_SUFFIXES),
+            'position': rng.choice(['대리', '과장', '차장', '부장', '연구원', '교수']),
+            'department': rng.choice(['영업팀', '기술지원팀', '연구소', '구매팀']),
+            'phone': f'02-{rng.randint(100, 9999)}-{rng.randint(1000, 9999)}',
+            'email': f'c{i + 1:07d}@example.com',
+            'category': rng.choice(CONTACT_CATEGORIES),
+            'created_date': self.base_time,
+            'updated_date': self.base_time,
+        } for i, name in enumerate(names)))
+
+    def _communications(self, count: int, researchers: List[str]) -> None:
+        rng = self.rng
+        span_minutes = self.years * 365 * 24 * 60
+
+        def row(i):
+            created = self.base_time - timedelta(minutes=rng.randint(0, span_minutes))
+            safety_qa = rng.random() < 0.4
+            answered = safety_qa and rng.random() < 0.7
+            return {
+                'id': i + 1,
+                'comm_id': f'CM{i + 1:09d}',
+                'category': '안전 Q&A' if safety_qa else '자유소통',
+                'title': f'{rng.choice(QUESTION_TYPES)} 관련 문의 {i + 1}' if safety_qa else f'게시글 {i + 1}',
+                'content': '실험실 사용과 관련해 공유드립니다. ' * rng.randint(1, 10),
+                'author': rng.choice(researchers) if rng.random() < 0.8 else '익명',
+                'question_type': rng.choice(QUESTION_TYPES),
+                'urgency': rng.choices(URGENCIES, weights=[8, 1, 1])[0],
+                'views': int(rng.paretovariate(1.5) * 5),
+                'status': '답변완료' if answered else '공개',
+                'answer': '안전관리자 답변입니다.' if answered else None,
+                'created_date': created,
+                'updated_date': created,
+            }
+        self._insert(Communication, (row(i) for i in range(count)))
+
+    def _chemicals(self, count: int) -> None:
+        rng = self.rng
+
+        def row(i):
+            name, cas, hazard = rng.choice(CHEMICALS)
+            quantity = rng.choice(QUANTITIES)
+            amount, unit = parse_quantity(quantity)
+            return {
+                'id': i + 1,
+                'chem_id': f'CH{i + 1:07d}',
+                'chemical_name': name,
+                'cas_number': cas,
+                'cas_key': normalize_cas(cas),
+                'manufacturer': rng.choice(['Sigma-Aldrich', '대정화금', '덕산과학', 'TCI', 'Alfa Aesar']),
+                'hazard_class': hazard,
+                'storage_condition': rng.choice(['실온', '냉장', '시약장(환기)', '산 전용 캐비닛']),
+                'location': rng.choice(LOCATIONS),
+                'quantity': quantity,
+                'quantity_amount': amount,
+                'quantity_unit': unit,
+                'expiry_date': self.base_date + timedelta(days=rng.randint(-60, 3 * 365)),
+                'created_date': self.base_time,
+                'updated_date': self.base_time,
+            }
+        self._insert(Chemical, (row(i) for i in range(count)))
+
+
+def seed_database(scale: float = 1.0, overrides: Optional[Dict[str, int]] = None, seed: int = 42,
+                  base_date: Optional[date] = None, years: int = 3, reset: bool = False,
+                  echo=print) -> Dict[str, int]:
+    """합성 데이터 생성 (flask seed / tools/seed.py 공통, 앱 컨텍스트 필요)"""
+    seeder = DataSeeder(seed=seed, base_date=base_date, years=years, progress=echo)
+    if reset:
+        seeder.reset()
+    started = perf_counter()
+    inserted = seeder.run(seed_counts(scale, overrides))
+    echo(f'합계 {sum(inserted.values())}행, {perf_counter() - started:.1f}초')
+    return inserted
@@ -0,0 +1,159 @@
+"""
+모델 직렬화기 레지스트리
+
+모델별 필드 목록을 선언하면 시작 시 한 번 속성 접근 코드로 컴파일해 둔다.
+요청마다 필드 목록을 해석하거나 strftime을 호출하지 않고, 날짜/시간은
+컬럼 타입에 맞춘 isoformat 호출로 변환한다 (값이 없으면 '').
+
+    serializer = get_serializer(Patent, 'list')
+    rows = [serializer(p) for p in patents]
+
+필드 지정:
+    'title'                  속성 그대로
+    'id=chem_id'             다른 속성을 키 이름으로 내보냄
+    'created_date:date'      날짜 'YYYY-MM-DD' (DateTime 컬럼은 날짜 부분만)
+    'created_date:datetime'  'YYYY-MM-DD HH:MM:SS'
+    'start_time:time'        'HH:MM'
+    Computed(key, func)      func(obj) 결과
+
+ORM 인스턴스뿐 아니라 같은 이름의 컬럼을 가진 Row(db.session.query(컬럼...))도 직렬화할 수 있다.
+"""
+import keyword
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple, Union
+
+import sqlalchemy as sa
+
+from database import (
+    Patent, Chemical, Contact, Equipment, EquipmentInspection, SafetyMaterial, UsageLog, Reservation
+)
+from services.chemical_service import msds_file_url
+from services.patent_service import CO_INVENTOR_ROLE
+
+Serializer = Callable[[Any], Dict]
+
+
+class Computed:
+    """다른 필드로 계산하는 값"""
+
+    def __init__(self, key: str, func: Callable[[Any], Any]):
+        self.key = key
+        self.func = func
+
+
+FieldSpec = Union[str, Computed]
+
+_serializers: Dict[Tuple[type, str], Serializer] = {}
+
+
+def _format_expression(model, attr: str, fmt: str) -> str:
+    column = model.__table__.c[attr]
+    is_datetime = isinstance(column.type, sa.DateTime)
+    if fmt == 'date':
+        call = 'v.date().isoformat()' if is_datetime else 'v.isoformat()'
+    elif fmt == 'datetime':
+        call = "v.isoformat(sep=' ', timespec='seconds')"
+    elif fmt == 'time':
+        call = "v.isoformat(timespec='minutes')"
+    else:
+        raise ValueError(f'알 수 없는 형식: {fmt}')
+    return f"({call} if (v := o.{attr}) is not None else '')"
+
+
+def compile_serializer(model, fields: Sequence[FieldSpec]) -> Serializer:
+    """필드 목록을 dict 리터럴을 반환하는 함수 하나로 컴파일"""
+    namespace: Dict[str, Any] = {}
+    items: List[str] = []
+    for index, spec in enumerate(fields):
+        if isinstance(spec, Computed):
+            name = f'_computed_{index}'
+            namespace[name] = spec.func
+            items.append(f'{spec.key!r}: {name}(o)')
+            continue
+        key, renamed, source = spec.partition('=')
+        if not renamed:
+            source = spec
+        attr, _, fmt = source.partition(':')
+        if not renamed:
+            key = attr
+        if not attr.isidentifier() or keyword.iskeyword(attr):
+            raise ValueError(f'잘못된 필드: {spec}')
+        if attr not in model.__table__.c:
+            raise ValueError(f'{model.__name__}에 {attr} 컬럼이 없습니다.')
+        expression = _format_expression(model, attr, fmt) if fmt else f'o.{attr}'
+        items.append(f'{key!r}: {expression}')
+    source = 'def serialize(o):\n    return {' + ', '.join(items) + '}\n'
+    exec(compile(source, f'<serializer {model.__name__}>', 'exec'), namespace)
+    return namespace['serialize']
+
+
+def register(model, **views: Sequence[FieldSpec]) -> None:
+    """모델의 뷰별(list/detail 등) 필드 목록 등록"""
+    for view, fields in views.items():
+        _serializers[(model, view)] = compile_serializer(model, fields)
+
+
+def get_serializer(model, view: str = 'list') -> Serializer:
+    return _serializers[(model, view)]
+
+
+def serialize_all(model, objects: Iterable[Any], view: str = 'list') -> List[Dict]:
+    serialize = _serializers[(model, view)]
+    return [serialize(obj) for obj in objects]
+
+
+# ---- 모델별 필드 ----
+
+# co_inventor_shares는 inventor_links 관계를 읽으므로 조회 시 selectinload로 함께 가져올 것
+register(Patent, list=[
+    'id', 'title', 'application_number', 'registration_number', 'application_date:date', 'status',
+    'inventors', 'description', 'patent_office', 'main_inventor', 'main_inventor_share', 'co_inventors',
+    Computed('co_inventor_shares', lambda patent: {
+        link.inventor_name: link.share for link in patent.inventor_links if link.role == CO_INVENTOR_ROLE
+    }),
+    'application_draft_link', 'prior_art_report_link', 'application_form_link', 'application_review_link',
+    'office_action_link', 'response_link', 'amendment_link', 'publication_link', 'registration_review_link',
+    'notes', 'created_date:date',
+])
+
+register(Chemical, list=[
+    'id=chem_id', 'chemical_name', 'cas_number', 'manufacturer', 'hazard_class', 'storage_condition',
+    'flash_point', 'exposure_limit', 'first_aid', 'disposal_method', 'msds_file_link',
+    Computed('msds_local_url', lambda chem: msds_file_url(chem.msds_hash)),
+    'location', 'quantity', 'expiry_date:date', 'created_date:date',
+])
+
+register(Contact, list=[
+    'id', 'contact_id', 'name', 'company', 'position', 'department', 'phone', 'email', 'address',
+    'category', 'relationship', 'notes', 'created_date:date',
+])
+
+register(Equipment, list=[
+    'id', 'name', 'model', 'manufacturer', 'location', 'status',
+    Computed('asset_number', lambda equipment: ''),
+    'purchase_date:date', 'maintenance_date:date', 'inspection_cycle_days', 'last_inspection_date:date',
+    'next_inspection_date:date', 'inspection_status', 'notes', 'created_date:date',
+])
+
+# equipment_name은 equipment 관계를 읽으므로 조회 시 contains_eager/joinedload로 함께 가져올 것
+register(EquipmentInspection, list=[
+    'id', 'equipment_id', Computed('equipment_name', lambda inspection: inspection.equipment.name),
+    'inspection_date:date', 'inspector', 'inspection_type', 'result', 'condition_before', 'condition_after',
+    'findings', 'actions_taken',
+    Computed('next_inspection_date', lambda inspection: inspection.next_inspection_date.isoformat()
+             if inspection.next_inspection_date else None),
+    'notes', 'created_date:date',
+])
+
+register(SafetyMaterial, list=[
+    'id', 'title', 'content', 'link', 'created_date:datetime', 'updated_date:datetime',
+])
+
+register(UsageLog, list=[
+    'id', 'equipment_name', 'user', 'usage_date:date', 'start_time:time', 'end_time:time', 'purpose', 'notes',
+    'condition_before', 'condition_after', 'issues', 'created_date:date',
+])
+
+register(Reservation, list=[
+    'id', 'equipment_name', 'reserver', 'purpose', 'start_date:date', 'end_date:date',
+    'start_time:time', 'end_time:time', 'status', 'notes', 'created_date:date', 'series_id',
+])
@@ -0,0 +1,195 @@
+"""
+템플릿 캐시 서비스
+
+- 바이트코드 캐시: 컴파일된 Jinja 템플릿을 디스크(JINJA_BYTECODE_CACHE_DIR)에 저장해
+  같은 호스트의 워커가 공유한다. max_requests로 워커가 재시작돼도 다시 컴파일하지 않고,
+  원본이 바뀌면 체크섬이 달라져 자동으로 다시 컴파일한다.
+- 조각 캐시: {% cache 'patents' %} ... {% endcache %} 사이의 렌더링 결과를 테이블 버전
+  기반 VersionedCache에 저장한다. 해당 테이블에 쓰기가 생기면 모든 워커에서 무효화된다.
+  뒤에 키를 더 줄 수 있다: {% cache 'equipment', today %}
+- 렌더링 통계: 페이지 템플릿별 렌더링 횟수, 경과/CPU 시간, 조각 캐시 적중 수를 워커 단위로
+  모으고 응답에 Server-Timing 헤더로 붙인다.
+
+조각 안에서 쓰는 목록은 lazy_rows로 넘기면 캐시 적중 시 조회 자체를 건너뛴다.
+"""
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from flask import g, before_render_template, template_rendered
+from jinja2 import FileSystemBytecodeCache, nodes
+from jinja2.ext import Extension
+
+from database import Patent, PatentInventor, Chemical, Equipment, Contact
+from services.cache_service import VersionedCache
+
+# 조각 캐시 이름별 의존 테이블. 모든 워커가 시작할 때 버전 추적을 등록해야 하므로 여기서 미리 만든다
+FRAGMENT_CACHES: Dict[str, VersionedCache] = {
+    'patents': VersionedCache(Patent.__tablename__, PatentInventor.__tablename__, max_entries=16),
+    'chemicals': VersionedCache(Chemical.__tablename__, max_entries=16),
+    'equipment': VersionedCache(Equipment.__tablename__, max_entries=16),
+    'contacts': VersionedCache(Contact.__tablename__, max_entries=16),
+}
+
+
+class lazy_rows:
+    """처음 순회할 때 한 번만 계산하는 목록 (조각 캐시 적중 시 조회를 건너뛰기 위함)"""
+
+    def __init__(self, compute: Callable[[], List[Any]]):
+        self._compute = compute
+        self._rows: Optional[List[Any]] = None
+
+    @property
+    def rows(self) -> List[Any]:
+        if self._rows is None:
+            self._rows = list(self._compute())
+        return self._rows
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __getitem__(self, index):
+        return self.rows[index]
+
+
+class FragmentCacheExtension(Extension):
+    """{% cache '이름'[, 키...] %} ... {% endcache %} 태그"""
+
+    tags = {'cache'}
+
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+        args = [parser.parse_expression()]
+        while parser.stream.skip_if('comma'):
+            args.append(parser.parse_expression())
+        body = parser.parse_statements(('name:endcache',), drop_needle=True)
+        # 같은 캐시 이름을 여러 템플릿/위치에서 써도 섞이지 않도록 템플릿 이름과 줄 번호를 키에 포함
+        location = nodes.Const(f'{parser.name}:{lineno}')
+        call = self.call_method('_render', [location, nodes.List(args)])
+        return nodes.CallBlock(call, [], [], body).set_lineno(lineno)
+
+    def _render(self, location: str, args: List[Any], caller: Callable[[], str]) -> str:
+        name, key = args[0], tuple(args[1:])
+        # 디버그 모드에서는 템플릿 수정이 바로 보이도록 캐시하지 않음
+        if not template_cache.fragments_enabled or template_cache.app.debug:
+            return caller()
+        cache = FRAGMENT_CACHES.get(name)
+        if cache is None:
+            raise KeyError(f'등록되지 않은 조각 캐시입니다: {name}')
+        value, hit = cache.get_or_compute((location, key), caller)
+        template_cache.record_fragment(hit)
+        return value
+
+
+class TemplateCache:
+    """바이트코드 캐시/조각 캐시 설정과 워커 단위 렌더링 통계"""
+
+    def __init__(self, app=None):
+        self.app = None
+        self.fragments_enabled = True
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._local = threading.local()
+        os.register_at_fork(after_in_child=self._reset_stats)
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app) -> None:
+        self.app = app
+        app.extensions['template_cache'] = self
+        cache_dir = app.config.get('JINJA_BYTECODE_CACHE_DIR')
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            app.jinja_env.bytecode_cache = FileSystemBytecodeCache(cache_dir)
+        self.fragments_enabled = app.config.get('TEMPLATE_FRAGMENT_CACHE', True)
+        app.jinja_env.add_extension(FragmentCacheExtension)
+        before_render_template.connect(self._before_render, app)
+        template_rendered.connect(self._after_render, app)
+        app.after_request(self._add_server_timing)
+
+    def warm(self) -> int:
+        """모든 템플릿을 미리 로드 (preload_app이면 마스터에서 한 번 컴파일해 워커가 물려받음)"""
+        env = self.app.jinja_env
+        loaded = 0
+        for name in env.list_templates(extensions=('html',)):
+            try:
+                env.get_template(name)
+                loaded += 1
+            except Exception as e:
+                self.app.logger.warning(f'템플릿 사전 로드 실패 {name}: {e}')
+        return loaded
+
+    # ---- 렌더링 통계 ----
+
+    def _reset_stats(self) -> None:
+        self._lock = threading.Lock()
+        self._stats = {}
+        self._local = threading.local()
+
+    def _stack(self) -> list:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _before_render(self, sender, template, context, **extra) -> None:
+        self._stack().append((time.perf_counter(), time.thread_time()))
+
+    def _after_render(self, sender, template, context, **extra) -> None:
+        stack = self._stack()
+        if not stack:
+            return
+        started, cpu_started = stack.pop()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        cpu_ms = (time.thread_time() - cpu_started) * 1000
+        with self._lock:
+            stats = self._stats.setdefault(template.name, {
+                'renders': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'cpu_ms': 0.0, 'fragment_hits': 0, 'fragment_misses': 0
+            })
+            stats['renders'] += 1
+            stats['total_ms'] += elapsed_ms
+            stats['max_ms'] = max(stats['max_ms'], elapsed_ms)
+            stats['cpu_ms'] += cpu_ms
+            hits, misses = getattr(self._local, 'fragments', (0, 0))
+            stats['fragment_hits'] += hits
+            stats['fragment_misses'] += misses
+        self._local.fragments = (0, 0)
+        if not stack:
+            try:
+                g.render_timing = (elapsed_ms, cpu_ms)
+            except RuntimeError:  # 앱 컨텍스트 밖에서 렌더링한 경우
+                pass
+
+    def record_fragment(self, hit: bool) -> None:
+        hits, misses = getattr(self._local, 'fragments', (0, 0))
+        self._local.fragments = (hits + 1, misses) if hit else (hits, misses + 1)
+
+    def _add_server_timing(self, response):
+        timing = g.pop('render_timing', None)
+        if timing is not None:
+            response.headers.add('Server-Timing', f'render;dur={timing[0]:.1f}, render-cpu;dur={timing[1]:.1f}')
+        return response
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """이 워커의 템플릿별 렌더링 통계 (평균 경과 시간 내림차순)"""
+        with self._lock:
+            rows = [
+                {
+                    'template': name,
+                    'renders': s['renders'],
+                    'avg_ms': round(s['total_ms'] / s['renders'], 2),
+                    'max_ms': round(s['max_ms'], 2),
+                    'avg_cpu_ms': round(s['cpu_ms'] / s['renders'], 2),
+                    'fragment_hits': s['fragment_hits'],
+                    'fragment_misses': s['fragment_misses'],
+                }
+                for name, s in self._stats.items()
+            ]
+        return sorted(rows, key=lambda row: row['avg_ms'], reverse=True)
+
+
+template_cache = TemplateCache()
@@ -0,0 +1,114 @@
+"""
+게시글 조회수 지연 기록(write-behind) 서비스
+
+조회 시마다 communications 행을 UPDATE하면 인기 게시글에 쓰기 잠금이 몰린다
+(SQLite는 DB 전체 잠금). 조회수 증가분은 워커 메모리에 모아 두었다가
+주기적으로 한 번의 배치 UPDATE(views = views + n)로 반영한다.
+"""
+import atexit
+import os
+import threading
+from typing import Dict, Optional
+
+from sqlalchemy import bindparam
+
+from database import db, Communication
+
+
+class ViewCounter:
+    """워커 프로세스 단위 조회수 버퍼"""
+
+    def __init__(self, app=None, flush_interval: float = 5.0):
+        self.app = None
+        self.flush_interval = flush_interval
+        self._reset()
+        os.register_at_fork(after_in_child=self._reset)
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app) -> None:
+        self.app = app
+        self.flush_interval = float(app.config.get('VIEW_COUNTER_FLUSH_INTERVAL', self.flush_interval))
+        app.extensions['view_counter'] = self
+        app.jinja_env.globals['live_views'] = self.current
+        atexit.register(self.flush)
+
+    def _reset(self) -> None:
+        """초기화 (fork 이후 자식 프로세스에서는 부모의 잠금/스레드를 물려받지 않도록 새로 만든다)"""
+        self._lock = threading.Lock()
+        self._pending: Dict[int, int] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.flushed_batches = 0
+
+    def increment(self, post_id: int, amount: int = 1) -> int:
+        """조회수 증가분을 버퍼에 기록하고 아직 반영되지 않은 증가분을 반환"""
+        self._ensure_flusher()
+        with self._lock:
+            count = self._pending.get(post_id, 0) + amount
+            self._pending[post_id] = count
+        return count
+
+    def pending(self, post_id: int) -> int:
+        """아직 DB에 반영되지 않은 증가분"""
+        return self._pending.get(post_id, 0)
+
+    def current(self, post) -> int:
+        """DB 값 + 이 워커의 미반영 증가분 (거의 실시간 조회수)"""
+        return (post.views or 0) + self.pending(post.id)
+
+    def flush(self) -> int:
+        """버퍼의 증가분을 배치 UPDATE로 반영하고 반영한 게시글 수를 반환"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending or self.app is None:
+            return 0
+
+        table = Communication.__table__
+        stmt = table.update().where(table.c.id == bindparam('b_id')).values(
+            views=db.func.coalesce(table.c.views, 0) + bindparam('b_delta'),
+            # 조회수 반영은 게시글 수정이 아니므로 onupdate(updated_date)를 적용하지 않는다
+            updated_date=table.c.updated_date
+        )
+        rows = [{'b_id': post_id, 'b_delta': delta} for post_id, delta in pending.items()]
+
+        with self.app.app_context():
+            try:
+                db.session.execute(stmt, rows)
+                db.session.commit()
+            except Exception as e:
+                db.session.rollback()
+                # 실패한 증가분은 다음 주기에 다시 시도
+                with self._lock:
+                    for post_id, delta in pending.items():
+                        self._pending[post_id] = self._pending.get(post_id, 0) + delta
+                self.app.logger.error(f"조회수 반영 중 오류: {str(e)}")
+                return 0
+            finally:
+                db.session.remove()
+
+        self.flushed_batches += 1
+        return len(rows)
+
+    def stop(self) -> None:
+        """백그라운드 반영 스레드를 멈추고 남은 증가분을 반영"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+
+    def _ensure_flusher(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name='view-counter-flush', daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+
+view_counter = ViewCounter()
@@ -0,0 +1,135 @@
+"""
+주차(Week) 캘린더 서비스
+
+weeks 테이블은 설정된 연도 범위만큼 미리 생성해 두고, 각 워커는
+(연, 월, 주차) -> week_id 매핑을 불변 객체로 메모리에 보관한다.
+일정 저장 시 주차 조회/생성을 위한 별도 쿼리가 필요 없다.
+"""
+import calendar
+from datetime import date
+from types import MappingProxyType
+from typing import Dict, Iterator, Mapping, Optional, Tuple
+
+from sqlalchemy import func, inspect, text
+from sqlalchemy.exc import IntegrityError
+
+from database import db, Week, WeeklyScheduleNew
+
+# 주간 일정 화면(weekly-schedule.js)과 동일하게 한 달을 7일 단위 최대 5주로 나눈다.
+MAX_WEEKS_PER_MONTH = 5
+
+WeekKey = Tuple[int, int, int]
+
+_week_ids: Mapping[WeekKey, int] = MappingProxyType({})
+_week_keys: Mapping[int, WeekKey] = MappingProxyType({})
+
+
+def iter_month_weeks(year: int, month: int) -> Iterator[Tuple[int, date, date]]:
+    """해당 월의 (주차, 시작일, 종료일)을 순서대로 반환"""
+    last_day = calendar.monthrange(year, month)[1]
+    for week_number in range(1, MAX_WEEKS_PER_MONTH + 1):
+        first = (week_number - 1) * 7 + 1
+        if first > last_day:
+            break
+        yield week_number, date(year, month, first), date(year, month, min(week_number * 7, last_day))
+
+
+class WeekService:
+    """주차 캘린더 관리 서비스 클래스"""
+
+    @staticmethod
+    def sync_calendar(start_year: int, end_year: int) -> int:
+        """연도 범위의 주차 행을 생성/보정하고 메모리 매핑을 갱신한다. 새로 생성한 행 수를 반환"""
+        WeekService._ensure_unique_index()
+
+        existing = {
+            (w.year, w.month, w.week_number): w
+            for w in Week.query.filter(Week.year.between(start_year, end_year)).all()
+        }
+        new_rows = []
+        for year in range(start_year, end_year + 1):
+            for month in range(1, 13):
+                for week_number, start_date, end_date in iter_month_weeks(year, month):
+                    week = existing.get((year, month, week_number))
+                    if week is None:
+                        new_rows.append({
+                            'year': year,
+                            'month': month,
+                            'week_number': week_number,
+                            'start_date': start_date,
+                            'end_date': end_date,
+                        })
+                    elif week.start_date is None or week.end_date is None:
+                        week.start_date = start_date
+                        week.end_date = end_date
+
+        try:
+            if new_rows:
+                db.session.execute(Week.__table__.insert(), new_rows)
+            db.session.commit()
+        except IntegrityError:
+            # 다른 프로세스가 먼저 생성한 경우 - 이미 채워진 행을 그대로 사용
+            db.session.rollback()
+            new_rows = []
+
+        WeekService.reload()
+        return len(new_rows)
+
+    @staticmethod
+    def reload() -> None:
+        """weeks 테이블 전체를 읽어 불변 매핑으로 교체"""
+        global _week_ids, _week_keys
+        rows = db.session.query(Week.id, Week.year, Week.month, Week.week_number).all()
+        ids: Dict[WeekKey, int] = {}
+        keys: Dict[int, WeekKey] = {}
+        for week_id, year, month, week_number in rows:
+            ids[(year, month, week_number)] = week_id
+            keys[week_id] = (year, month, week_number)
+        _week_ids = MappingProxyType(ids)
+        _week_keys = MappingProxyType(keys)
+
+    @staticmethod
+    def get_week_id(year: int, month: int, week_number: int) -> Optional[int]:
+        """(연, 월, 주차)에 해당하는 week_id (쿼리 없음)"""
+        return _week_ids.get((year, month, week_number))
+
+    @staticmethod
+    def get_week_key(week_id: int) -> Optional[WeekKey]:
+        """week_id에 해당하는 (연, 월, 주차) (쿼리 없음)"""
+        return _week_keys.get(week_id)
+
+    @staticmethod
+    def _ensure_unique_index() -> None:
+        """기존 DB에 (year, month, week_number) 유니크 제약이 없으면 중복을 병합한 뒤 생성"""
+        inspector = inspect(db.engine)
+        columns = ['year', 'month', 'week_number']
+        if any(sorted(uc['column_names']) == sorted(columns)
+               for uc in inspector.get_unique_constraints('weeks')):
+            return
+        if any(ix.get('unique') and sorted(ix['column_names']) == sorted(columns)
+               for ix in inspector.get_indexes('weeks')):
+            return
+
+        # 중복 주차는 가장 작은 id로 병합
+        canonical = db.session.query(
+            Week.year, Week.month, Week.week_number, func.min(Week.id)
+        ).group_by(Week.year, Week.month, Week.week_number).having(func.count(Week.id) > 1).all()
+        for year, month, week_number, keep_id in canonical:
+            duplicate_ids = [
+                week_id for (week_id,) in db.session.query(Week.id).filter(
+                    Week.year == year, Week.month == month,
+                    Week.week_number == week_number, Week.id != keep_id
+                )
+            ]
+            for column in (WeeklyScheduleNew.week_id, WeeklyScheduleNew.start_week_id, WeeklyScheduleNew.end_week_id):
+                WeeklyScheduleNew.query.filter(column.in_(duplicate_ids)).update(
+                    {column: keep_id}, synchronize_session=False
+                )
+            Week.query.filter(Week.id.in_(duplicate_ids)).delete(synchronize_session=False)
+        db.session.commit()
+
+        db.session.execute(text(
+            'CREATE UNIQUE INDEX IF NOT EXISTS uq_weeks_year_month_week '
+            'ON weeks (year, month, week_number)'
+        ))
+        db.session.commit()
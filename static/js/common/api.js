@@ -95,6 +95,182 @@ async function apiDelete(url) {
     });
 }
 
+// 배치 API 설정: 연산을 모아 보내기까지 기다리는 시간(ms)과 요청당 최대 연산 수 (서버 BATCH_MAX_OPERATIONS 이하)
+const BATCH_CONFIG = {
+    url: '/api/batch',
+    flushDelay: 50,
+    maxOperations: 100
+};
+
+// 아직 보내지 않은 연산: {key, entity, op, id, data, waiters: [{resolve, reject}]}
+const batchQueue = [];
+let batchTimer = null;
+let batchInFlight = false;
+
+function toBatchOperation(item) {
+    const operation = { entity: item.entity, op: item.op, data: item.data };
+    if (item.id !== null) {
+        operation.id = item.id;
+    }
+    return operation;
+}
+
+/**
+ * 배치 API 호출 - 여러 연산을 한 번의 요청, 하나의 트랜잭션으로 처리
+ * @param {Array} operations - [{entity, op, id, data}] (entity: reservation/usage_log/schedule/inspection,
+ *                             op: create/update/delete, id에 '$0'을 쓰면 0번 create 연산이 만든 id)
+ * @param {boolean} atomic - true면 하나라도 실패할 때 전체 롤백, false면 실패한 연산만 되돌림
+ * @returns {Promise} API 응답 (data.results에 연산별 결과. 연산 실패는 throw하지 않음)
+ */
+async function apiBatch(operations, atomic = true) {
+    const response = await fetch(API_CONFIG.baseURL + BATCH_CONFIG.url, {
+        method: 'POST',
+        headers: API_CONFIG.headers,
+        body: JSON.stringify({ operations, atomic })
+    });
+    // 연산 실패(400/404)도 연산별 결과가 담긴 JSON으로 응답한다
+    const contentType = response.headers.get('Content-Type') || '';
+    if (!contentType.includes('application/json')) {
+        throw new Error(`HTTP error! status: ${response.status}`);
+    }
+    return response.json();
+}
+
+/**
+ * 연산을 대기열에 넣고 flushDelay 안에 들어온 연산과 묶어 /api/batch 한 번으로 보낸다.
+ * 같은 대상의 연속된 update는 하나로 합치고, delete가 들어오면 대기 중인 update는 보내지 않는다.
+ * 대기열의 연산은 서로 독립된 사용자 동작이므로 atomic=false로 보내 하나의 실패가 다른 연산을 되돌리지 않는다.
+ * @param {string} entity - reservation, usage_log, schedule, inspection
+ * @param {string} op - create, update, delete
+ * @param {number|null} id - 대상 id (create는 null)
+ * @param {Object} data - 변경할 필드 (update는 전달한 필드만 반영)
+ * @returns {Promise} 연산 결과 {success: true, id}. 실패하면 Error로 reject
+ */
+function queueBatchOperation(entity, op, id = null, data = {}) {
+    return new Promise((resolve, reject) => {
+        const waiter = { resolve, reject };
+        const key = id === null ? null : `${entity}:${id}`;
+        const pending = key === null ? [] : batchQueue.filter(item => item.key === key);
+        const last = pending[pending.length - 1];
+
+        if (op === 'update' && last && last.op === 'update') {
+            Object.assign(last.data, data);
+            last.waiters.push(waiter);
+        } else {
+            const item = { key, entity, op, id, data: { ...data }, waiters: [waiter] };
+            if (op === 'delete') {
+                // 곧 삭제될 대상의 수정은 보내지 않고 삭제 결과를 함께 받는다
+                pending.filter(p => p.op === 'update').forEach(p => {
+                    batchQueue.splice(batchQueue.indexOf(p), 1);
+                    item.waiters.push(...p.waiters);
+                });
+            }
+            batchQueue.push(item);
+        }
+
+        if (batchQueue.length >= BATCH_CONFIG.maxOperations) {
+            flushBatchQueue();
+        } else if (batchTimer === null) {
+            batchTimer = setTimeout(flushBatchQueue, BATCH_CONFIG.flushDelay);
+        }
+    });
+}
+
+/**
+ * 대기 중인 연산을 바로 전송. 요청은 한 번에 하나씩 보내 연산 순서를 유지한다
+ */
+async function flushBatchQueue() {
+    clearTimeout(batchTimer);
+    batchTimer = null;
+    if (batchInFlight) {
+        return;  // 진행 중인 전송이 끝나면 남은 연산을 이어서 보낸다
+    }
+    batchInFlight = true;
+    try {
+        while (batchQueue.length > 0) {
+            const items = batchQueue.splice(0, BATCH_CONFIG.maxOperations);
+            try {
+                const response = await apiBatch(items.map(toBatchOperation), false);
+                const results = (response.data && response.data.results) || [];
+                items.forEach((item, index) => {
+                    const result = results[index];
+                    if (result && result.success) {
+                        item.waiters.forEach(waiter => waiter.resolve(result));
+                    } else {
+                        const error = new Error((result && result.error) || response.error || '처리 중 오류가 발생했습니다.');
+                        item.waiters.forEach(waiter => waiter.reject(error));
+                    }
+                });
+            } catch (error) {
+                console.error('Batch Request Error:', error);
+                items.forEach(item => item.waiters.forEach(waiter => waiter.reject(error)));
+            }
+        }
+    } finally {
+        batchInFlight = false;
+    }
+}
+
+// 페이지를 떠날 때 대기 중인 연산이 버려지지 않도록 sendBeacon으로 전송 (응답은 받지 않음)
+window.addEventListener('pagehide', () => {
+    if (batchQueue.length === 0 || !navigator.sendBeacon) {
+        return;
+    }
+    clearTimeout(batchTimer);
+    batchTimer = null;
+    const operations = batchQueue.splice(0, BATCH_CONFIG.maxOperations).map(toBatchOperation);
+    const body = new Blob([JSON.stringify({ operations, atomic: false })], { type: 'application/json' });
+    navigator.sendBeacon(API_CONFIG.baseURL + BATCH_CONFIG.url, body);
+});
+
+// 변경 이벤트 스트림(SSE) 설정
+const EVENTS_CONFIG = {
+    url: '/events/stream',
+    refreshDelay: 300
+};
+
+/**
+ * 다른 사용자의 변경을 이벤트 스트림으로 받는다 (주기적으로 목록을 다시 불러오지 않음).
+ * refreshDelay 안에 들어온 이벤트는 모아서 onChange를 한 번만 부르고, 이 페이지의 배치 연산이
+ * 대기/전송 중이면 끝날 때까지 미룬다. 놓친 이벤트가 있으면(reset) {op: 'reset'}을 전달한다.
+ * 서버가 스트림을 제공하지 않으면(503) 연결이 닫히고 화면은 기존처럼 동작한다.
+ * @param {Array} entities - reservation, schedule, usage_log, inspection
+ * @param {Function} onChange - 모인 이벤트 목록 [{entity, id, op, version}]을 받는 콜백
+ * @returns {EventSource|null} 연결 (close()로 해제)
+ */
+function subscribeChanges(entities, onChange) {
+    if (!window.EventSource) {
+        return null;
+    }
+    const source = new EventSource(
+        `${API_CONFIG.baseURL}${EVENTS_CONFIG.url}?entities=${encodeURIComponent(entities.join(','))}`
+    );
+    let pending = [];
+    let timer = null;
+
+    const deliver = () => {
+        timer = null;
+        if (batchQueue.length > 0 || batchInFlight) {
+            timer = setTimeout(deliver, EVENTS_CONFIG.refreshDelay);
+            return;
+        }
+        const changes = pending;
+        pending = [];
+        onChange(changes);
+    };
+    const enqueue = change => {
+        pending.push(change);
+        if (timer === null) {
+            timer = setTimeout(deliver, EVENTS_CONFIG.refreshDelay);
+        }
+    };
+
+    source.addEventListener('change', event => enqueue(JSON.parse(event.data)));
+    source.addEventListener('reset', () => enqueue({ op: 'reset' }));
+    window.addEventListener('pagehide', () => source.close());
+    return source;
+}
+
 /**
  * API 응답 처리
  * @param {Object} response - API 응답
@@ -105,6 +105,9 @@ function initializeEquipmentCalendar() {
     
     calendar.render();
     
+    // 다른 사용자의 예약 변경은 이벤트 스트림으로 받아 다시 불러온다
+    subscribeChanges(['reservation'], () => calendar.refetchEvents());
+    
     // Setup view buttons
     setupViewControls();
 }
@@ -117,31 +120,40 @@ function setupViewControls() {
     }
 }
 
+function toLocalDateString(date) {
+    const pad = (n) => String(n).padStart(2, '0');
+    return `${date.getFullYear()}-${pad(date.getMonth() + 1)}-${pad(date.getDate())}`;
+}
+
+function toLocalTimeString(date) {
+    const pad = (n) => String(n).padStart(2, '0');
+    return `${pad(date.getHours())}:${pad(date.getMinutes())}`;
+}
+
 function updateEventTiming(event) {
-    const payload = {
-        start: event.start.toISOString(),
-        end: event.end ? event.end.toISOString() : event.start.toISOString()
+    // 종일 일정의 end는 다음 날 0시(제외 경계)이므로 하루 앞당긴다
+    let end = event.end || event.start;
+    if (event.allDay && event.end) {
+        end = new Date(event.end.getTime());
+        end.setDate(end.getDate() - 1);
+    }
+    const data = {
+        start_date: toLocalDateString(event.start),
+        end_date: toLocalDateString(end)
     };
+    if (!event.allDay) {
+        data.start_time = toLocalTimeString(event.start);
+        data.end_time = toLocalTimeString(end);
+    }
     
-    fetch(`/equipment/reservations/update/${event.id}`, {
-        method: 'POST',
-        headers: {
-            'Content-Type': 'application/json',
-        },
-        body: JSON.stringify(payload)
-    })
-    .then(response => response.json())
-    .then(result => {
-        if (result.success) {
-            showNotification('예약 시간이 변경되었습니다.', 'success');
-        } else {
-            showNotification(result.message, 'error');
-            calendar.refetchEvents(); // Revert changes
-        }
+    // 연속된 드래그/크기 조절은 queueBatchOperation(common/api.js)이 하나의 /api/batch 요청으로 묶는다
+    queueBatchOperation('reservation', 'update', event.id, data)
+    .then(() => {
+        showNotification('예약 시간이 변경되었습니다.', 'success');
     })
     .catch(error => {
         console.error('Error:', error);
-        showNotification('시간 변경 중 오류가 발생했습니다.', 'error');
+        showNotification(error.message || '시간 변경 중 오류가 발생했습니다.', 'error');
         calendar.refetchEvents(); // Revert changes
     });
 }
@@ -16,6 +16,10 @@ class WeeklyScheduleManager {
         this.renderSchedules();
         this.bindEvents();
         this.initSortable();
+        // 다른 사용자의 일정 변경은 이벤트 스트림으로 받아 다시 불러온다
+        if (typeof subscribeChanges === 'function') {
+            subscribeChanges(['schedule'], () => this.refreshSchedules());
+        }
     }
 
     // Date Management
@@ -190,6 +194,22 @@ class WeeklyScheduleManager {
         return 'schedule_' + Date.now() + '_' + Math.random().toString(36).substr(2, 9);
     }
 
+    // 드래그/수정/삭제는 queueBatchOperation(common/api.js)으로 묶어서 /api/batch로 보낸다.
+    // 같은 배치로 처리된 여러 연산이 목록을 한 번만 다시 불러오도록 새로고침을 묶는다
+    refreshSchedules() {
+        if (!this.refreshing) {
+            this.refreshing = Promise.resolve()
+                .then(async () => {
+                    this.schedules = await this.loadSchedules();
+                    this.renderSchedules();
+                })
+                .finally(() => {
+                    this.refreshing = null;
+                });
+        }
+        return this.refreshing;
+    }
+
     async addSchedule(week, scheduleData) {
         const year = this.currentDate.getFullYear();
         const month = this.currentDate.getMonth() + 1;
@@ -251,29 +271,13 @@ class WeeklyScheduleManager {
 
     async updateSchedule(id, week, scheduleData) {
         try {
-            const response = await fetch(`/research/api/weekly-schedule/update/${id}`, {
-                method: 'PUT',
-                headers: {
-                    'Content-Type': 'application/json',
-                },
-                body: JSON.stringify(scheduleData)
-            });
-            
-            if (response.ok) {
-                const result = await response.json();
-                if (result.success) {
-                    // Reload schedules to update UI
-                    this.schedules = await this.loadSchedules();
-                    this.renderSchedules();
-                    return;
-                }
-            }
-            throw new Error('Failed to update schedule');
+            await queueBatchOperation('schedule', 'update', id, scheduleData);
+            await this.refreshSchedules();
         } catch (error) {
             console.error('Error updating schedule:', error);
             // Fallback to local update
             for (let weekNum in this.schedules) {
-                const scheduleIndex = this.schedules[weekNum].findIndex(s => s.id === id);
+                const scheduleIndex = this.schedules[weekNum].findIndex(s => String(s.id) === String(id));
                 if (scheduleIndex !== -1) {
                     this.schedules[weekNum][scheduleIndex] = {
                         ...this.schedules[weekNum][scheduleIndex],
@@ -290,25 +294,13 @@ class WeeklyScheduleManager {
 
     async deleteSchedule(id) {
         try {
-            const response = await fetch(`/research/api/weekly-schedule/delete/${id}`, {
-                method: 'DELETE'
-            });
-            
-            if (response.ok) {
-                const result = await response.json();
-                if (result.success) {
-                    // Reload schedules to update UI
-                    this.schedules = await this.loadSchedules();
-                    this.renderSchedules();
-                    return;
-                }
-            }
-            throw new Error('Failed to delete schedule');
+            await queueBatchOperation('schedule', 'delete', id);
+            await this.refreshSchedules();
         } catch (error) {
             console.error('Error deleting schedule:', error);
             // Fallback to local deletion
             for (let week in this.schedules) {
-                this.schedules[week] = this.schedules[week].filter(s => s.id !== id);
+                this.schedules[week] = this.schedules[week].filter(s => String(s.id) !== String(id));
             }
             this.saveSchedules();
             this.renderSchedules();
@@ -319,28 +311,16 @@ class WeeklyScheduleManager {
         if (fromWeek === toWeek) return;
         
         try {
-            const response = await fetch(`/research/api/weekly-schedule/move/${id}`, {
-                method: 'PUT',
-                headers: {
-                    'Content-Type': 'application/json',
-                },
-                body: JSON.stringify({ week: parseInt(toWeek) })
+            await queueBatchOperation('schedule', 'update', id, {
+                year: this.currentDate.getFullYear(),
+                month: this.currentDate.getMonth() + 1,
+                week: parseInt(toWeek)
             });
-            
-            if (response.ok) {
-                const result = await response.json();
-                if (result.success) {
-                    // Reload schedules to update UI
-                    this.schedules = await this.loadSchedules();
-                    this.renderSchedules();
-                    return;
-                }
-            }
-            throw new Error('Failed to move schedule');
+            await this.refreshSchedules();
         } catch (error) {
             console.error('Error moving schedule:', error);
             // Fallback to local move
-            const scheduleIndex = this.schedules[fromWeek].findIndex(s => s.id === id);
+            const scheduleIndex = this.schedules[fromWeek].findIndex(s => String(s.id) === String(id));
             if (scheduleIndex === -1) return;
             
             const schedule = this.schedules[fromWeek][scheduleIndex];
@@ -567,7 +547,7 @@ class WeeklyScheduleManager {
         let week = null;
         
         for (let weekNum in this.schedules) {
-            const found = this.schedules[weekNum].find(s => s.id === id);
+            const found = this.schedules[weekNum].find(s => String(s.id) === String(id));
             if (found) {
                 schedule = found;
                 week = weekNum;
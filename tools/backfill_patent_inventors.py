@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+기존 특허의 발명자 문자열(inventors/co_inventors)을 patent_inventors 테이블로 분리
+
+이미 발명자 행이 있는 특허는 건너뛰므로 여러 번 실행해도 안전하다.
+
+    python tools/backfill_patent_inventors.py --batch-size 1000
+"""
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='특허 발명자 정규화 백필')
+    parser.add_argument('--batch-size', type=int, default=1000, help='한 번에 처리할 특허 수')
+    args = parser.parse_args()
+
+    from app import app
+    from services.patent_service import PatentService
+
+    with app.app_context():
+        inserted = PatentService.backfill_inventors(batch_size=args.batch_size)
+    print(f'patent_inventors 입력 완료: {inserted}건')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+가용 장비 검색 응답 시간 측정
+
+장비 N개, 예약 M개를 합성 데이터로 채운 DB(없으면 임시 SQLite)에서 임의의 구간으로
+EquipmentService.find_available을 API와 같은 결과 수 제한으로 반복 호출해 p50/p95/최대 응답 시간을 출력한다.
+--verify를 주면 같은 구간을 메모리에서 전수 비교한 결과와 일치하는지도 확인한다.
+
+    python tools/bench_availability.py --equipment 5000 --reservations 500000 --queries 200 --verify
+    DATABASE_URL=postgresql://... python tools/bench_availability.py --queries 500
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, datetime, time as dtime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def brute_force(rows, equipment, start_date, end_date, start_time, end_time, category, location):
+    """모든 예약을 시각 구간으로 바꿔 직접 비교"""
+    window_start = datetime.combine(start_date, start_time or dtime.min)
+    window_end = (datetime.combine(end_date, end_time) if end_time
+                  else datetime.combine(end_date + timedelta(days=1), dtime.min))
+    busy = set()
+    for name, r_start_date, r_end_date, r_start_time, r_end_time, status in rows:
+        if status == '취소':
+            continue
+        begin = datetime.combine(r_start_date, r_start_time or dtime.min)
+        end = (datetime.combine(r_end_date, r_end_time) if r_end_time
+               else datetime.combine(r_end_date + timedelta(days=1), dtime.min))
+        if begin < window_end and window_start < end:
+            busy.add(name)
+    return sorted(
+        (e.name, e.id) for e in equipment
+        if e.name not in busy and (not category or e.category == category) and (not location or e.location == location)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='가용 장비 검색 응답 시간 측정')
+    parser.add_argument('--equipment', type=int, default=5000, help='장비 수 (빈 DB일 때 생성)')
+    parser.add_argument('--reservations', type=int, default=500000, help='예약 수 (빈 DB일 때 생성)')
+    parser.add_argument('--queries', type=int, default=200, help='측정할 검색 횟수')
+    parser.add_argument('--verify', action='store_true', help='전수 비교로 결과 검증 (느림)')
+    args = parser.parse_args()
+
+    os.environ.setdefault('DATABASE_URL', f'sqlite:///{os.path.join(tempfile.mkdtemp(), "bench_availability.db")}')
+    os.environ.setdefault('LOG_FILE', os.path.join(tempfile.gettempdir(), 'bench_availability.log'))
+    os.environ.setdefault('LOG_LEVEL', 'WARNING')
+
+    from app import app
+    from database import db, Equipment, Reservation
+    from services.equipment_service import EquipmentService, AVAILABLE_STATUSES
+    from services.seed_service import seed_database
+
+    with app.app_context():
+        if db.session.query(Equipment.id).first() is None:
+            print(f'합성 데이터 생성: 장비 {args.equipment:,}개, 예약 {args.reservations:,}개')
+            seed_database(0.0005, {'equipment': args.equipment, 'reservations': args.reservations},
+                          base_date=date.today())
+        equipment_count = db.session.query(Equipment.id).count()
+        reservation_count = db.session.query(Reservation.id).count()
+        print(f'장비 {equipment_count:,}개, 예약 {reservation_count:,}개')
+
+        equipment = Equipment.query.filter(Equipment.status.in_(AVAILABLE_STATUSES)).all()
+        categories = sorted({e.category for e in equipment if e.category})
+        locations = sorted({e.location for e in equipment if e.location})
+        rows = None
+        if args.verify:
+            rows = db.session.query(Reservation.equipment_name, Reservation.start_date, Reservation.end_date,
+                                    Reservation.start_time, Reservation.end_time, Reservation.status).all()
+
+        rng = random.Random(7)
+        today = date.today()
+        timings = []
+        mismatches = 0
+        for _ in range(args.queries):
+            start_date = today + timedelta(days=rng.randint(-30, 60))
+            end_date = start_date + timedelta(days=rng.choice([0, 0, 0, 1, 6]))
+            start_time = end_time = None
+            if rng.random() < 0.7:
+                start_time = dtime(rng.randint(8, 15), rng.choice([0, 30]))
+                end_time = dtime(min(start_time.hour + rng.randint(1, 4), 23), start_time.minute)
+            category = rng.choice(categories) if categories and rng.random() < 0.3 else None
+            location = rng.choice(locations) if locations and rng.random() < 0.3 else None
+
+            started = time.perf_counter()
+            EquipmentService.find_available(start_date, end_date, start_time, end_time,
+                                            category=category, location=location)
+            timings.append((time.perf_counter() - started) * 1000)
+
+            if rows is not None:
+                # API는 AVAILABILITY_LIMIT개까지만 돌려주므로 검증은 제한 없이 다시 조회
+                result = EquipmentService.find_available(start_date, end_date, start_time, end_time,
+                                                         category=category, location=location, limit=equipment_count)
+                expected = brute_force(rows, equipment, start_date, end_date, start_time, end_time, category, location)
+                if sorted((r['name'], r['id']) for r in result) != expected:
+                    mismatches += 1
+
+        timings.sort()
+        p50 = timings[len(timings) // 2]
+        p95 = timings[min(int(len(timings) * 0.95), len(timings) - 1)]
+        print(f'검색 {len(timings)}회: p50 {p50:.1f}ms, p95 {p95:.1f}ms, 최대 {timings[-1]:.1f}ms')
+        if rows is not None:
+            print('검증: ' + ('전수 비교 결과와 모두 일치' if mismatches == 0 else f'불일치 {mismatches}건'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+변경 이벤트 스트림(SSE) 전달 측정
+
+gunicorn_events.conf.py(gevent 워커)를 임시 DB로 띄우고 /events/stream 연결을 N개 연 뒤,
+이 프로세스에서 예약을 M번 커밋해 모든 연결에 이벤트가 도착하는지와 커밋부터 수신까지의
+지연(p50/p95/최대), 워커 메모리를 출력한다.
+
+    python tools/bench_events.py --connections 2000 --commits 20 --workers 2
+"""
+import argparse
+import os
+import resource
+import selectors
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import date
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_suite import PROJECT_ROOT, free_port, percentile, process_tree_hwm_mb  # noqa: E402
+
+
+def wait_for_port(process, port):
+    deadline = time.time() + 60
+    while True:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=1).close()
+            return
+        except OSError:
+            if process.poll() is not None or time.time() > deadline:
+                raise RuntimeError('gunicorn이 시작되지 않았습니다.')
+            time.sleep(0.2)
+
+
+def open_streams(port, count):
+    """스트림 연결을 열고 {소켓: 수신 버퍼} 반환"""
+    selector = selectors.DefaultSelector()
+    request = b'GET /events/stream?entities=reservation HTTP/1.1\r\nHost: localhost\r\nAccept: text/event-stream\r\n\r\n'
+    for _ in range(count):
+        conn = socket.create_connection(('127.0.0.1', port))
+        conn.sendall(request)
+        conn.setblocking(False)
+        selector.register(conn, selectors.EVENT_READ, bytearray())
+    return selector
+
+
+def main():
+    parser = argparse.ArgumentParser(description='변경 이벤트 스트림 전달 측정')
+    parser.add_argument('--connections', type=int, default=2000, help='동시 스트림 연결 수')
+    parser.add_argument('--commits', type=int, default=20, help='발행할 커밋 수')
+    parser.add_argument('--interval', type=float, default=0.1, help='커밋 간격(초)')
+    parser.add_argument('--workers', type=int, default=2, help='이벤트 서비스 워커 수')
+    args = parser.parse_args()
+
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < args.connections + 256:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (min(hard, args.connections * 2 + 256), hard))
+
+    work_dir = tempfile.mkdtemp(prefix='bench_events_')
+    port = free_port()
+    env = dict(
+        os.environ,
+        DATABASE_URL=f'sqlite:///{os.path.join(work_dir, "bench.db")}',
+        LOG_FILE=os.path.join(work_dir, 'app.log'),
+        LOG_LEVEL='WARNING',
+        EVENTS_SOCKET_DIR=os.path.join(work_dir, 'events'),
+        EVENTS_PORT=str(port),
+        EVENTS_WORKERS=str(args.workers),
+        EVENTS_WORKER_CONNECTIONS=str(args.connections),
+        JINJA_BYTECODE_CACHE_DIR=os.path.join(work_dir, 'jinja'),
+    )
+    os.environ.update({key: env[key] for key in ('DATABASE_URL', 'LOG_FILE', 'LOG_LEVEL', 'EVENTS_SOCKET_DIR',
+                                                  'JINJA_BYTECODE_CACHE_DIR')})
+    from app import app
+    from database import db, Reservation
+
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn_events.conf.py',
+         '--pid', os.path.join(work_dir, 'gunicorn.pid'), 'app:app'],
+        cwd=PROJECT_ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        wait_for_port(process, port)
+        started = time.perf_counter()
+        selector = open_streams(port, args.connections)
+        print(f'연결 {args.connections:,}개 ({time.perf_counter() - started:.1f}초), '
+              f'이벤트 서비스 워커 {args.workers}개 (gevent)')
+        # 모든 연결이 구독을 시작할 때까지 (retry 줄 수신) 대기
+        ready = set()
+        deadline = time.time() + 60
+        while len(ready) < args.connections and time.time() < deadline:
+            for key, _ in selector.select(timeout=1):
+                data = key.fileobj.recv(65536)
+                key.data.extend(data)
+                if b'retry:' in key.data:
+                    ready.add(key.fileobj)
+        print(f'구독 시작 {len(ready):,}/{args.connections:,}')
+
+        def commit_changes():
+            with app.app_context():
+                for index in range(args.commits):
+                    db.session.add(Reservation(equipment_name=f'bench-{index}', reserver='bench',
+                                               start_date=date.today(), end_date=date.today(), status='예약'))
+                    db.session.commit()
+                    time.sleep(args.interval)
+
+        publisher = threading.Thread(target=commit_changes)
+        publisher.start()
+
+        latencies = []
+        received = 0
+        expected = len(ready) * args.commits
+        deadline = time.time() + args.commits * args.interval + 30
+        while received < expected and time.time() < deadline:
+            for key, _ in selector.select(timeout=1):
+                data = key.fileobj.recv(65536)
+                now = time.time_ns()
+                for line in data.split(b'\n'):
+                    if line.startswith(b'id: '):
+                        received += 1
+                        latencies.append((now - int(line[4:])) / 1e6)
+        publisher.join()
+
+        latencies.sort()
+        total_rss, worker_rss = process_tree_hwm_mb(process.pid)
+        print(f'수신 {received:,}/{expected:,} 이벤트')
+        if latencies:
+            print(f'커밋→수신 지연: p50 {percentile(latencies, 50):.1f}ms, p95 {percentile(latencies, 95):.1f}ms, '
+                  f'최대 {latencies[-1]:.1f}ms')
+        print(f'메모리 최고치: 전체 {total_rss}MB, 워커 {worker_rss}MB')
+        for key in list(selector.get_map().values()):
+            key.fileobj.close()
+    finally:
+        process.send_signal(signal.SIGTERM)
+        try:
+            process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            process.kill()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+사고 자료 파일 저장소 업로드/다운로드 벤치마크
+
+지정 크기(기본 200MB)의 파일을 요청 본문 스트리밍으로 업로드하고, 전체
+다운로드와 Range 다운로드 처리량, 프로세스 최대 RSS, 중복 업로드 시
+파일 공유 여부를 측정한다.
+
+    python tools/bench_file_store.py --size-mb 200
+"""
+import argparse
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from datetime import date
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+BLOCK = 1024 * 1024
+
+
+def max_rss_mb():
+    # Linux에서 ru_maxrss 단위는 KB
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+def make_file(path, size_mb):
+    block = os.urandom(BLOCK)
+    with open(path, 'wb') as f:
+        for i in range(size_mb):
+            # 블록마다 내용이 달라지도록 앞부분에 블록 번호를 기록
+            f.write(i.to_bytes(8, 'big') + block[8:])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='사고 자료 파일 저장소 벤치마크')
+    parser.add_argument('--size-mb', type=int, default=200, help='업로드 파일 크기(MB)')
+    parser.add_argument('--range-mb', type=int, default=8, help='Range 요청 크기(MB)')
+    args = parser.parse_args()
+
+    # 별도 SQLite 파일과 저장소 디렉터리에서 실행 (운영 데이터를 건드리지 않음)
+    work_dir = tempfile.mkdtemp()
+    os.environ.setdefault('DATABASE_URL', f'sqlite:///{os.path.join(work_dir, "bench_files.db")}')
+    os.environ.setdefault('LOG_FILE', os.path.join(work_dir, 'bench.log'))
+    os.environ.setdefault('LOG_LEVEL', 'WARNING')
+    os.environ['FILE_STORE_ROOT'] = os.path.join(work_dir, 'uploads')
+    os.environ['ACCIDENT_DOCUMENT_MAX_SIZE'] = str((args.size_mb + 1) * BLOCK)
+
+    from app import app
+    from database import db, Accident
+
+    source = os.path.join(work_dir, 'source.bin')
+    make_file(source, args.size_mb)
+    size = os.path.getsize(source)
+
+    with app.app_context():
+        accident = Accident(accident_id='BENCH-FILES', date=date.today(), description='파일 저장소 벤치마크')
+        db.session.add(accident)
+        db.session.commit()
+        accident_id = accident.id
+
+    client = app.test_client()
+    url = f'/safety/api/accidents/{accident_id}/documents/upload'
+    rss_before = max_rss_mb()
+
+    def upload():
+        with open(source, 'rb') as f:
+            started = time.perf_counter()
+            response = client.post(url, input_stream=f, content_length=size,
+                                   headers={'Content-Type': 'application/octet-stream', 'X-File-Name': 'source.bin'})
+            return response, time.perf_counter() - started
+
+    response, elapsed = upload()
+    data = response.get_json()
+    if not data or not data.get('success'):
+        print(f'업로드 실패: {response.status_code} {data}')
+        return 1
+    document = data['document']
+    print(f'업로드: {size / BLOCK:.0f}MB  {elapsed:.2f}s  {size / BLOCK / elapsed:.0f} MB/s')
+
+    started = time.perf_counter()
+    received = 0
+    response = client.get(document['url'], buffered=False)
+    for chunk in response.response:
+        received += len(chunk)
+    response.close()
+    elapsed = time.perf_counter() - started
+    print(f'다운로드: {received / BLOCK:.0f}MB  {elapsed:.2f}s  {received / BLOCK / elapsed:.0f} MB/s')
+
+    range_bytes = args.range_mb * BLOCK
+    start = size - range_bytes
+    started = time.perf_counter()
+    response = client.get(document['url'], headers={'Range': f'bytes={start}-'})
+    elapsed = time.perf_counter() - started
+    with open(source, 'rb') as f:
+        f.seek(start)
+        range_ok = response.status_code == 206 and response.data == f.read()
+    print(f'Range 다운로드: {response.status_code}  {len(response.data) / BLOCK:.0f}MB  {elapsed * 1000:.1f}ms  '
+          f'내용 일치: {range_ok}  Content-Range: {response.headers.get("Content-Range")}')
+
+    response, elapsed = upload()
+    duplicate = response.get_json()['document']
+    objects = sum(len(files) for _, _, files in os.walk(os.path.join(os.environ['FILE_STORE_ROOT'], 'accidents', 'objects')))
+    print(f'중복 업로드: {elapsed:.2f}s  저장된 객체 파일 수: {objects} (기대값 1)')
+
+    rss_after = max_rss_mb()
+    print(f'최대 RSS: 시작 {rss_before:.0f}MB -> 종료 {rss_after:.0f}MB (증가 {rss_after - rss_before:.0f}MB, 파일 {size / BLOCK:.0f}MB)')
+
+    shutil.rmtree(work_dir, ignore_errors=True)
+    ok = received == size and range_ok and objects == 1 and duplicate['id'] != document['id']
+    print('통과' if ok else '실패')
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
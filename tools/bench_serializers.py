@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+직렬화 처리량 측정
+
+DB 없이 메모리에 만든 모델 인스턴스 N개로 기존 방식(행마다 dict를 직접 만들고
+strftime 호출)과 컴파일된 직렬화기를 비교하고, 표준 json과 앱 JSON 프로바이더의
+인코딩 속도도 함께 출력한다.
+
+    python tools/bench_serializers.py --rows 50000
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import date, datetime, time as dtime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def legacy_usage_log(log):
+    return {
+        'id': log.id,
+        'equipment_name': log.equipment_name,
+        'user': log.user,
+        'usage_date': log.usage_date.strftime('%Y-%m-%d') if log.usage_date else '',
+        'start_time': log.start_time.strftime('%H:%M') if log.start_time else '',
+        'end_time': log.end_time.strftime('%H:%M') if log.end_time else '',
+        'purpose': log.purpose,
+        'notes': log.notes,
+        'condition_before': log.condition_before,
+        'condition_after': log.condition_after,
+        'issues': log.issues,
+        'created_date': log.created_date.strftime('%Y-%m-%d') if log.created_date else ''
+    }
+
+
+def measure(func, repeat):
+    best = None
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='직렬화 처리량 측정')
+    parser.add_argument('--rows', type=int, default=50000, help='직렬화할 행 수')
+    parser.add_argument('--repeat', type=int, default=5, help='반복 횟수 (최솟값 사용)')
+    args = parser.parse_args()
+
+    os.environ.setdefault('DATABASE_URL', f'sqlite:///{os.path.join(tempfile.mkdtemp(), "bench_serializers.db")}')
+    os.environ.setdefault('LOG_FILE', os.path.join(tempfile.gettempdir(), 'bench_serializers.log'))
+    os.environ.setdefault('LOG_LEVEL', 'WARNING')
+
+    from app import app
+    from database import UsageLog
+    from services.serializers import serialize_all
+    from utils import json_provider
+
+    base = date(2024, 1, 1)
+    logs = [
+        UsageLog(id=i, equipment_name=f'장비 {i % 500}', user=f'사용자 {i % 97}',
+                 usage_date=base + timedelta(days=i % 365), start_time=dtime(9, i % 60),
+                 end_time=dtime(18, 0), purpose='시험 분석', notes=None,
+                 condition_before='양호', condition_after='양호', issues=None,
+                 created_date=datetime(2024, 1, 1, 9, 0) + timedelta(minutes=i))
+        for i in range(args.rows)
+    ]
+
+    legacy_time, legacy_rows = measure(lambda: [legacy_usage_log(log) for log in logs], args.repeat)
+    compiled_time, compiled_rows = measure(lambda: serialize_all(UsageLog, logs), args.repeat)
+    if legacy_rows != compiled_rows:
+        print('경고: 기존 방식과 직렬화 결과가 다릅니다.')
+
+    stdlib_time, _ = measure(lambda: json.dumps(compiled_rows, ensure_ascii=False), args.repeat)
+    with app.app_context():
+        provider_time, _ = measure(lambda: app.json.dumps(compiled_rows), args.repeat)
+
+    print(f'행 수: {args.rows:,}  (JSON 백엔드: {"orjson" if json_provider.orjson else "표준 json"})')
+    for label, elapsed in (
+        ('dict 직접 생성 + strftime', legacy_time),
+        ('컴파일된 직렬화기', compiled_time),
+        ('json.dumps', stdlib_time),
+        ('FastJSONProvider.dumps', provider_time),
+    ):
+        print(f'  {label:<26} {elapsed * 1000:9.1f} ms  {args.rows / elapsed:12,.0f} rows/s')
+
+
+if __name__ == '__main__':
+    main()
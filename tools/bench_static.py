@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+정적 파일 처리량 측정
+
+gunicorn 워커 1개를 STATIC_FILES_MIDDLEWARE=true/false로 각각 띄우고, 같은 정적
+파일 요청을 보내 워커당 초당 처리 수와 요청당 app.log 기록 줄 수를 비교한다.
+빌드된 자산(static/dist)이 없으면 먼저 tools/build_assets.py와 같은 빌드를 수행한다.
+
+    python tools/bench_static.py --requests 5000 --concurrency 8
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_suite import PROJECT_ROOT, run_gunicorn  # noqa: E402
+from utils.assets import DIST_DIR, MANIFEST_NAME, build_assets, load_manifest  # noqa: E402
+
+
+def count_lines(path):
+    try:
+        with open(path, encoding='utf-8', errors='replace') as f:
+            return sum(1 for _ in f)
+    except OSError:
+        return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='정적 파일 처리량 측정')
+    parser.add_argument('--requests', type=int, default=5000, help='경로별 요청 수')
+    parser.add_argument('--concurrency', type=int, default=8, help='동시 연결 수')
+    args = parser.parse_args()
+
+    static_folder = os.path.join(PROJECT_ROOT, 'static')
+    manifest = load_manifest(os.path.join(static_folder, DIST_DIR, MANIFEST_NAME))
+    if not manifest:
+        manifest = build_assets(static_folder, echo=lambda message: None)
+    endpoints = [
+        ('source', '/static/js/main.js'),
+        ('hashed', '/static/' + manifest['js/main.js']),
+        ('css', '/static/' + manifest['css/style.css']),
+    ]
+
+    work_dir = tempfile.mkdtemp(prefix='bench_static_')
+    try:
+        summary = {}
+        for enabled in ('true', 'false'):
+            log_file = os.path.join(work_dir, f'app_{enabled}.log')
+            env = dict(
+                os.environ,
+                DATABASE_URL=f'sqlite:///{os.path.join(work_dir, "bench.db")}',
+                LOG_FILE=log_file,
+                LOG_LEVEL='INFO',
+                STATIC_FILES_MIDDLEWARE=enabled,
+                JINJA_BYTECODE_CACHE_DIR=os.path.join(work_dir, 'jinja'),
+            )
+            print(f'STATIC_FILES_MIDDLEWARE={enabled} (워커 1, 동시 연결 {args.concurrency}, {args.requests}회/경로)')
+            before = count_lines(log_file)
+            results, _ = run_gunicorn(endpoints, env, work_dir, args.requests, args.concurrency, workers=1)
+            total_requests = (args.requests + args.concurrency) * len(endpoints)
+            lines_per_request = (count_lines(log_file) - before) / total_requests
+            summary[enabled] = results
+            print(f'  app.log 기록: 요청당 {lines_per_request:.2f}줄')
+
+        print('\n워커당 초당 처리 수 (미들웨어 / Flask)')
+        for name, path in endpoints:
+            on = summary['true'][name]['throughput_rps']
+            off = summary['false'][name]['throughput_rps']
+            print(f'  {path:<50} {on:>8} / {off:>8} req/s  ({on / off:.1f}배)')
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""
+오프라인 부하 테스트/벤치마크
+
+지정 규모로 DB를 채운 뒤 모든 블루프린트의 GET 엔드포인트를 Flask 테스트
+클라이언트(엔드포인트별 쿼리 수 포함)와 로컬 gunicorn(내장 부하 발생기)으로
+요청하고 p50/p95/p99 지연, 요청당 쿼리 수, 최대 RSS를 보고한다.
+결과를 JSON 기준선과 비교해 회귀가 있으면 종료 코드 1을 반환한다 (CI용).
+
+    python tools/bench_suite.py --scale 0.05
+    python tools/bench_suite.py --scale 1 --gunicorn --workers 4 --concurrency 16
+    python tools/bench_suite.py --output bench_result.json --write-baseline bench_baseline.json
+    python tools/bench_suite.py --baseline bench_baseline.json          # 회귀 시 종료 코드 1
+
+기본 규모(--scale 1): 장비 2만, 사용 기록 100만, 예약 20만, 특허 5만, 게시글 10만.
+나머지 모델은 services/seed_service.py 기본 행 수에 같은 배율을 적용해 채운다.
+"""
+import argparse
+import http.client
+import json
+import math
+import os
+import resource
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, datetime, timedelta
+from urllib.parse import urlencode
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_COUNTS = {
+    'equipment': 20000,
+    'usage_logs': 1000000,
+    'reservations': 200000,
+    'patents': 50000,
+    'communications': 100000,
+}
+# 부작용이 있는 GET 엔드포인트 (삭제 링크 등)는 측정하지 않음
+SKIP_ENDPOINTS = {
+    'external.delete_contact',
+    'patents.delete_patent',
+    'research.delete_project',
+}
+
+# 필수 쿼리 문자열이 있는 엔드포인트 (값의 {이름}은 collect_samples() 값으로 채움)
+EXTRA_QUERY = {
+    'patents.api_inventor_patents': {'name': '김민준'},
+    'chemical.api_lookup': {'cas': '64-17-5'},
+    'equipment_api.api_available_equipment': {
+        'start_date': '{today}', 'end_date': '{week_end}', 'start_time': '09:00', 'end_time': '12:00',
+    },
+}
+
+# 기준선 대비 회귀 판정: p95가 (1 + 허용 비율)배를 넘고 최소 차이(ms)도 넘을 때
+REGRESSION_TOLERANCE = 0.25
+REGRESSION_MIN_DELTA_MS = 5.0
+
+def percentile(sorted_values, pct):
+    """최근접 순위 백분위수 (정렬된 목록)"""
+    if not sorted_values:
+        return None
+    rank = max(math.ceil(pct / 100.0 * len(sorted_values)) - 1, 0)
+    return sorted_values[rank]
+
+
+def summarize(latencies_ms):
+    values = sorted(latencies_ms)
+    return {
+        'count': len(values),
+        'p50_ms': round(percentile(values, 50), 2) if values else None,
+        'p95_ms': round(percentile(values, 95), 2) if values else None,
+        'p99_ms': round(percentile(values, 99), 2) if values else None,
+        'max_ms': round(values[-1], 2) if values else None,
+    }
+
+
+def max_rss_mb():
+    # Linux에서 ru_maxrss 단위는 KB
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+def resolve_path(rule, samples):
+    """URL 규칙의 변수를 샘플 값으로 채움. 채울 수 없으면 None"""
+    values = {}
+    for argument in rule.arguments:
+        if samples.get(argument) is None:
+            return None
+        values[argument] = samples[argument]
+    path = rule.rule
+    for converter_argument, value in values.items():
+        for prefix in ('<int:', '<'):
+            path = path.replace(f'{prefix}{converter_argument}>', str(value))
+    return path
+
+
+def collect_samples():
+    """경로 변수에 넣을 실제 ID (앱 컨텍스트 필요)"""
+    from database import db, Communication, EquipmentInspection, AccidentDocument
+    today = date.today()
+    post = db.session.query(Communication.id).filter_by(category='안전 Q&A').first()
+    inspection = db.session.query(EquipmentInspection.id).first()
+    document = db.session.query(AccidentDocument.accident_id, AccidentDocument.id).filter(
+        AccidentDocument.content_hash.isnot(None)).first()
+    return {
+        'post_id': post[0] if post else None,
+        'inspection_id': inspection[0] if inspection else None,
+        'accident_id': document[0] if document else None,
+        'document_id': document[1] if document else None,
+        'year': today.year,
+        'month': today.month,
+        'today': today.isoformat(),
+        'week_end': (today + timedelta(days=6)).isoformat(),
+    }
+
+
+def collect_endpoints(app):
+    """(엔드포인트 이름, 요청 경로) 목록과 건너뛴 엔드포인트"""
+    with app.app_context():
+        samples = collect_samples()
+    endpoints, skipped = [], []
+    for rule in sorted(app.url_map.iter_rules(), key=lambda r: r.rule):
+        if 'GET' not in rule.methods or rule.endpoint == 'static' or rule.endpoint in SKIP_ENDPOINTS:
+            continue
+        path = resolve_path(rule, samples)
+        if path is None:
+            skipped.append(rule.rule)
+            continue
+        if rule.endpoint in EXTRA_QUERY:
+            query = {key: value.format(**samples) for key, value in EXTRA_QUERY[rule.endpoint].items()}
+            path = f'{path}?{urlencode(query)}'
+        endpoints.append((rule.endpoint, path))
+    return endpoints, skipped
+
+
+def run_test_client(app, endpoints, requests, warmup):
+    """Flask 테스트 클라이언트로 엔드포인트별 측정 (요청당 쿼리 수 포함)"""
+    from sqlalchemy import event
+    from database import db
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with app.app_context():
+        event.listen(db.engine, 'before_cursor_execute', record)
+
+    client = app.test_client()
+    results = {}
+    for endpoint, path in endpoints:
+        for _ in range(warmup):
+            client.get(path)
+        latencies, queries, statuses = [], [], set()
+        for _ in range(requests):
+            statements.clear()
+            started = time.perf_counter()
+            response = client.get(path)
+            response.get_data()
+            latencies.append((time.perf_counter() - started) * 1000)
+            queries.append(len(statements))
+            statuses.add(response.status_code)
+        results[endpoint] = {
+            'path': path,
+            **summarize(latencies),
+            'queries_per_request': max(queries),
+            'status': sorted(statuses),
+            'rss_mb': round(max_rss_mb(), 1),
+        }
+        print(f"  {path:<60} p50 {results[endpoint]['p50_ms']:>8}ms  p95 {results[endpoint]['p95_ms']:>8}ms  "
+              f"p99 {results[endpoint]['p99_ms']:>8}ms  쿼리 {max(queries):>3}  상태 {sorted(statuses)}")
+    return results
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def process_tree_hwm_mb(pid):
+    """gunicorn 마스터와 워커들의 최대 RSS(VmHWM) 합계와 워커 최대값(MB)"""
+    pids = [pid]
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as f:
+                if int(f.read().rsplit(')', 1)[1].split()[1]) == pid:
+                    pids.append(int(entry))
+        except (OSError, IndexError, ValueError):
+            continue
+    values = []
+    for child in pids:
+        try:
+            with open(f'/proc/{child}/status') as f:
+                for line in f:
+                    if line.startswith('VmHWM:'):
+                        values.append(int(line.split()[1]) / 1024.0)
+        except OSError:
+            continue
+    return round(sum(values), 1), round(max(values[1:] or values or [0]), 1)
+
+
+def load(port, path, requests, concurrency):
+    """내장 부하 발생기: concurrency개 스레드가 keep-alive 연결로 requests건을 나눠 요청"""
+    latencies, errors = [], []
+    lock = threading.Lock()
+    remaining = [requests]
+
+    def worker():
+        conn = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+        while True:
+            with lock:
+                if remaining[0] <= 0:
+                    break
+                remaining[0] -= 1
+            started = time.perf_counter()
+            try:
+                conn.request('GET', path)
+                response = conn.getresponse()
+                response.read()
+                status = response.status
+                if response.getheader('Connection', '').lower() == 'close':
+                    conn.close()
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                status = str(e)
+            elapsed = (time.perf_counter() - started) * 1000
+            with lock:
+                latencies.append(elapsed)
+                if status != 200:
+                    errors.append(status)
+        conn.close()
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, errors, time.perf_counter() - started
+
+
+def run_gunicorn(endpoints, env, work_dir, requests, concurrency, workers):
+    """로컬 gunicorn을 띄우고 엔드포인트별 부하 측정"""
+    port = free_port()
+    env = dict(env, HOST='127.0.0.1', PORT=str(port))
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', '--workers', str(workers),
+         '--pid', os.path.join(work_dir, 'gunicorn.pid'), 'app:app'],
+        cwd=PROJECT_ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        deadline = time.time() + 60
+        while True:
+            try:
+                socket.create_connection(('127.0.0.1', port), timeout=1).close()
+                break
+            except OSError:
+                if process.poll() is not None or time.time() > deadline:
+                    raise RuntimeError('gunicorn이 시작되지 않았습니다.')
+                time.sleep(0.2)
+
+        results = {}
+        for endpoint, path in endpoints:
+            load(port, path, concurrency, concurrency)
+            latencies, errors, elapsed = load(port, path, requests, concurrency)
+            results[endpoint] = {
+                'path': path,
+                **summarize(latencies),
+                'throughput_rps': round(len(latencies) / elapsed, 1) if elapsed else None,
+                'errors': len(errors),
+            }
+            print(f"  {path:<60} p50 {results[endpoint]['p50_ms']:>8}ms  p95 {results[endpoint]['p95_ms']:>8}ms  "
+                  f"p99 {results[endpoint]['p99_ms']:>8}ms  {results[endpoint]['throughput_rps']:>7} req/s  "
+                  f"오류 {len(errors)}")
+        total_rss, worker_rss = process_tree_hwm_mb(process.pid)
+        return results, {'total_peak_rss_mb': total_rss, 'worker_peak_rss_mb': worker_rss}
+    finally:
+        process.send_signal(signal.SIGTERM)
+        try:
+            process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def compare(result, baseline):
+    """기준선 대비 회귀 목록"""
+    regressions = []
+    for mode in ('test_client', 'gunicorn'):
+        current = result.get(mode, {}).get('endpoints', {})
+        for endpoint, base in baseline.get(mode, {}).get('endpoints', {}).items():
+            now = current.get(endpoint)
+            if now is None:
+                continue
+            if base.get('p95_ms') is not None and now.get('p95_ms') is not None:
+                limit = max(base['p95_ms'] * (1 + REGRESSION_TOLERANCE), base['p95_ms'] + REGRESSION_MIN_DELTA_MS)
+                if now['p95_ms'] > limit:
+                    regressions.append(f"{mode} {endpoint}: p95 {base['p95_ms']}ms -> {now['p95_ms']}ms")
+            if 'queries_per_request' in base and now['queries_per_request'] > base['queries_per_request']:
+                regressions.append(f"{mode} {endpoint}: 쿼리 {base['queries_per_request']} -> {now['queries_per_request']}")
+            if now.get('errors', 0) > base.get('errors', 0) or now.get('status') not in (None, base.get('status')):
+                regressions.append(f"{mode} {endpoint}: 응답 상태 {base.get('status')} -> {now.get('status')}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='오프라인 부하 테스트/벤치마크')
+    parser.add_argument('--scale', type=float, default=0.02, help='기본 규모 대비 배율 (1 = 장비 2만, 사용 기록 100만 ...)')
+    parser.add_argument('--count', action='append', default=[], metavar='TABLE=N',
+                        help='항목별 행 수 지정 (services/seed_service.py DEFAULT_COUNTS 항목)')
+    parser.add_argument('--seed', type=int, default=42, help='난수 시드')
+    parser.add_argument('--database-url', help='이미 채워진 DB 사용 (지정하면 데이터를 생성하지 않음)')
+    parser.add_argument('--requests', type=int, default=20, help='엔드포인트당 측정 요청 수')
+    parser.add_argument('--warmup', type=int, default=2, help='엔드포인트당 워밍업 요청 수')
+    parser.add_argument('--gunicorn', action='store_true', help='로컬 gunicorn 부하 측정도 실행')
+    parser.add_argument('--workers', type=int, default=2, help='gunicorn 워커 수')
+    parser.add_argument('--concurrency', type=int, default=8, help='부하 발생기 동시 연결 수')
+    parser.add_argument('--output', help='결과 JSON 파일')
+    parser.add_argument('--baseline', help='비교할 기준선 JSON (회귀 시 종료 코드 1)')
+    parser.add_argument('--write-baseline', help='이번 결과를 기준선 JSON으로 저장')
+    args = parser.parse_args()
+
+    from services.seed_service import seed_counts
+
+    overrides = {table: max(int(count * args.scale), 1) for table, count in DEFAULT_COUNTS.items()}
+    for item in args.count:
+        table, _, value = item.partition('=')
+        overrides[table] = int(value)
+    try:
+        counts = seed_counts(args.scale, overrides)
+    except ValueError as e:
+        parser.error(str(e))
+
+    work_dir = tempfile.mkdtemp()
+    env = dict(os.environ)
+    env['DATABASE_URL'] = args.database_url or f'sqlite:///{os.path.join(work_dir, "bench.db")}'
+    env['LOG_FILE'] = os.path.join(work_dir, 'bench.log')
+    env['LOG_LEVEL'] = 'WARNING'
+    env['FILE_STORE_ROOT'] = os.path.join(work_dir, 'uploads')
+    os.environ.update({key: env[key] for key in ('DATABASE_URL', 'LOG_FILE', 'LOG_LEVEL', 'FILE_STORE_ROOT')})
+
+    from app import app
+    from services.seed_service import DataSeeder
+    from services.view_counter import view_counter
+
+    result = {'created_at': datetime.now().isoformat(timespec='seconds'), 'scale': args.scale, 'counts': counts}
+    try:
+        if not args.database_url:
+            started = time.perf_counter()
+            with app.app_context():
+                DataSeeder(seed=args.seed).run(counts)
+            result['seed_seconds'] = round(time.perf_counter() - started, 1)
+            print(f"데이터 생성: {counts}  {result['seed_seconds']}s")
+        else:
+            result['counts'] = None
+
+        endpoints, skipped = collect_endpoints(app)
+        for path in skipped:
+            print(f'  건너뜀 (샘플 ID 없음): {path}')
+
+        print(f'테스트 클라이언트 ({args.requests}회/엔드포인트)')
+        rss_before = max_rss_mb()
+        result['test_client'] = {
+            'endpoints': run_test_client(app, endpoints, args.requests, args.warmup),
+            'rss_before_mb': round(rss_before, 1),
+            'peak_rss_mb': round(max_rss_mb(), 1),
+        }
+        print(f"최대 RSS: {result['test_client']['peak_rss_mb']}MB")
+
+        if args.gunicorn:
+            print(f'gunicorn (워커 {args.workers}, 동시 연결 {args.concurrency}, {args.requests}회/엔드포인트)')
+            endpoints_result, rss = run_gunicorn(endpoints, env, work_dir, args.requests, args.concurrency, args.workers)
+            result['gunicorn'] = {'endpoints': endpoints_result, 'workers': args.workers,
+                                  'concurrency': args.concurrency, **rss}
+            print(f"최대 RSS: 전체 {rss['total_peak_rss_mb']}MB, 워커 {rss['worker_peak_rss_mb']}MB")
+    finally:
+        # 조회수 버퍼는 atexit에서도 반영되므로 임시 DB를 지우기 전에 멈추고 미리 반영
+        view_counter.stop()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    for path in filter(None, (args.output, args.write_baseline)):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f'결과 저장: {path}')
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare(result, json.load(f))
+        for line in regressions:
+            print(f'회귀: {line}')
+        print('회귀 없음' if not regressions else f'회귀 {len(regressions)}건')
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+조회수 지연 기록 부하 테스트
+
+하나의 인기 게시글에 초당 N회 조회 요청을 보내고, 응답 지연과
+communications 테이블 UPDATE 횟수, 잠금 오류 여부를 측정한다.
+
+    python tools/bench_view_counter.py --rate 1000 --seconds 10
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    index = min(len(values) - 1, int(round(pct / 100.0 * (len(values) - 1))))
+    return values[index]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='조회수 지연 기록 부하 테스트')
+    parser.add_argument('--rate', type=int, default=1000, help='초당 조회 요청 수')
+    parser.add_argument('--seconds', type=float, default=10, help='측정 시간(초)')
+    parser.add_argument('--threads', type=int, default=16, help='동시 요청 스레드 수')
+    parser.add_argument('--flush-interval', type=float, default=1.0, help='조회수 반영 주기(초)')
+    args = parser.parse_args()
+
+    # 별도 SQLite 파일에서 실행 (운영 DB를 건드리지 않음)
+    db_file = os.path.join(tempfile.mkdtemp(), 'bench_views.db')
+    os.environ.setdefault('DATABASE_URL', f'sqlite:///{db_file}')
+    os.environ.setdefault('LOG_FILE', os.path.join(os.path.dirname(db_file), 'bench.log'))
+    os.environ.setdefault('LOG_LEVEL', 'WARNING')
+    os.environ['VIEW_COUNTER_FLUSH_INTERVAL'] = str(args.flush_interval)
+
+    from sqlalchemy import event
+    from app import app
+    from database import db, Communication
+    from services.view_counter import view_counter
+
+    with app.app_context():
+        post = Communication(comm_id=datetime.now().strftime('%Y%m%d%H%M%S%f'), category='안전 Q&A',
+                             title='부하 테스트 게시글', content='내용', views=0)
+        db.session.add(post)
+        db.session.commit()
+        post_id = post.id
+
+        counters = {'updates': 0}
+
+        def count_updates(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith('UPDATE COMMUNICATIONS'):
+                counters['updates'] += 1
+        event.listen(db.engine, 'before_cursor_execute', count_updates)
+
+    client = app.test_client()
+    url = f'/communication/api/posts/{post_id}/view'
+    total = int(args.rate * args.seconds)
+    per_thread = total // args.threads
+    interval = args.threads / float(args.rate)
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+
+    def worker():
+        local = []
+        next_at = time.perf_counter()
+        for _ in range(per_thread):
+            start = time.perf_counter()
+            response = client.post(url)
+            local.append(time.perf_counter() - start)
+            if response.status_code != 200:
+                errors.append(response.status_code)
+            next_at += interval
+            delay = next_at - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        with lock:
+            latencies.extend(local)
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=worker) for _ in range(args.threads)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+    view_counter.stop()
+
+    with app.app_context():
+        final_views = db.session.get(Communication, post_id).views
+
+    sent = per_thread * args.threads
+    print(f'요청 수: {sent}  소요: {elapsed:.2f}s  처리량: {sent / elapsed:.0f} req/s')
+    print(f'지연 p50: {percentile(latencies, 50) * 1000:.2f}ms  '
+          f'p95: {percentile(latencies, 95) * 1000:.2f}ms  p99: {percentile(latencies, 99) * 1000:.2f}ms')
+    print(f'UPDATE 실행 횟수: {counters["updates"]}  (조회 요청 대비 {counters["updates"] / max(sent, 1):.4f})')
+    print(f'오류 응답: {len(errors)}  최종 조회수: {final_views} (기대값 {sent})')
+    return 0 if not errors and final_views == sent else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+정적 자산 빌드
+
+static/js/**와 static/css/style.css를 축소/묶음 처리하고 내용 해시 파일명과
+.gz 압축본, 매니페스트(static/dist/manifest.json)를 만든다. 배포 시 서비스
+재시작 전에 실행한다 (deploy.sh).
+
+    python tools/build_assets.py
+    python tools/build_assets.py --no-minify
+"""
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.assets import build_assets  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description='정적 자산 빌드')
+    parser.add_argument('--static-folder', default=os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'static'), help='static 디렉터리')
+    parser.add_argument('--no-minify', action='store_true', help='축소하지 않고 해시/압축만 수행')
+    args = parser.parse_args()
+
+    manifest = build_assets(args.static_folder, minify=not args.no_minify)
+    print(f'자산 {len(manifest)}개 빌드 완료')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+사고 목록 API 쿼리 수 점검
+
+사고 N건(건당 관련 자료 여러 개)을 만든 뒤 /safety/api/accidents 한 페이지를
+요청하고, 실행된 SQL이 사고 1쿼리 + 관련 자료 1쿼리(총 2개)인지 확인한다.
+
+    python tools/check_accident_queries.py --accidents 200 --documents 3
+"""
+import argparse
+import os
+import sys
+import tempfile
+from datetime import date, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+EXPECTED_QUERIES = 2
+
+
+def main():
+    parser = argparse.ArgumentParser(description='사고 목록 API 쿼리 수 점검')
+    parser.add_argument('--accidents', type=int, default=200, help='생성할 사고 수')
+    parser.add_argument('--documents', type=int, default=3, help='사고당 관련 자료 수')
+    parser.add_argument('--per-page', type=int, default=100, help='요청할 페이지 크기')
+    args = parser.parse_args()
+
+    # 별도 SQLite 파일에서 실행 (운영 DB를 건드리지 않음)
+    db_file = os.path.join(tempfile.mkdtemp(), 'check_accidents.db')
+    os.environ.setdefault('DATABASE_URL', f'sqlite:///{db_file}')
+    os.environ.setdefault('LOG_FILE', os.path.join(os.path.dirname(db_file), 'check.log'))
+    os.environ.setdefault('LOG_LEVEL', 'WARNING')
+
+    from sqlalchemy import event
+    from app import app
+    from database import db, Accident, AccidentDocument
+
+    with app.app_context():
+        today = date.today()
+        for i in range(args.accidents):
+            accident = Accident(accident_id=f'CHECK-{i:06d}', date=today - timedelta(days=i),
+                                location='실험동', description=f'점검용 사고 {i}', severity='경미')
+            accident.documents = [
+                AccidentDocument(title=f'자료 {i}-{j}', url=f'https://example.com/{i}/{j}')
+                for j in range(args.documents)
+            ]
+            db.session.add(accident)
+        db.session.commit()
+
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+        event.listen(db.engine, 'before_cursor_execute', record)
+
+    client = app.test_client()
+    response = client.get(f'/safety/api/accidents?per_page={args.per_page}')
+    data = response.get_json()
+
+    returned = len(data.get('accidents', []))
+    documents = sum(len(a['documents']) for a in data.get('accidents', []))
+    print(f'응답: {response.status_code}  사고 {returned}건  관련 자료 {documents}건  다음 페이지: {data.get("has_next")}')
+    print(f'실행된 쿼리 수: {len(statements)} (기대값 {EXPECTED_QUERIES})')
+    for statement in statements:
+        print('  ' + ' '.join(statement.split())[:120])
+
+    ok = (response.status_code == 200 and len(statements) == EXPECTED_QUERIES
+          and documents == returned * args.documents)
+    print('통과' if ok else '실패')
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
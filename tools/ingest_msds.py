@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+MSDS PDF 일괄 등록
+
+디렉터리의 PDF를 내용 해시 기반 MSDS 저장소에 넣고 화학물질에 연결한다.
+파일명(또는 매핑 CSV의 key 열)에 CAS 번호가 있으면 그 CAS의 모든 화학물질에,
+없으면 파일명과 같은 chem_id의 화학물질에 연결한다. 같은 PDF는 한 번만 저장된다.
+
+    python tools/ingest_msds.py /data/msds
+    python tools/ingest_msds.py /data/msds --mapping msds_mapping.csv   # 열: file,key
+"""
+import argparse
+import csv
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='MSDS PDF 일괄 등록')
+    parser.add_argument('directory', help='PDF 파일이 있는 디렉터리 (하위 디렉터리 포함)')
+    parser.add_argument('--mapping', help='file,key 열을 가진 CSV (파일명 대신 사용할 CAS 번호 또는 chem_id)')
+    args = parser.parse_args()
+
+    paths = sorted(
+        os.path.join(root, name)
+        for root, _, files in os.walk(args.directory)
+        for name in files if name.lower().endswith('.pdf')
+    )
+    keys = {}
+    if args.mapping:
+        with open(args.mapping, 'r', encoding='utf-8-sig') as f:
+            for row in csv.DictReader(f):
+                keys[os.path.join(args.directory, row['file'])] = row['key']
+        paths = [path for path in paths if path in keys]
+
+    from app import app
+    from services.chemical_service import ChemicalService
+
+    with app.app_context():
+        result = ChemicalService.ingest_msds_files(paths, keys)
+    print(f"파일 {result['files']}개 (새로 저장 {result['stored']}개), 연결된 화학물질 {result['chemicals']}건")
+    for path in result['unmatched']:
+        print(f'  연결 대상 없음: {path}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+주기 작업 워커
+
+jobs 테이블을 폴링하며 실행할 차례인 작업을 임대를 얻어 실행한다. 여러 호스트에서
+동시에 띄워도 같은 작업은 한 번만 실행된다. 종료는 SIGTERM/SIGINT.
+
+    python tools/job_worker.py            # 계속 실행 (systemd 서비스)
+    python tools/job_worker.py --once     # 실행할 차례인 작업만 처리하고 종료 (cron)
+    python tools/job_worker.py --list     # 작업 스케줄과 최근 실행 결과 출력
+"""
+import argparse
+import os
+import signal
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='주기 작업 워커')
+    parser.add_argument('--once', action='store_true', help='실행할 차례인 작업만 처리하고 종료')
+    parser.add_argument('--list', action='store_true', help='작업 스케줄 출력')
+    args = parser.parse_args()
+
+    from app import app
+    from database import Job
+    from services.job_service import job_runner, job_to_dict
+
+    if args.list:
+        with app.app_context():
+            for job in Job.query.order_by(Job.name).all():
+                info = job_to_dict(job)
+                print(f"{info['name']:<32} 다음 실행 {info['next_run_at']}  최근 {info['last_status'] or '-'} "
+                      f"({info['last_duration_ms'] or 0}ms)  실행 {info['run_count']}회  연속 실패 {info['attempts']}회")
+        return 0
+
+    if args.once:
+        with app.app_context():
+            for name, status in job_runner.run_pending():
+                print(f'{name}: {status}')
+        return 0
+
+    def handle_signal(signum, frame):
+        job_runner.stop()
+
+    signal.signal(signal.SIGTERM, handle_signal)
+    signal.signal(signal.SIGINT, handle_signal)
+    job_runner.run_forever()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
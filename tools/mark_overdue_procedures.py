@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+검토일이 지난 작업절차서를 '검토필요' 상태로 일괄 변경
+
+평소에는 주기 작업 procedures.mark_overdue(tools/job_worker.py)가 매일 실행한다.
+이 스크립트는 즉시 한 번 실행할 때 사용한다.
+
+    python tools/mark_overdue_procedures.py
+"""
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def main():
+    from app import app
+    from services.procedure_service import ProcedureService
+
+    with app.app_context():
+        count = ProcedureService.mark_overdue()
+    print(f'검토필요로 변경된 절차서: {count}건')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,348 @@
+"""
+정적 자산 빌드와 내용 해시 URL
+
+빌드(tools/build_assets.py)는 static/js/**와 static/css/style.css를 축소하고
+BUNDLES에 정의한 묶음을 이어 붙인 뒤, 내용 해시가 들어간 이름으로
+static/dist/ 아래에 쓴다. 각 파일의 .gz(와 brotli가 설치되어 있으면 .br)
+압축본도 함께 만들고, 마지막에 논리 이름 -> 해시 경로 매니페스트를 쓴다.
+
+템플릿에서는 논리 이름으로 참조한다:
+    <script src="{{ asset_url('js/main.js') }}"></script>
+    {% for url in asset_urls('js/equipment-list.js') %}<script src="{{ url }}"></script>{% endfor %}
+
+매니페스트가 없거나(개발 환경) 디버그 모드이면 원본 파일 URL을 돌려준다.
+해시 URL은 내용이 바뀌면 URL도 바뀌므로 1년 immutable 캐시를 걸 수 있다.
+"""
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+from typing import Dict, List, Optional
+
+from flask import url_for
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성
+    brotli = None
+
+DIST_DIR = 'dist'
+MANIFEST_NAME = 'manifest.json'
+
+# 여러 파일을 순서대로 이어 붙이는 묶음 (논리 이름: 원본 목록). 개별 파일도 그대로 빌드된다
+BUNDLES: Dict[str, List[str]] = {
+    'js/equipment-list.js': ['js/common/modal.js', 'js/common/api.js', 'js/equipment/equipment-manager.js'],
+}
+
+# 빌드 대상 (static 기준 경로)
+SOURCE_GLOBS = ('js', 'css/style.css')
+
+COMPRESSIBLE = ('.js', '.css')
+
+
+def _is_ident(ch: str) -> bool:
+    return ch.isalnum() or ch in '_$\\' or ord(ch) > 127
+
+
+# 뒤에 오는 '/'가 나눗셈이 아니라 정규식 리터럴의 시작이 되는 키워드
+_REGEX_KEYWORDS = {
+    'return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete', 'void', 'throw', 'case', 'do', 'else',
+    'yield', 'await',
+}
+
+
+def minify_js(source: str) -> str:
+    """
+    보수적인 JS 축소: 주석과 들여쓰기/빈 줄을 지우고 연속 공백을 줄인다.
+
+    줄바꿈은 지우지 않으므로 자동 세미콜론 삽입(ASI) 동작이 바뀌지 않는다.
+    문자열, 템플릿 리터럴(${} 중첩 포함), 정규식 리터럴은 그대로 둔다.
+    """
+    out: List[str] = []
+    pending = ''    # 보류 중인 공백 ('', ' ', '\n')
+    prev = ''       # 마지막으로 출력한 문자
+    word = ''       # 마지막으로 출력한 식별자
+    braces: List[str] = []  # '{' 또는 템플릿 리터럴의 '${' 중첩
+    i, n = 0, len(source)
+
+    def flush_space(first: str) -> None:
+        nonlocal pending
+        if pending == '\n' and prev:
+            out.append('\n')
+        elif pending and prev and (
+            (_is_ident(prev) and _is_ident(first))
+            or (prev in '+-/' and first in '+-/*')
+            or (prev.isdigit() and first == '.')
+        ):
+            out.append(' ')
+        pending = ''
+
+    def copy_template(start: int) -> int:
+        """템플릿 리터럴 본문을 닫는 ` 또는 ${ 까지 복사하고 다음 위치 반환"""
+        nonlocal prev
+        j = start
+        while j < n:
+            ch = source[j]
+            if ch == '\\':
+                j += 2
+                continue
+            if ch == '`':
+                out.append(source[start:j + 1])
+                prev = '`'
+                return j + 1
+            if ch == '$' and source.startswith('${', j):
+                out.append(source[start:j + 2])
+                braces.append('${')
+                prev = '{'
+                return j + 2
+            j += 1
+        out.append(source[start:])
+        return n
+
+    while i < n:
+        ch = source[i]
+
+        if ch in ' \t\r\n\f\v':
+            if ch == '\n':
+                pending = '\n'
+            elif not pending:
+                pending = ' '
+            i += 1
+            continue
+
+        if ch == '/' and source.startswith('//', i):
+            end = source.find('\n', i)
+            i = n if end == -1 else end
+            continue
+
+        if ch == '/' and source.startswith('/*', i):
+            end = source.find('*/', i + 2)
+            end = n if end == -1 else end + 2
+            if '\n' in source[i:end]:
+                pending = '\n'
+            elif not pending:
+                pending = ' '
+            i = end
+            continue
+
+        flush_space(ch)
+
+        if ch in '\'"':
+            j = i + 1
+            while j < n and source[j] != ch and source[j] != '\n':
+                j += 2 if source[j] == '\\' else 1
+            out.append(source[i:j + 1])
+            prev, word = ch, ''
+            i = j + 1
+            continue
+
+        if ch == '`':
+            out.append('`')
+            i = copy_template(i + 1)
+            word = ''
+            continue
+
+        if ch == '}' and braces:
+            if braces.pop() == '${':
+                out.append('}')
+                i = copy_template(i + 1)
+                word = ''
+                continue
+
+        if ch == '{':
+            braces.append('{')
+
+        if ch == '/' and (not prev or prev in '(,=:[!&|?{};+-*%<>~^' or (_is_ident(prev) and word in _REGEX_KEYWORDS)):
+            j = i + 1
+            in_class = False
+            while j < n and source[j] != '\n':
+                c = source[j]
+                if c == '\\':
+                    j += 2
+                    continue
+                if c == '[':
+                    in_class = True
+                elif c == ']':
+                    in_class = False
+                elif c == '/' and not in_class:
+                    break
+                j += 1
+            out.append(source[i:j + 1])
+            prev, word = '/', ''
+            i = j + 1
+            continue
+
+        if _is_ident(ch):
+            j = i
+            while j < n and _is_ident(source[j]):
+                j += 1
+            word = source[i:j]
+            out.append(word)
+            prev = source[j - 1]
+            i = j
+            continue
+
+        out.append(ch)
+        prev, word = ch, ''
+        i += 1
+
+    return ''.join(out).strip() + '\n'
+
+
+def minify_css(source: str) -> str:
+    """CSS 축소: 주석 제거, 공백 축약, 구두점 주변 공백과 블록 끝 세미콜론 제거"""
+    out: List[str] = []
+    pending = False
+    prev = ''
+    i, n = 0, len(source)
+    while i < n:
+        ch = source[i]
+        if ch in ' \t\r\n\f':
+            pending = True
+            i += 1
+            continue
+        if source.startswith('/*', i):
+            end = source.find('*/', i + 2)
+            i = n if end == -1 else end + 2
+            pending = True
+            continue
+        # 선택자의 ' :hover'(자손)와 ':hover'는 다르므로 ':' 앞 공백은 유지
+        if pending and prev and prev not in '{};,>:(' and ch not in '{};,>)':
+            out.append(' ')
+        pending = False
+        if ch in '\'"':
+            j = i + 1
+            while j < n and source[j] != ch:
+                j += 2 if source[j] == '\\' else 1
+            out.append(source[i:j + 1])
+            prev = ch
+            i = j + 1
+            continue
+        if ch == '}' and out and out[-1] == ';':
+            out.pop()
+        out.append(ch)
+        prev = ch
+        i += 1
+    return ''.join(out).strip() + '\n'
+
+
+def _sources(static_folder: str) -> List[str]:
+    names = []
+    for pattern in SOURCE_GLOBS:
+        path = os.path.join(static_folder, pattern)
+        if os.path.isfile(path):
+            names.append(pattern)
+            continue
+        for root, _, files in os.walk(path):
+            for filename in files:
+                if filename.endswith(COMPRESSIBLE):
+                    names.append(os.path.relpath(os.path.join(root, filename), static_folder).replace(os.sep, '/'))
+    return sorted(names)
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(data)
+    os.chmod(tmp, 0o644)
+    os.replace(tmp, path)
+
+
+def _hashed_name(logical: str, data: bytes) -> str:
+    stem, ext = os.path.splitext(logical)
+    return f'{DIST_DIR}/{stem}.{hashlib.sha256(data).hexdigest()[:12]}{ext}'
+
+
+def build_assets(static_folder: str, minify: bool = True, echo=print) -> Dict[str, str]:
+    """축소/묶음/해시/압축본 생성 후 매니페스트 반환. 이전 빌드의 파일은 한 세대 유지"""
+    dist_root = os.path.join(static_folder, DIST_DIR)
+    manifest_path = os.path.join(dist_root, MANIFEST_NAME)
+    previous = load_manifest(manifest_path) or {}
+
+    texts: Dict[str, str] = {}
+    for name in _sources(static_folder):
+        with open(os.path.join(static_folder, name), encoding='utf-8') as f:
+            source = f.read()
+        if minify:
+            source = minify_css(source) if name.endswith('.css') else minify_js(source)
+        texts[name] = source
+    for bundle, members in BUNDLES.items():
+        # 각 파일이 세미콜론 없이 끝나도 이어 붙였을 때 문장이 합쳐지지 않도록 ';' 추가
+        texts[bundle] = ''.join(texts[member].rstrip() + '\n;\n' for member in members)
+
+    manifest: Dict[str, str] = {}
+    for name, text in texts.items():
+        data = text.encode('utf-8')
+        hashed = _hashed_name(name, data)
+        manifest[name] = hashed
+        target = os.path.join(static_folder, hashed)
+        if not os.path.exists(target):
+            _write_atomic(target, data)
+            _write_atomic(target + '.gz', gzip.compress(data, compresslevel=9, mtime=0))
+            if brotli is not None:
+                _write_atomic(target + '.br', brotli.compress(data, quality=11))
+        source_size = sum(os.path.getsize(os.path.join(static_folder, m)) for m in BUNDLES.get(name, [name]))
+        echo(f'{name} -> {hashed}  {source_size:,} -> {len(data):,} bytes (gzip {os.path.getsize(target + ".gz"):,})')
+
+    _write_atomic(manifest_path, json.dumps(manifest, indent=2, sort_keys=True).encode('utf-8'))
+
+    # 배포 중 이전 페이지가 참조할 수 있으므로 직전 빌드 파일은 남기고 그보다 오래된 것만 삭제
+    keep = set(manifest.values()) | set(previous.values())
+    removed = 0
+    for root, _, files in os.walk(dist_root):
+        for filename in files:
+            path = os.path.join(root, filename)
+            relative = os.path.relpath(path, static_folder).replace(os.sep, '/')
+            base = relative[:-3] if relative.endswith(('.gz', '.br')) else relative
+            if filename != MANIFEST_NAME and base not in keep:
+                os.remove(path)
+                removed += 1
+    if removed:
+        echo(f'이전 빌드 파일 {removed}개 삭제')
+    return manifest
+
+
+def load_manifest(path: str) -> Optional[Dict[str, str]]:
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+class AssetManifest:
+    """논리 자산 이름을 해시 URL로 바꾸는 템플릿 도우미"""
+
+    def __init__(self, app=None):
+        self.app = None
+        self.manifest: Dict[str, str] = {}
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app) -> None:
+        self.app = app
+        app.extensions['assets'] = self
+        self.manifest = load_manifest(os.path.join(app.static_folder, DIST_DIR, MANIFEST_NAME)) or {}
+        if self.manifest:
+            app.logger.info(f'자산 매니페스트를 불러왔습니다: {len(self.manifest)}개')
+        app.jinja_env.globals['asset_url'] = self.url
+        app.jinja_env.globals['asset_urls'] = self.urls
+
+    def _use_manifest(self) -> bool:
+        return bool(self.manifest) and self.app.config.get('ASSETS_USE_MANIFEST', True) and not self.app.debug
+
+    def url(self, name: str) -> str:
+        if self._use_manifest() and name in self.manifest:
+            return url_for('static', filename=self.manifest[name])
+        return url_for('static', filename=name)
+
+    def urls(self, name: str) -> List[str]:
+        """묶음이면 빌드 전(개발 환경)에는 원본 파일 URL 목록, 빌드 후에는 묶음 URL 하나"""
+        if self._use_manifest() and name in self.manifest:
+            return [url_for('static', filename=self.manifest[name])]
+        return [url_for('static', filename=member) for member in BUNDLES.get(name, [name])]
+
+
+assets = AssetManifest()
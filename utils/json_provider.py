@@ -0,0 +1,43 @@
+"""
+빠른 JSON 프로바이더
+
+orjson이 설치되어 있으면 직렬화/역직렬화에 사용하고, 없으면 표준 json을
+키 정렬과 ASCII 이스케이프 없이 사용한다. 날짜, UUID, dataclass, Markup 등
+기본 프로바이더가 처리하는 타입은 같은 규칙(Flask 기본 default 함수)으로 변환한다.
+"""
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+if orjson is not None:
+    # datetime/date는 Flask 기본 프로바이더와 같은 형식이 되도록 default 함수에 맡김
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_SUBCLASS
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """orjson 기반 JSON 프로바이더 (없으면 표준 json)"""
+
+    ensure_ascii = False
+    sort_keys = False
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if orjson is not None and not kwargs:
+            return orjson.dumps(obj, default=self.default, option=_ORJSON_OPTIONS).decode('utf-8')
+        return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs: Any) -> Any:
+        if orjson is not None and not kwargs:
+            return orjson.loads(s)
+        return super().loads(s, **kwargs)
+
+    def response(self, *args: Any, **kwargs: Any):
+        if orjson is None or self.compact is False or (self.compact is None and self._app.debug):
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=_ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
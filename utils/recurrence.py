@@ -0,0 +1,152 @@
+"""
+반복 규칙(RFC 5545 RRULE의 일부) 파싱과 날짜 전개
+
+지원 범위:
+    FREQ=DAILY|WEEKLY|MONTHLY, INTERVAL=n, COUNT=n, UNTIL=YYYYMMDD,
+    BYDAY=MO,TU,...(WEEKLY), BYMONTHDAY=1..31(MONTHLY)
+
+예) 매주 화요일 15회: FREQ=WEEKLY;BYDAY=TU;COUNT=15
+    격주 월/수, 학기 말까지: FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,WE;UNTIL=20251219
+"""
+import calendar
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Iterator, Optional, Tuple
+
+WEEKDAYS = ('MO', 'TU', 'WE', 'TH', 'FR', 'SA', 'SU')
+FREQUENCIES = ('DAILY', 'WEEKLY', 'MONTHLY')
+
+
+@dataclass(frozen=True)
+class RecurrenceRule:
+    freq: str
+    interval: int = 1
+    count: Optional[int] = None
+    until: Optional[date] = None
+    by_day: Tuple[int, ...] = ()        # 0=월요일
+    by_month_day: Tuple[int, ...] = ()
+
+    def to_string(self) -> str:
+        parts = [f'FREQ={self.freq}']
+        if self.interval != 1:
+            parts.append(f'INTERVAL={self.interval}')
+        if self.by_day:
+            parts.append('BYDAY=' + ','.join(WEEKDAYS[d] for d in self.by_day))
+        if self.by_month_day:
+            parts.append('BYMONTHDAY=' + ','.join(str(d) for d in self.by_month_day))
+        if self.count is not None:
+            parts.append(f'COUNT={self.count}')
+        if self.until is not None:
+            parts.append(f"UNTIL={self.until.strftime('%Y%m%d')}")
+        return ';'.join(parts)
+
+
+def _parse_until(value: str) -> date:
+    value = value.split('T')[0]
+    for fmt in ('%Y%m%d', '%Y-%m-%d'):
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    raise ValueError(f'UNTIL 형식이 올바르지 않습니다: {value}')
+
+
+def _parse_int_list(name: str, value: str, low: int, high: int) -> Tuple[int, ...]:
+    try:
+        numbers = tuple(sorted({int(item) for item in value.split(',')}))
+    except ValueError:
+        raise ValueError(f'{name} 형식이 올바르지 않습니다: {value}')
+    if not numbers or numbers[0] < low or numbers[-1] > high:
+        raise ValueError(f'{name} 범위가 올바르지 않습니다: {value}')
+    return numbers
+
+
+def parse_rrule(text: str) -> RecurrenceRule:
+    """RRULE 문자열을 파싱. 지원하지 않는 항목이 있으면 ValueError"""
+    if not text:
+        raise ValueError('반복 규칙이 비어 있습니다.')
+    text = text.strip()
+    if text.upper().startswith('RRULE:'):
+        text = text[6:]
+    fields = {}
+    for part in text.split(';'):
+        if not part:
+            continue
+        key, sep, value = part.partition('=')
+        if not sep or not value:
+            raise ValueError(f'반복 규칙 형식이 올바르지 않습니다: {part}')
+        fields[key.strip().upper()] = value.strip().upper()
+
+    freq = fields.pop('FREQ', None)
+    if freq not in FREQUENCIES:
+        raise ValueError(f'지원하지 않는 반복 주기입니다: {freq}')
+    interval = _parse_int_list('INTERVAL', fields.pop('INTERVAL', '1'), 1, 52)[0]
+    count = _parse_int_list('COUNT', fields.pop('COUNT'), 1, 10000)[0] if 'COUNT' in fields else None
+    until = _parse_until(fields.pop('UNTIL')) if 'UNTIL' in fields else None
+    if count is not None and until is not None:
+        raise ValueError('COUNT와 UNTIL은 함께 쓸 수 없습니다.')
+
+    by_day: Tuple[int, ...] = ()
+    if 'BYDAY' in fields:
+        if freq != 'WEEKLY':
+            raise ValueError('BYDAY는 FREQ=WEEKLY에서만 지원합니다.')
+        try:
+            by_day = tuple(sorted({WEEKDAYS.index(day) for day in fields.pop('BYDAY').split(',')}))
+        except ValueError:
+            raise ValueError('BYDAY 형식이 올바르지 않습니다.')
+    by_month_day: Tuple[int, ...] = ()
+    if 'BYMONTHDAY' in fields:
+        if freq != 'MONTHLY':
+            raise ValueError('BYMONTHDAY는 FREQ=MONTHLY에서만 지원합니다.')
+        by_month_day = _parse_int_list('BYMONTHDAY', fields.pop('BYMONTHDAY'), 1, 31)
+    if fields:
+        raise ValueError(f"지원하지 않는 반복 규칙 항목입니다: {', '.join(sorted(fields))}")
+    return RecurrenceRule(freq, interval, count, until, by_day, by_month_day)
+
+
+def iter_occurrences(rule: RecurrenceRule, dtstart: date, end: date) -> Iterator[date]:
+    """dtstart부터 end(포함)까지 규칙에 맞는 날짜를 순서대로 생성. COUNT는 dtstart부터 센다"""
+    if rule.until is not None:
+        end = min(end, rule.until)
+    emitted = 0
+    for day in _iter_candidates(rule, dtstart, end):
+        if day > end:
+            return
+        yield day
+        emitted += 1
+        if rule.count is not None and emitted >= rule.count:
+            return
+
+
+def _iter_candidates(rule: RecurrenceRule, dtstart: date, end: date) -> Iterator[date]:
+    if rule.freq == 'DAILY':
+        day = dtstart
+        step = timedelta(days=rule.interval)
+        while day <= end:
+            yield day
+            day += step
+
+    elif rule.freq == 'WEEKLY':
+        weekdays = rule.by_day or (dtstart.weekday(),)
+        week_start = dtstart - timedelta(days=dtstart.weekday())
+        step = timedelta(weeks=rule.interval)
+        while week_start <= end:
+            for weekday in weekdays:
+                day = week_start + timedelta(days=weekday)
+                if day >= dtstart:
+                    yield day
+            week_start += step
+
+    else:  # MONTHLY
+        month_days = rule.by_month_day or (dtstart.day,)
+        year, month = dtstart.year, dtstart.month
+        while date(year, month, 1) <= end:
+            last_day = calendar.monthrange(year, month)[1]
+            for month_day in month_days:
+                # 31일 같은 날짜가 없는 달은 건너뛴다 (RFC 5545와 동일)
+                if month_day <= last_day:
+                    day = date(year, month, month_day)
+                    if day >= dtstart:
+                        yield day
+            month += rule.interval
+            year, month = year + (month - 1) // 12, (month - 1) % 12 + 1
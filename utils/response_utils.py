@@ -1,8 +1,18 @@
 """
 API 응답 관련 공통 유틸리티 함수들
 """
-from flask import jsonify
-from typing import Any, Dict, Optional
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from flask import current_app, jsonify, request, stream_with_context
+
+# 스트리밍 응답에서 DB에서 한 번에 가져오고(yield_per) 한 번에 인코딩하는 행 수
+STREAM_BATCH_SIZE = 500
+
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+# 봉투(envelope)를 직렬화한 뒤 목록 자리를 찾아 나누기 위한 표식
+_STREAM_PLACEHOLDER = '\x00stream\x00'
 
 
 def success_response(data: Any = None, message: str = "성공") -> Dict:
@@ -39,4 +49,57 @@ def validate_required_fields(data: Dict, required_fields: list) -> Optional[str]
     for field in required_fields:
         if not data.get(field):
             return f"{field}는 필수 입력 항목입니다."
-    return None 
\ No newline at end of file
+    return None 
+
+
+def wants_ndjson() -> bool:
+    """?format=ndjson 또는 Accept 헤더로 NDJSON을 요청했는지 여부"""
+    if request.args.get('format') == 'ndjson':
+        return True
+    return request.accept_mimetypes.best_match(['application/json', NDJSON_MIMETYPE]) == NDJSON_MIMETYPE
+
+
+def _batches(items: Iterator[Any], first: List[Any]) -> Iterator[List[Any]]:
+    if first:
+        yield first
+    while True:
+        batch = list(islice(items, STREAM_BATCH_SIZE))
+        if not batch:
+            return
+        yield batch
+
+
+def json_stream_response(items: Iterable[Dict], key: Optional[str] = None, message: str = "성공"):
+    """
+    목록을 한 번에 만들지 않고 STREAM_BATCH_SIZE개씩 인코딩해 내보내는 JSON 성공 응답
+
+    items는 직렬화된 dict를 하나씩 내는 이터러블(보통 query.yield_per 위의 제너레이터)이고,
+    응답 모양은 json_success_response({key: [...]}, message)와 같다 (key가 없으면 data가 목록).
+    NDJSON을 요청하면(wants_ndjson) 봉투 없이 한 줄에 한 행씩 내보낸다.
+
+    첫 묶음은 반환 전에 읽으므로 쿼리 오류는 호출한 라우트의 except에서 처리된다.
+    전송이 시작된 뒤의 오류는 응답이 중간에 끊긴다.
+    """
+    dumps = current_app.json.dumps
+    items = iter(items)
+    first = list(islice(items, STREAM_BATCH_SIZE))
+
+    if wants_ndjson():
+        def generate_ndjson():
+            for batch in _batches(items, first):
+                yield ''.join(dumps(item) + '\n' for item in batch)
+        return current_app.response_class(stream_with_context(generate_ndjson()), mimetype=NDJSON_MIMETYPE)
+
+    envelope = success_response({key: _STREAM_PLACEHOLDER} if key else _STREAM_PLACEHOLDER, message)
+    head, tail = dumps(envelope).split(dumps(_STREAM_PLACEHOLDER), 1)
+
+    def generate():
+        yield head + '['
+        separator = ''
+        for batch in _batches(items, first):
+            # '[a, b]'에서 대괄호를 떼어 이어 붙임
+            yield separator + dumps(batch)[1:-1]
+            separator = ','
+        yield ']' + tail
+
+    return current_app.response_class(stream_with_context(generate()), mimetype=current_app.json.mimetype)
@@ -0,0 +1,188 @@
+"""
+Flask 앞단의 정적 파일 WSGI 처리기
+
+/static/ 요청을 Flask 라우팅/before_request/after_request(요청 로그 두 줄, 보안 헤더
+체인) 없이 바로 응답한다. 작은 파일은 내용과 압축본을 메모리에 두고, 큰 파일은
+wsgi.file_wrapper(gunicorn은 sendfile)로 보낸다.
+
+- tools/build_assets.py가 만든 .br/.gz 압축본이 있으면 Accept-Encoding에 맞춰 사용
+- 강한 ETag(내용 해시)와 If-None-Match -> 304
+- static/dist/(내용 해시 파일명)는 1년 immutable, 그 외 경로는 no-cache(재검증)
+- 파일이 없거나 GET/HEAD가 아니면 Flask로 넘긴다
+"""
+import gzip
+import hashlib
+import mimetypes
+import os
+import stat as stat_module
+import threading
+from typing import Dict, Iterable, Optional
+
+from werkzeug.http import http_date, parse_etags
+from werkzeug.security import safe_join
+
+IMMUTABLE = 'public, max-age=31536000, immutable'
+REVALIDATE = 'no-cache'
+
+# 압축본 확장자 (선호 순서)
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+# 빌드된 압축본이 없을 때 메모리에서 gzip으로 압축할 형식
+COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/json', 'image/svg+xml')
+
+
+def _content_type(path: str) -> str:
+    """확장자로 Content-Type 결정. 압축본(.gz/.br)을 직접 요청하면 원본 형식이 아닌 압축 파일로 보낸다"""
+    content_type, encoding = mimetypes.guess_type(path)
+    if encoding:
+        return 'application/gzip' if encoding == 'gzip' else 'application/octet-stream'
+    content_type = content_type or 'application/octet-stream'
+    if content_type.startswith('text/') or content_type in ('application/javascript', 'application/json'):
+        content_type += '; charset=utf-8'
+    return content_type
+
+
+class _Entry:
+    """메모리에 올린 파일 한 개 (원본과 압축본)"""
+
+    __slots__ = ('mtime', 'size', 'etag', 'last_modified', 'content_type', 'bodies')
+
+    def __init__(self, path: str, mtime: float, size: int):
+        self.mtime = mtime
+        self.size = size
+        with open(path, 'rb') as f:
+            data = f.read()
+        self.etag = '"%s"' % hashlib.sha256(data).hexdigest()[:20]
+        self.last_modified = http_date(mtime)
+        content_type = _content_type(path)
+        self.content_type = content_type
+        self.bodies: Dict[Optional[str], bytes] = {None: data}
+        for encoding, suffix in ENCODINGS:
+            if os.path.isfile(path + suffix):
+                with open(path + suffix, 'rb') as f:
+                    self.bodies[encoding] = f.read()
+        if 'gzip' not in self.bodies and len(data) > 1024 and content_type.startswith(COMPRESSIBLE_TYPES):
+            self.bodies['gzip'] = gzip.compress(data, compresslevel=6, mtime=0)
+
+
+class StaticFilesMiddleware:
+    """url_prefix 아래 요청을 directory의 파일로 직접 응답"""
+
+    def __init__(self, app, url_prefix: str, directory: str, max_memory_size: int = 512 * 1024,
+                 immutable_prefixes: Iterable[str] = ('dist/',)):
+        self.app = app
+        self.url_prefix = url_prefix.rstrip('/') + '/'
+        self.directory = directory
+        self.max_memory_size = max_memory_size
+        self.immutable_prefixes = tuple(immutable_prefixes)
+        self._entries: Dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, environ, start_response):
+        path = environ.get('PATH_INFO', '')
+        if not path.startswith(self.url_prefix) or environ['REQUEST_METHOD'] not in ('GET', 'HEAD'):
+            return self.app(environ, start_response)
+        relative = path[len(self.url_prefix):]
+        filename = safe_join(self.directory, relative) if relative else None
+        try:
+            stat = os.stat(filename) if filename else None
+        except OSError:
+            stat = None
+        if stat is None or not stat_module.S_ISREG(stat.st_mode):
+            return self.app(environ, start_response)
+
+        cache_control = IMMUTABLE if relative.startswith(self.immutable_prefixes) else REVALIDATE
+        if stat.st_size > self.max_memory_size:
+            return self._send_file(environ, start_response, filename, stat, cache_control)
+
+        entry = self._entry(filename, stat)
+        headers = [
+            ('Content-Type', entry.content_type),
+            ('Cache-Control', cache_control),
+            ('ETag', entry.etag),
+            ('Last-Modified', entry.last_modified),
+            ('X-Content-Type-Options', 'nosniff'),
+        ]
+        if len(entry.bodies) > 1:
+            headers.append(('Vary', 'Accept-Encoding'))
+        if self._not_modified(environ, entry.etag):
+            start_response('304 Not Modified', headers)
+            return []
+
+        encoding = self._choose_encoding(environ.get('HTTP_ACCEPT_ENCODING', ''), entry.bodies)
+        body = entry.bodies[encoding]
+        if encoding:
+            headers.append(('Content-Encoding', encoding))
+        headers.append(('Content-Length', str(len(body))))
+        start_response('200 OK', headers)
+        return [] if environ['REQUEST_METHOD'] == 'HEAD' else [body]
+
+    def _entry(self, filename: str, stat: os.stat_result) -> _Entry:
+        entry = self._entries.get(filename)
+        if entry is None or entry.mtime != stat.st_mtime or entry.size != stat.st_size:
+            entry = _Entry(filename, stat.st_mtime, stat.st_size)
+            with self._lock:
+                self._entries[filename] = entry
+        return entry
+
+    @staticmethod
+    def _not_modified(environ, etag: str) -> bool:
+        if_none_match = environ.get('HTTP_IF_NONE_MATCH')
+        return bool(if_none_match) and parse_etags(if_none_match).contains_weak(etag.strip('"'))
+
+    @staticmethod
+    def _choose_encoding(accept_encoding: str, bodies: Dict[Optional[str], bytes]) -> Optional[str]:
+        accepted = _parse_accept_encoding(accept_encoding)
+        for encoding, _ in ENCODINGS:
+            if encoding in bodies and accepted.get(encoding, accepted.get('*', 0)) > 0:
+                return encoding
+        return None
+
+    def _send_file(self, environ, start_response, filename: str, stat: os.stat_result, cache_control: str):
+        """큰 파일: 메모리에 올리지 않고 file_wrapper(sendfile)로 전송"""
+        etag = '"%x-%x"' % (int(stat.st_mtime), stat.st_size)
+        headers = [
+            ('Content-Type', _content_type(filename)),
+            ('Cache-Control', cache_control),
+            ('ETag', etag),
+            ('Last-Modified', http_date(stat.st_mtime)),
+            ('X-Content-Type-Options', 'nosniff'),
+        ]
+        if self._not_modified(environ, etag):
+            start_response('304 Not Modified', headers)
+            return []
+        headers.append(('Content-Length', str(stat.st_size)))
+        start_response('200 OK', headers)
+        if environ['REQUEST_METHOD'] == 'HEAD':
+            return []
+        f = open(filename, 'rb')
+        file_wrapper = environ.get('wsgi.file_wrapper')
+        if file_wrapper is not None:
+            return file_wrapper(f, 64 * 1024)
+        return _iter_file(f)
+
+
+def _iter_file(f, chunk_size: int = 64 * 1024):
+    with f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def _parse_accept_encoding(header: str) -> Dict[str, float]:
+    accepted: Dict[str, float] = {}
+    for item in header.split(','):
+        name, _, params = item.strip().partition(';')
+        if not name:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+    return accepted